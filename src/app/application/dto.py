@@ -6,7 +6,7 @@ from typing import Any
 
 import numpy as np
 
-from app.domain.models import AppSettings, SweepResult
+from app.domain.models import AppSettings, SweepPoint, SweepResult
 
 
 @dataclass(slots=True)
@@ -14,6 +14,8 @@ class StartSweepCommand:
     settings: AppSettings
     calibration_enabled: bool = False
     reference_interpolator: Any | None = None
+    checkpoint: Any | None = None
+    resume_points: list[SweepPoint] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from app.domain.enums import VerifyPolicy
+from app.infrastructure.instruments.ports import AwgPort
+
+
+class AwgRetuner:
+    def __init__(
+        self,
+        awg: AwgPort,
+        channel: int,
+        *,
+        pipelined: bool,
+        policy: VerifyPolicy = VerifyPolicy.ALWAYS,
+        every: int = 1,
+    ) -> None:
+        self._awg = awg
+        self._channel = channel
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="awg") if pipelined else None
+        self._pending: tuple[float, bool, Future] | None = None
+        self._policy = VerifyPolicy(policy)
+        self._every = max(1, int(every))
+        self._tunes = 0
+        self._boundary = True
+        self._amplitude_vpp: float | None = None
+        self.hits = 0
+        self.misses = 0
+        self.verified = 0
+        self.skipped = 0
+
+    def mark_boundary(self) -> None:
+        self._boundary = True
+
+    def tune(self, freq_hz: float) -> tuple[float, float, bool]:
+        if self._pending is not None:
+            pending_hz, verify, future = self._pending
+            self._pending = None
+            tuned = future.result()
+            if pending_hz == freq_hz:
+                self.hits += 1
+                return tuned
+            self.misses += 1
+            # The prefetch already took this point's verify decision; deciding again would skew EVERY_N.
+            return self._tune(freq_hz, verify)
+        return self._tune(freq_hz, self._should_verify())
+
+    def prefetch(self, freq_hz: float | None) -> None:
+        # Only call once the scope has finished acquiring: the AWG moves on while the waveform uploads.
+        if self._executor is None or freq_hz is None or self._pending is not None:
+            return
+        verify = self._should_verify()
+        self._pending = (float(freq_hz), verify, self._executor.submit(self._tune, float(freq_hz), verify))
+
+    def close(self) -> None:
+        if self._pending is not None:
+            self._pending[2].cancel()
+            self._pending = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def _should_verify(self) -> bool:
+        first = self._boundary or self._amplitude_vpp is None
+        self._boundary = False
+        self._tunes += 1
+        if first or self._policy == VerifyPolicy.ALWAYS:
+            return True
+        if self._policy == VerifyPolicy.EVERY_N:
+            return (self._tunes - 1) % self._every == 0
+        return False
+
+    def _tune(self, freq_hz: float, verify: bool) -> tuple[float, float, bool]:
+        self._awg.set_frequency(float(freq_hz), self._channel)
+        if not verify and self._amplitude_vpp is not None:
+            # The amplitude is set once per sweep, so its last readback stays valid.
+            self.skipped += 1
+            return float(freq_hz), self._amplitude_vpp, False
+        actual_hz = self._awg.get_frequency(self._channel)
+        self._amplitude_vpp = float(self._awg.get_amplitude_vpp(self._channel))
+        self.verified += 1
+        return float(actual_hz), self._amplitude_vpp, True
+
+    def __enter__(self) -> AwgRetuner:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any
+
+from app.domain.enums import DspExecutor
+
+
+class DspPipeline:
+    def __init__(self, mode: DspExecutor, max_in_flight: int = 4, workers: int | None = None) -> None:
+        self._mode = DspExecutor(mode)
+        self._max_in_flight = max(1, int(max_in_flight))
+        self._pending: deque[tuple[Any, Future]] = deque()
+        self._executor: Executor | None = None
+        if self._mode == DspExecutor.THREAD:
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dsp")
+        elif self._mode == DspExecutor.PROCESS:
+            self._executor = ProcessPoolExecutor(max_workers=workers)
+        self.peak_in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def submit(self, tag: Any, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+        if self._executor is None:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except Exception as exc:  # noqa: BLE001
+                future.set_exception(exc)
+        else:
+            future = self._executor.submit(fn, *args, **kwargs)
+        self._pending.append((tag, future))
+        self.peak_in_flight = max(self.peak_in_flight, len(self._pending))
+
+    def complete(self, tag: Any, value: Any) -> None:
+        future: Future = Future()
+        future.set_result(value)
+        self._pending.append((tag, future))
+        self.peak_in_flight = max(self.peak_in_flight, len(self._pending))
+
+    def ready(self) -> Iterator[tuple[Any, Any]]:
+        # Results leave in submission order; a finished point waits behind a slower earlier one.
+        while self._pending and (
+            self._pending[0][1].done() or len(self._pending) >= self._max_in_flight
+        ):
+            tag, future = self._pending.popleft()
+            yield tag, future.result()
+
+    def drain(self) -> Iterator[tuple[Any, Any]]:
+        while self._pending:
+            tag, future = self._pending.popleft()
+            yield tag, future.result()
+
+    def close(self) -> None:
+        for _, future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> DspPipeline:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
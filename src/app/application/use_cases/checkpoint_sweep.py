@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import Any
+
+from app.application.dto import StartSweepCommand
+from app.domain.models import AppSettings
+from app.infrastructure.persistence.repository_ports import CheckpointRepository
+
+
+class CheckpointSweepUseCase:
+    def __init__(self, repository: CheckpointRepository) -> None:
+        self._repository = repository
+
+    def start(
+        self,
+        settings: AppSettings,
+        *,
+        calibration_enabled: bool = False,
+        reference_interpolator: Any | None = None,
+    ) -> StartSweepCommand:
+        return StartSweepCommand(
+            settings=settings,
+            calibration_enabled=calibration_enabled,
+            reference_interpolator=reference_interpolator,
+            checkpoint=self._repository.start(settings),
+        )
+
+    def resume(
+        self,
+        path: str,
+        *,
+        calibration_enabled: bool = False,
+        reference_interpolator: Any | None = None,
+    ) -> StartSweepCommand:
+        checkpoint, settings, points = self._repository.resume(path)
+        return StartSweepCommand(
+            settings=settings,
+            calibration_enabled=calibration_enabled,
+            reference_interpolator=reference_interpolator,
+            checkpoint=checkpoint,
+            resume_points=points,
+        )
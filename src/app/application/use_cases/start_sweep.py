@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import math
 import threading
-import time
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime, timezone
+from itertools import chain
 
 import numpy as np
 
@@ -17,20 +19,71 @@ from app.application.events import (
     SweepStopped,
     SweepWarning,
 )
+from app.application.services.awg_retuner import AwgRetuner
+from app.application.services.dsp_pipeline import DspPipeline
+from app.domain.autorange import VppPredictor, target_range_for
+from app.domain.averaging import PhasorWelford, needs_more_acquisitions
+from app.domain.broadband import (
+    CHIRP_MAX_POINTS,
+    NOISE_ACQUISITIONS,
+    NOISE_SEGMENTS_PER_RECORD,
+    chirp_sample_rate_hz,
+    measure_chirp,
+    measure_noise,
+    noise_segment_length,
+    plan_chirp,
+)
 from app.domain.calibration import apply_reference_to_point
-from app.domain.enums import CorrectionMode, TriggerMode
-from app.domain.models import SweepPoint, SweepResult
-from app.domain.signal_processing import calc_vin_peak, measure_dual_channel, measure_single_channel
-from app.domain.sweep_engine import compute_sampling_window_s, generate_frequency_points
+from app.domain.enums import CorrectionMode, SweepMode, ToneEstimator, TriggerMode, VerifyPolicy
+from app.domain.models import SweepPoint, SweepResult, SweepSegment, WaveformRecord
+from app.domain.multisine import (
+    design_multisine,
+    measure_multisine,
+    multisine_capture,
+    plan_multisine_blocks,
+)
+from app.domain.refinement import refinement_candidates
+from app.domain.signal_processing import (
+    StreamingToneAccumulator,
+    calc_vin_peak,
+    estimate_record_frequency,
+    measure_dual_record,
+    measure_dual_stream,
+    measure_record_with_snr,
+    measure_single_record,
+    measure_single_stream,
+    window_cache_stats,
+)
+from app.domain.sweep_engine import (
+    SEGMENT_BOUNDARY_RTOL,
+    FrequencyPlan,
+    compute_sampling_window_s,
+    min_cycles_for_estimator,
+    plan_coherent_acquisition,
+    quantize_window_s,
+    segment_point_count,
+)
+from app.domain.timebase import TimebaseModel
 from app.domain.validators import ValidationError, validate_settings
 from app.infrastructure.instruments.ports import AwgPort, OscPort
 
+TONE_CHECK_RTOL = 1e-3
+
 
 class StartSweepUseCase:
     def __init__(self, awg: AwgPort, osc: OscPort, stop_event: threading.Event) -> None:
         self._awg = awg
         self._osc = osc
         self._stop_event = stop_event
+        self._measured_hz = np.empty(0)
+        self._retuner = AwgRetuner(awg, 1, pipelined=False)
+        self._timebase_s: float | None = None
+        self._memory_depth: int | None = None
+        self._timebase_model: TimebaseModel | None = None
+        self._timebase_stats = {"applied": 0, "skipped": 0, "sample_rate_queries": 0}
+        self._vpp_predictor = VppPredictor()
+        self._vertical: dict[int, tuple[float, float]] = {}
+        self._autorange_stats = {"points": 0, "presets": 0, "reacquisitions": 0}
 
     def run(self, cmd: StartSweepCommand, emitter: EventEmitter) -> SweepResult:
         try:
@@ -43,124 +96,661 @@ class StartSweepUseCase:
                 }
             )
 
+            if cmd.resume_points and cmd.settings.run_mode.sweep_mode not in (SweepMode.STEPPED, SweepMode.ADAPTIVE):
+                raise ValidationError("Resume is only supported for stepped and adaptive sweeps")
+            for point in cmd.resume_points:
+                result.insert_sorted(point)
+            self._measured_hz = result.freq_array()
+            if cmd.resume_points:
+                result.meta["resumed_points"] = len(cmd.resume_points)
+
+            self._timebase_s = None
+            self._memory_depth = None
+            self._timebase_model = self._osc.timebase_model()
+            self._timebase_stats = {"applied": 0, "skipped": 0, "sample_rate_queries": 0}
+            self._vpp_predictor = VppPredictor()
+            self._vertical = {}
+            self._autorange_stats = {"points": 0, "presets": 0, "reacquisitions": 0}
+
             settings = cmd.settings
             sweep = settings.sweep
             setup = settings.setup
             run_mode = settings.run_mode
 
-            freq_points = generate_frequency_points(sweep)
-            emitter.emit(SweepStarted(total_points=len(freq_points)))
+            plan = FrequencyPlan.from_spec(sweep)
+            segment_plans = [(segment, FrequencyPlan.from_spec(segment)) for segment in sweep.segments]
+            total_points = segment_point_count([p for _, p in segment_plans]) if segment_plans else len(plan)
+            if run_mode.sweep_mode == SweepMode.ADAPTIVE:
+                total_points = max(run_mode.refine_budget, total_points)
+            emitter.emit(SweepStarted(total_points=total_points))
 
             self._configure_instruments(cmd, emitter)
 
-            for index, target_freq in enumerate(freq_points, start=1):
+            self._retuner = AwgRetuner(
+                self._awg,
+                setup.channels.awg_ch,
+                pipelined=run_mode.pipelined,
+                policy=run_mode.verify_policy,
+                every=run_mode.verify_every,
+            )
+            with self._retuner, DspPipeline(run_mode.dsp_executor, run_mode.max_in_flight) as pipeline:
+                if segment_plans:
+                    stopped = self._sweep_segmented(cmd, emitter, result, segment_plans, total_points, pipeline)
+                elif run_mode.sweep_mode == SweepMode.MULTISINE:
+                    stopped = self._sweep_multisine(cmd, emitter, result, plan.to_array(), pipeline)
+                elif run_mode.sweep_mode == SweepMode.CHIRP:
+                    stopped = self._sweep_chirp(cmd, emitter, result, plan.to_array(), pipeline)
+                elif run_mode.sweep_mode == SweepMode.NOISE:
+                    stopped = self._sweep_noise(cmd, emitter, result, plan.to_array())
+                elif run_mode.sweep_mode == SweepMode.ADAPTIVE:
+                    stopped = self._sweep_adaptive(cmd, emitter, result, plan, pipeline)
+                else:
+                    stopped = self._sweep_stepped(cmd, emitter, result, plan, pipeline)
+                self._publish(pipeline.drain(), cmd, result, emitter, total_points)
+                result.meta["dsp_peak_in_flight"] = pipeline.peak_in_flight
+            result.meta["timebase_reconfigurations"] = dict(self._timebase_stats)
+            result.meta["sample_rate_cache"] = self._osc.sample_rate_cache_stats()
+            if run_mode.pipelined:
+                result.meta["awg_prefetch"] = {"hits": self._retuner.hits, "misses": self._retuner.misses}
+            result.meta["awg_readbacks"] = {"verified": self._retuner.verified, "skipped": self._retuner.skipped}
+            if run_mode.auto_range and self._autorange_stats["points"]:
+                stats = self._autorange_stats
+                result.meta["auto_range"] = {
+                    **stats,
+                    "reacquisition_rate": stats["reacquisitions"] / stats["points"],
+                }
+
+            if stopped:
+                result.meta["stopped_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+                self._finish_checkpoint(cmd, "stopped")
+                emitter.emit(SweepStopped(result=result))
+                return result
+
+            result.meta["completed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            result.meta["window_cache"] = window_cache_stats()
+            self._finish_checkpoint(cmd, "completed")
+            emitter.emit(SweepCompleted(result=result))
+            return result
+
+        except ValidationError as exc:
+            self._finish_checkpoint(cmd, "invalid")
+            emitter.emit(SweepFailed(error_code="VALIDATION", message=str(exc)))
+            return SweepResult()
+        except Exception as exc:  # noqa: BLE001
+            message = str(exc)
+            if cmd.checkpoint is not None:
+                message = f"{message} (measured points kept in {cmd.checkpoint.path})"
+            self._finish_checkpoint(cmd, "failed")
+            emitter.emit(SweepFailed(error_code="SWEEP_RUNTIME", message=message))
+            return SweepResult()
+
+    def _finish_checkpoint(self, cmd: StartSweepCommand, status: str) -> None:
+        if cmd.checkpoint is None:
+            return
+        try:
+            cmd.checkpoint.finish(status)
+        except Exception:  # noqa: BLE001
+            pass
+
+    def _already_measured(self, freq_hz: float) -> bool:
+        measured = self._measured_hz
+        if measured.size == 0:
+            return False
+        pos = int(np.searchsorted(measured, freq_hz))
+        neighbours = measured[max(pos - 1, 0) : pos + 1]
+        return bool(np.any(np.isclose(neighbours, freq_hz, atol=1e-3, rtol=5e-6)))
+
+    def _sweep_stepped(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        freq_points: FrequencyPlan,
+        pipeline: DspPipeline,
+    ) -> bool:
+        index = len(cmd.resume_points)
+        scheduled = chain.from_iterable(freq_points.chunks())
+        for target_freq, next_freq in self._lookahead(scheduled):
+            if self._stop_event.is_set():
+                return True
+
+            index += 1
+            self._measure_point(index, target_freq, cmd, emitter, result, pipeline, len(freq_points), next_freq=next_freq)
+
+        return False
+
+    def _sweep_segmented(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        segment_plans: Sequence[tuple[SweepSegment, FrequencyPlan]],
+        total_points: int,
+        pipeline: DspPipeline,
+    ) -> bool:
+        setup = cmd.settings.setup
+        channels = [setup.channels.osc_test_ch]
+        if cmd.settings.run_mode.correction_mode == CorrectionMode.DUAL and setup.channels.osc_ref_ch:
+            channels.append(setup.channels.osc_ref_ch)
+
+        index = len(cmd.resume_points)
+        last_hz = -math.inf
+        for segment, plan in segment_plans:
+            self._retuner.mark_boundary()
+            full_scale_v = segment.full_scale_v if segment.full_scale_v is not None else setup.osc_settings.full_scale_v
+            for channel in channels:
+                self._set_vertical(channel, full_scale_v, setup.osc_settings.offset_v)
+
+            # Segments are validated as ascending, so only a shared boundary frequency is dropped here.
+            scheduled = chain.from_iterable(
+                chunk[chunk > last_hz * (1.0 + SEGMENT_BOUNDARY_RTOL)] for chunk in plan.chunks()
+            )
+            for target_freq, next_freq in self._lookahead(scheduled):
                 if self._stop_event.is_set():
-                    result.meta["stopped_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
-                    emitter.emit(SweepStopped(result=result))
-                    return result
+                    return True
+                index += 1
+                self._measure_point(
+                    index, target_freq, cmd, emitter, result, pipeline, total_points, segment, next_freq=next_freq
+                )
+            last_hz = max(last_hz, plan.last_hz)
 
-                awg_ch = setup.channels.awg_ch
-                self._awg.set_frequency(float(target_freq), awg_ch)
-                actual_freq = self._awg.get_frequency(awg_ch)
+        result.meta["segments"] = len(segment_plans)
+        return False
 
-                if not np.isclose(actual_freq, target_freq, atol=1e-3, rtol=5e-6):
-                    emitter.emit(
-                        SweepWarning(
-                            code="FREQ_MISMATCH",
-                            message=(
-                                f"Requested {target_freq:.6f} Hz, actual {actual_freq:.6f} Hz"
-                            ),
-                        )
-                    )
+    def _sweep_adaptive(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        coarse_points: FrequencyPlan,
+        pipeline: DspPipeline,
+    ) -> bool:
+        run_mode = cmd.settings.run_mode
+        budget = max(run_mode.refine_budget, len(coarse_points))
+        index = len(cmd.resume_points)
+        pending: Iterable[float] = coarse_points
+        passes = 0
+
+        while True:
+            for target_freq, next_freq in self._lookahead(pending):
+                if self._stop_event.is_set():
+                    return True
+                index += 1
+                self._measure_point(index, target_freq, cmd, emitter, result, pipeline, budget, next_freq=next_freq)
+            self._publish(pipeline.drain(), cmd, result, emitter, budget)
+
+            if index >= budget:
+                break
+            phase = result.phase_array() if all(p.phase_deg is not None for p in result.points) else None
+            candidates = refinement_candidates(
+                result.freq_array(),
+                result.gain_db_array(),
+                phase,
+                tol_db=run_mode.refine_tolerance_db,
+                tol_deg=run_mode.refine_tolerance_deg,
+                is_log=cmd.settings.sweep.is_log,
+            )
+            if candidates.size == 0:
+                break
+            passes += 1
+            pending = np.sort(candidates[: budget - index])
 
-                requested_amp = float(setup.awg_settings.amplitude_vpp)
-                read_amp = self._awg.get_amplitude_vpp(awg_ch)
-                if not np.isclose(read_amp, requested_amp, atol=1e-2, rtol=1e-3):
+        result.meta["refine_passes"] = passes
+        result.meta["refine_points"] = max(index - len(coarse_points), 0)
+        return False
+
+    def _lookahead(self, freqs: Iterable[float]) -> Iterator[tuple[float, float | None]]:
+        previous: float | None = None
+        for freq in freqs:
+            if self._already_measured(freq):
+                continue
+            if previous is not None:
+                yield previous, float(freq)
+            previous = float(freq)
+        if previous is not None:
+            yield previous, None
+
+    def _measure_point(
+        self,
+        index: int,
+        target_freq: float,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        pipeline: DspPipeline,
+        total_points: int,
+        segment: SweepSegment | None = None,
+        *,
+        next_freq: float | None = None,
+    ) -> None:
+        setup = cmd.settings.setup
+        run_mode = cmd.settings.run_mode
+        averages = segment.averages if segment is not None else 1
+        averaging = not run_mode.streaming and (run_mode.adaptive_averaging or averages > 1)
+
+        actual_freq, read_amp, verified = self._retuner.tune(target_freq)
+
+        if verified and not np.isclose(actual_freq, target_freq, atol=1e-3, rtol=5e-6):
+            emitter.emit(
+                SweepWarning(
+                    code="FREQ_MISMATCH",
+                    message=(
+                        f"Requested {target_freq:.6f} Hz, actual {actual_freq:.6f} Hz"
+                    ),
+                )
+            )
+
+        requested_amp = float(setup.awg_settings.amplitude_vpp)
+        if verified and not np.isclose(read_amp, requested_amp, atol=1e-2, rtol=1e-3):
+            emitter.emit(
+                SweepWarning(
+                    code="AMP_MISMATCH",
+                    message=(
+                        f"Requested {requested_amp:.6f} Vpp, actual {read_amp:.6f} Vpp"
+                    ),
+                )
+            )
+
+        record_points = setup.osc_settings.points
+        if segment is not None and segment.record_points:
+            record_points = segment.record_points
+        model = self._timebase_model
+        sample_rate = model.max_sample_rate_hz if model is not None else self._query_sample_rate()
+        window_s = compute_sampling_window_s(
+            freq_hz=actual_freq,
+            sample_rate_hz=sample_rate,
+            points=record_points,
+            min_cycles=min_cycles_for_estimator(run_mode.estimator),
+        )
+        memory_depth = None
+        if model is not None:
+            setting = model.predict(window_s, record_points)
+            window_s, sample_rate, memory_depth = setting.window_s, setting.sample_rate_hz, setting.memory_depth
+        exact_window = False
+        if run_mode.estimator == ToneEstimator.COHERENT:
+            if model is not None:
+                planned = model.plan_coherent(
+                    actual_freq, record_points, min_cycles=min_cycles_for_estimator(run_mode.estimator)
+                )
+                if planned is not None:
+                    setting, plan = planned
+                    window_s, record_points, memory_depth = setting.window_s, plan.points, setting.memory_depth
+            else:
+                plan = plan_coherent_acquisition(actual_freq, [sample_rate], [record_points])
+                if plan is not None:
+                    window_s, record_points = plan.window_s, plan.points
+                    exact_window = True
+
+        self._apply_timebase(window_s, quantize=not exact_window, memory_depth=memory_depth)
+        test_ch = setup.channels.osc_test_ch
+        if run_mode.auto_range:
+            self._autorange_stats["points"] += 1
+            self._preset_vertical(test_ch, actual_freq)
+        triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
+        self._osc.single_acquire(triggered=triggered)
+        if not run_mode.auto_range and not averaging:
+            self._retuner.prefetch(next_freq)
+
+        ref_ch = int(setup.channels.osc_ref_ch or test_ch)
+        dual = run_mode.correction_mode == CorrectionMode.DUAL
+        vin_peak = calc_vin_peak(
+            vpp_panel=read_amp,
+            awg_impedance=setup.awg_settings.impedance.value,
+            osc_impedance=setup.osc_settings.impedance.value,
+        )
+
+        if run_mode.streaming:
+            tone_t = self._osc.read_tone(test_ch, record_points, actual_freq)
+
+            if run_mode.auto_range and self._adjust_auto_range(
+                test_ch, tone_t.vmin, tone_t.vmax, setup.osc_settings.offset_v
+            ):
+                self._autorange_stats["reacquisitions"] += 1
+                self._osc.single_acquire(triggered=triggered)
+                tone_t = self._osc.read_tone(test_ch, record_points, actual_freq)
+            self._retuner.prefetch(next_freq)
+            if run_mode.auto_range:
+                self._vpp_predictor.observe(actual_freq, tone_t.vmax - tone_t.vmin)
+
+            tone_r = self._osc.read_tone(ref_ch, record_points, actual_freq) if dual else None
+            pipeline.submit(((index, actual_freq),), _measure_streams, tone_t, tone_r, vin_peak, triggered)
+        else:
+            record_t = self._osc.read_waveform(test_ch, record_points)
+
+            if run_mode.auto_range and self._adjust_auto_range(
+                test_ch, *record_t.bounds(), setup.osc_settings.offset_v
+            ):
+                self._autorange_stats["reacquisitions"] += 1
+                self._osc.single_acquire(triggered=triggered)
+                record_t = self._osc.read_waveform(test_ch, record_points)
+            if run_mode.auto_range:
+                vmin, vmax = record_t.bounds()
+                self._vpp_predictor.observe(actual_freq, vmax - vmin)
+            if not averaging:
+                self._retuner.prefetch(next_freq)
+            if not verified and run_mode.verify_policy == VerifyPolicy.TONE:
+                try:
+                    measured_hz = estimate_record_frequency(record_t)
+                except ValueError as exc:
+                    emitter.emit(SweepWarning(code="TONE_CHECK_FAILED", message=f"{target_freq:.6f} Hz: {exc}"))
+                    measured_hz = actual_freq
+                if not np.isclose(measured_hz, actual_freq, rtol=TONE_CHECK_RTOL):
                     emitter.emit(
                         SweepWarning(
-                            code="AMP_MISMATCH",
+                            code="FREQ_MISMATCH",
                             message=(
-                                f"Requested {requested_amp:.6f} Vpp, actual {read_amp:.6f} Vpp"
+                                f"Requested {target_freq:.6f} Hz, measured tone {measured_hz:.6f} Hz"
                             ),
                         )
                     )
 
-                sample_rate = self._osc.get_sample_rate()
-                window_s = compute_sampling_window_s(
-                    freq_hz=actual_freq,
-                    sample_rate_hz=sample_rate,
-                    points=setup.osc_settings.points,
+            record_r = self._osc.read_waveform(ref_ch, record_points) if dual else None
+            if averaging:
+                value = self._average_point(
+                    record_t, record_r, actual_freq, vin_peak, test_ch, ref_ch, record_points, cmd, averages
+                )
+                self._retuner.prefetch(next_freq)
+                result.meta["acquisitions_total"] = result.meta.get("acquisitions_total", 0) + value[4]
+                pipeline.complete(((index, actual_freq),), (value,))
+            else:
+                pipeline.submit(
+                    ((index, actual_freq),),
+                    _measure_records,
+                    record_t,
+                    record_r,
+                    actual_freq,
+                    vin_peak,
+                    triggered,
+                    run_mode.estimator,
                 )
 
-                self._osc.set_timebase(window_s)
-                triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
-                self._osc.single_acquire(triggered=triggered)
+        self._publish(pipeline.ready(), cmd, result, emitter, total_points)
+
+    def _query_sample_rate(self) -> float:
+        self._timebase_stats["sample_rate_queries"] += 1
+        return self._osc.get_sample_rate()
+
+    def _sync_triggered(self, cmd: StartSweepCommand) -> bool:
+        # Only a trigger on its own channel (the AWG sync or marker) pins scope t=0 to the stimulus start.
+        channels = cmd.settings.setup.channels
+        return (
+            cmd.settings.run_mode.trigger_mode == TriggerMode.TRIGGERED
+            and bool(channels.osc_trig_ch)
+            and int(channels.osc_trig_ch) != int(channels.osc_test_ch)
+        )
+
+    def _apply_timebase(self, window_s: float, *, quantize: bool, memory_depth: int | None = None) -> None:
+        # The model's sample rate only holds if the scope records at the depth it assumed.
+        if memory_depth is not None and memory_depth != self._memory_depth:
+            self._osc.set_record_length(memory_depth)
+            self._memory_depth = memory_depth
+        if quantize:
+            window_s = quantize_window_s(window_s)
+        if self._timebase_s is not None and math.isclose(window_s, self._timebase_s, rel_tol=1e-9):
+            self._timebase_stats["skipped"] += 1
+            return
+        self._osc.set_timebase(window_s)
+        self._timebase_s = window_s
+        self._timebase_stats["applied"] += 1
+
+    def _sweep_multisine(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        freq_points: np.ndarray,
+        pipeline: DspPipeline,
+    ) -> bool:
+        setup = cmd.settings.setup
+        run_mode = cmd.settings.run_mode
+        awg_ch = setup.channels.awg_ch
+        test_ch = setup.channels.osc_test_ch
+        ref_ch = int(setup.channels.osc_ref_ch or test_ch)
+        dual = run_mode.correction_mode == CorrectionMode.DUAL
+        triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
 
-                test_ch = setup.channels.osc_test_ch
-                times_t, volts_t = self._osc.read_waveform(test_ch, setup.osc_settings.points)
+        blocks = plan_multisine_blocks(freq_points)
+        result.meta["multisine_blocks"] = len(blocks)
+        index = 0
+        try:
+            for block in blocks:
+                if self._stop_event.is_set():
+                    return True
 
-                if run_mode.auto_range and self._adjust_auto_range(test_ch, volts_t, setup.osc_settings.offset_v):
-                    self._osc.single_acquire(triggered=triggered)
-                    times_t, volts_t = self._osc.read_waveform(test_ch, setup.osc_settings.points)
-
-                if run_mode.correction_mode == CorrectionMode.DUAL:
-                    ref_ch = int(setup.channels.osc_ref_ch or test_ch)
-                    times_r, volts_r = self._osc.read_waveform(ref_ch, setup.osc_settings.points)
-                    gain_linear, gain_db, phase_deg, gain_complex = measure_dual_channel(
-                        times_t,
-                        volts_t,
-                        times_r,
-                        volts_r,
-                        actual_freq,
-                    )
-                else:
-                    vin_peak = calc_vin_peak(
-                        vpp_panel=read_amp,
-                        awg_impedance=setup.awg_settings.impedance.value,
-                        osc_impedance=setup.osc_settings.impedance.value,
-                    )
-                    gain_linear, gain_db, phase_deg, gain_complex = measure_single_channel(
-                        times_t,
-                        volts_t,
-                        actual_freq,
-                        vin_peak,
-                        compute_phase=triggered,
+                design = design_multisine(block)
+                self._awg.load_arbitrary(design.samples, awg_ch)
+                self._awg.set_frequency(design.base_hz, awg_ch)
+                design = design.at_base(self._awg.get_frequency(awg_ch))
+                read_amp = self._awg.get_amplitude_vpp(awg_ch)
+
+                model = self._timebase_model
+                max_rate = model.max_sample_rate_hz if model is not None else self._query_sample_rate()
+                window_s, sample_rate = multisine_capture(design, max_rate, setup.osc_settings.points)
+                record_points = int(math.ceil(window_s * sample_rate))
+                memory_depth = None
+                if model is not None:
+                    setting = model.predict(window_s, record_points)
+                    window_s, record_points, memory_depth = (
+                        setting.window_s,
+                        setting.record_points,
+                        setting.memory_depth,
                     )
+                self._apply_timebase(window_s, quantize=model is not None, memory_depth=memory_depth)
+                self._osc.single_acquire(triggered=triggered)
 
-                point = SweepPoint(
-                    freq_hz=float(actual_freq),
-                    gain_linear=float(gain_linear),
-                    gain_db=float(gain_db),
-                    phase_deg=float(phase_deg) if phase_deg is not None else None,
-                    gain_complex=complex(gain_complex) if gain_complex is not None else None,
+                record_t = self._osc.read_waveform(test_ch, record_points)
+                if run_mode.auto_range and self._adjust_auto_range(
+                    test_ch, *record_t.bounds(), setup.osc_settings.offset_v
+                ):
+                    self._osc.single_acquire(triggered=triggered)
+                    record_t = self._osc.read_waveform(test_ch, record_points)
+                record_r = self._osc.read_waveform(ref_ch, record_points) if dual else None
+
+                vin_peak = calc_vin_peak(
+                    vpp_panel=read_amp,
+                    awg_impedance=setup.awg_settings.impedance.value,
+                    osc_impedance=setup.osc_settings.impedance.value,
+                )
+                tags = tuple((index + i + 1, float(f)) for i, f in enumerate(design.freqs_hz))
+                index += len(tags)
+                pipeline.submit(
+                    tags,
+                    measure_multisine,
+                    record_t,
+                    record_r,
+                    design,
+                    vin_peak,
+                    compute_phase=self._sync_triggered(cmd),
                 )
+                self._publish(pipeline.ready(), cmd, result, emitter, len(freq_points))
+        finally:
+            self._awg.select_sine(awg_ch)
 
-                if cmd.calibration_enabled and cmd.reference_interpolator is not None:
-                    use_phase = (
-                        run_mode.correction_mode == CorrectionMode.DUAL
-                        or run_mode.trigger_mode == TriggerMode.TRIGGERED
-                    )
-                    ref_value = cmd.reference_interpolator(np.array([point.freq_hz]))[0]
-                    point = apply_reference_to_point(point, ref_value, use_phase=use_phase)
+        return False
+
+    def _sweep_chirp(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        freq_points: np.ndarray,
+        pipeline: DspPipeline,
+    ) -> bool:
+        setup = cmd.settings.setup
+        run_mode = cmd.settings.run_mode
+        awg_ch = setup.channels.awg_ch
+        test_ch = setup.channels.osc_test_ch
+        ref_ch = int(setup.channels.osc_ref_ch or test_ch)
+        dual = run_mode.correction_mode == CorrectionMode.DUAL
+        triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
+
+        if self._stop_event.is_set():
+            return True
 
-                result.append(point)
+        model = self._timebase_model
+        max_rate = model.max_sample_rate_hz if model is not None else self._query_sample_rate()
+        plan = plan_chirp(freq_points, max_rate, is_log=cmd.settings.sweep.is_log)
+        window_s = plan.duration_s
+        sample_rate = chirp_sample_rate_hz(plan.duration_s, max_rate)
+        memory_depth = None
+        if model is not None:
+            setting = model.predict(plan.duration_s, CHIRP_MAX_POINTS)
+            window_s, sample_rate, memory_depth = setting.window_s, setting.sample_rate_hz, setting.memory_depth
+        result.meta["chirp"] = {
+            "start_hz": plan.start_hz,
+            "stop_hz": plan.stop_hz,
+            "duration_s": plan.duration_s,
+            "is_log": plan.is_log,
+        }
+
+        self._awg.start_chirp(plan.start_hz, plan.stop_hz, plan.duration_s, plan.is_log, awg_ch)
+        try:
+            read_amp = self._awg.get_amplitude_vpp(awg_ch)
+            record_points = int(round(plan.duration_s * sample_rate))
+            self._apply_timebase(window_s, quantize=model is not None, memory_depth=memory_depth)
+            self._osc.single_acquire(triggered=triggered)
+
+            record_t = self._osc.read_waveform(test_ch, record_points)
+            if run_mode.auto_range and self._adjust_auto_range(
+                test_ch, *record_t.bounds(), setup.osc_settings.offset_v
+            ):
+                self._osc.single_acquire(triggered=triggered)
+                record_t = self._osc.read_waveform(test_ch, record_points)
+            record_r = self._osc.read_waveform(ref_ch, record_points) if dual else None
+        finally:
+            self._awg.stop_chirp(awg_ch)
+
+        vin_peak = calc_vin_peak(
+            vpp_panel=read_amp,
+            awg_impedance=setup.awg_settings.impedance.value,
+            osc_impedance=setup.osc_settings.impedance.value,
+        )
+        tags = tuple((i + 1, float(f)) for i, f in enumerate(freq_points))
+        pipeline.submit(
+            tags,
+            measure_chirp,
+            record_t,
+            record_r,
+            freq_points,
+            plan,
+            vin_peak,
+            compute_phase=self._sync_triggered(cmd),
+        )
+        return False
 
-                emitter.emit(SweepProgress(freq_hz=point.freq_hz, point_index=index, total_points=len(freq_points)))
-                emitter.emit(SweepDataUpdated(last_point=point, partial_result=result))
+    def _sweep_noise(
+        self,
+        cmd: StartSweepCommand,
+        emitter: EventEmitter,
+        result: SweepResult,
+        freq_points: np.ndarray,
+    ) -> bool:
+        setup = cmd.settings.setup
+        run_mode = cmd.settings.run_mode
+        awg_ch = setup.channels.awg_ch
+        test_ch = setup.channels.osc_test_ch
+        ref_ch = int(setup.channels.osc_ref_ch or test_ch)
+        triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
+
+        model = self._timebase_model
+        sample_rate = model.max_sample_rate_hz if model is not None else self._query_sample_rate()
+        spacing = float(np.min(np.diff(freq_points))) if len(freq_points) > 1 else float(freq_points[0])
+        window_s = compute_sampling_window_s(
+            freq_hz=spacing,
+            sample_rate_hz=sample_rate,
+            points=setup.osc_settings.points,
+            min_cycles=NOISE_SEGMENTS_PER_RECORD,
+        )
+        memory_depth = None
+        if model is not None:
+            setting = model.predict(window_s, setup.osc_settings.points)
+            window_s, sample_rate, memory_depth = setting.window_s, setting.sample_rate_hz, setting.memory_depth
+        else:
+            window_s = quantize_window_s(window_s)
+        record_points = max(setup.osc_settings.points, int(math.ceil(window_s * sample_rate)))
+        nperseg = noise_segment_length(freq_points, sample_rate, record_points)
 
-                # Give stop signals a chance to be observed in long hardware loops.
-                time.sleep(0.001)
+        records_t: list[WaveformRecord] = []
+        records_r: list[WaveformRecord] = []
+        self._awg.start_noise(awg_ch)
+        try:
+            self._apply_timebase(window_s, quantize=True, memory_depth=memory_depth)
+            for _ in range(NOISE_ACQUISITIONS):
+                if self._stop_event.is_set():
+                    return True
+                self._osc.single_acquire(triggered=triggered)
+                record_t = self._osc.read_waveform(test_ch, record_points)
+                if run_mode.auto_range and self._adjust_auto_range(
+                    test_ch, *record_t.bounds(), setup.osc_settings.offset_v
+                ):
+                    self._osc.single_acquire(triggered=triggered)
+                    record_t = self._osc.read_waveform(test_ch, record_points)
+                records_t.append(record_t)
+                records_r.append(self._osc.read_waveform(ref_ch, record_points))
+        finally:
+            self._awg.select_sine(awg_ch)
+
+        points, coherence, segments = measure_noise(records_t, records_r, freq_points, nperseg)
+        result.meta["coherence"] = [float(c) for c in coherence]
+        result.meta["noise"] = {
+            "acquisitions": len(records_t),
+            "segments": segments,
+            "nperseg": nperseg,
+            "resolution_hz": 1.0 / (nperseg * records_t[0].dt),
+        }
+        tags = tuple((i + 1, float(f)) for i, f in enumerate(freq_points))
+        self._publish([(tags, points)], cmd, result, emitter, len(freq_points))
+        return False
 
-            result.meta["completed_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
-            emitter.emit(SweepCompleted(result=result))
-            return result
+    def _publish(
+        self,
+        ready: Iterable[tuple[tuple[tuple[int, float], ...], Sequence[tuple]]],
+        cmd: StartSweepCommand,
+        result: SweepResult,
+        emitter: EventEmitter,
+        total_points: int,
+    ) -> None:
+        for tags, values in ready:
+            for (index, freq_hz), value in zip(tags, values):
+                self._publish_point(index, freq_hz, value, cmd, result, emitter, total_points)
+
+    def _publish_point(
+        self,
+        index: int,
+        freq_hz: float,
+        value: tuple,
+        cmd: StartSweepCommand,
+        result: SweepResult,
+        emitter: EventEmitter,
+        total_points: int,
+    ) -> None:
+        run_mode = cmd.settings.run_mode
+        gain_linear, gain_db, phase_deg, gain_complex, *stats = value
+        acquisitions, gain_ci = stats if stats else (1, None)
+        point = SweepPoint(
+            freq_hz=float(freq_hz),
+            gain_linear=float(gain_linear),
+            gain_db=float(gain_db),
+            phase_deg=float(phase_deg) if phase_deg is not None else None,
+            gain_complex=complex(gain_complex) if gain_complex is not None else None,
+            acquisitions=int(acquisitions),
+            gain_ci=float(gain_ci) if gain_ci is not None else None,
+        )
+
+        if cmd.calibration_enabled and cmd.reference_interpolator is not None:
+            use_phase = (
+                run_mode.correction_mode == CorrectionMode.DUAL
+                or run_mode.trigger_mode == TriggerMode.TRIGGERED
+            )
+            ref_value = cmd.reference_interpolator(np.array([point.freq_hz]))[0]
+            point = apply_reference_to_point(point, ref_value, use_phase=use_phase)
 
-        except ValidationError as exc:
-            emitter.emit(SweepFailed(error_code="VALIDATION", message=str(exc)))
-            return SweepResult()
-        except Exception as exc:  # noqa: BLE001
-            emitter.emit(SweepFailed(error_code="SWEEP_RUNTIME", message=str(exc)))
-            return SweepResult()
+        result.insert_sorted(point)
+        if cmd.checkpoint is not None:
+            cmd.checkpoint.append(point)
+
+        emitter.emit(SweepProgress(freq_hz=point.freq_hz, point_index=index, total_points=total_points))
+        emitter.emit(SweepDataUpdated(last_point=point, partial_result=result))
 
     def _configure_instruments(self, cmd: StartSweepCommand, emitter: EventEmitter) -> None:
         settings = cmd.settings
@@ -181,13 +771,13 @@ class StartSweepUseCase:
         self._osc.output_on(test_ch)
         self._osc.set_coupling(test_ch, setup.osc_settings.coupling.value)
         self._osc.set_impedance(test_ch, setup.osc_settings.impedance.value)
-        self._osc.set_vertical(test_ch, setup.osc_settings.full_scale_v, setup.osc_settings.offset_v)
+        self._set_vertical(test_ch, setup.osc_settings.full_scale_v, setup.osc_settings.offset_v)
 
         if run_mode.correction_mode == CorrectionMode.DUAL and setup.channels.osc_ref_ch:
             self._osc.output_on(setup.channels.osc_ref_ch)
             self._osc.set_coupling(setup.channels.osc_ref_ch, setup.osc_settings.coupling.value)
             self._osc.set_impedance(setup.channels.osc_ref_ch, setup.osc_settings.impedance.value)
-            self._osc.set_vertical(
+            self._set_vertical(
                 setup.channels.osc_ref_ch,
                 setup.osc_settings.full_scale_v,
                 setup.osc_settings.offset_v,
@@ -202,28 +792,20 @@ class StartSweepUseCase:
 
         emitter.emit(SweepWarning(code="READY", message="Instruments configured"))
 
-    def _adjust_auto_range(self, channel: int, volts: np.ndarray, requested_offset_v: float) -> bool:
-        if volts is None or len(volts) == 0:
+    def _adjust_auto_range(self, channel: int, vmin: float, vmax: float, requested_offset_v: float) -> bool:
+        if not (np.isfinite(vmin) and np.isfinite(vmax)):
             return False
 
-        vmax = float(np.max(volts))
-        vmin = float(np.min(volts))
         vpp = vmax - vmin
         midpoint = (vmax + vmin) / 2.0
 
-        current_range, current_offset = self._osc.get_vertical(channel)
+        current_range, current_offset = self._current_vertical(channel)
         if current_range <= 0:
             return False
 
-        ratio = vpp / current_range
-        target_range = current_range
+        target_range = target_range_for(vpp, current_range)
         target_offset = requested_offset_v
 
-        if ratio > 0.85:
-            target_range = vpp / 0.7
-        elif 0.0 < ratio < 0.55:
-            target_range = max(vpp / 0.7, current_range * 0.5)
-
         if abs(midpoint - current_offset) > (current_range * 0.2):
             target_offset = midpoint
 
@@ -231,7 +813,121 @@ class StartSweepUseCase:
         offset_changed = not np.isclose(target_offset, current_offset, rtol=1e-2, atol=1e-3)
 
         if range_changed or offset_changed:
-            self._osc.set_vertical(channel, float(target_range), float(target_offset))
-            return True
+            # A request the scope snaps back to the same setting would only repeat the acquisition.
+            return self._set_vertical(channel, float(target_range), float(target_offset))
 
         return False
+
+    def _preset_vertical(self, channel: int, freq_hz: float) -> None:
+        predicted_vpp = self._vpp_predictor.predict(freq_hz)
+        if predicted_vpp is None:
+            return
+        current_range, current_offset = self._current_vertical(channel)
+        if current_range <= 0:
+            return
+        # Trust the prediction fully; the post-acquisition check still catches a miss.
+        target_range = target_range_for(predicted_vpp, current_range, max_shrink=0.0)
+        if not np.isclose(target_range, current_range, rtol=1e-2, atol=1e-3) and self._set_vertical(
+            channel, float(target_range), current_offset
+        ):
+            self._autorange_stats["presets"] += 1
+
+    def _current_vertical(self, channel: int) -> tuple[float, float]:
+        if channel not in self._vertical:
+            self._vertical[channel] = self._osc.get_vertical(channel)
+        return self._vertical[channel]
+
+    def _set_vertical(self, channel: int, full_scale_v: float, offset_v: float) -> bool:
+        previous = self._vertical.get(channel)
+        self._osc.set_vertical(channel, full_scale_v, offset_v)
+        # Scopes snap to their own range steps, so cache what the channel actually took.
+        actual = self._osc.get_vertical(channel)
+        self._vertical[channel] = actual
+        return previous is None or not np.allclose(actual, previous, rtol=1e-6, atol=1e-9)
+
+    def _average_point(
+        self,
+        record_t: WaveformRecord,
+        record_r: WaveformRecord | None,
+        freq_hz: float,
+        vin_peak: float,
+        test_ch: int,
+        ref_ch: int,
+        record_points: int,
+        cmd: StartSweepCommand,
+        min_acquisitions: int = 1,
+    ) -> tuple:
+        run_mode = cmd.settings.run_mode
+        triggered = run_mode.trigger_mode == TriggerMode.TRIGGERED
+        stats = PhasorWelford()
+        first_snr_db = math.inf
+        max_acquisitions = max(run_mode.max_averages, min_acquisitions)
+
+        while True:
+            value, snr_db = measure_record_with_snr(
+                record_t,
+                record_r,
+                freq_hz,
+                vin_peak,
+                compute_phase=triggered,
+                estimator=run_mode.estimator,
+            )
+            gain_linear, _gain_db, _phase_deg, gain_complex = value
+            if stats.count == 0:
+                first_snr_db = snr_db
+            # Without a phase reference only the magnitude can be averaged.
+            stats.add(gain_complex if gain_complex is not None else gain_linear)
+
+            if self._stop_event.is_set():
+                break
+            if stats.count >= min_acquisitions and not (
+                run_mode.adaptive_averaging
+                and needs_more_acquisitions(stats, first_snr_db, run_mode.target_uncertainty, max_acquisitions)
+            ):
+                break
+            self._osc.single_acquire(triggered=triggered)
+            record_t = self._osc.read_waveform(test_ch, record_points)
+            record_r = self._osc.read_waveform(ref_ch, record_points) if record_r is not None else None
+
+        if stats.count == 1:
+            # One acquisition has no measured spread; the SNR prediction only steers averaging.
+            return (*value, 1, None)
+
+        mean = stats.mean
+        gain_linear = max(abs(mean), 1e-15)
+        gain_db = 20.0 * math.log10(gain_linear)
+        if gain_complex is None:
+            return gain_linear, gain_db, None, None, stats.count, stats.half_width()
+        return gain_linear, gain_db, math.degrees(np.angle(mean)), mean, stats.count, stats.half_width()
+
+
+def _measure_records(
+    record_t: WaveformRecord,
+    record_r: WaveformRecord | None,
+    freq_hz: float,
+    vin_peak: float,
+    compute_phase: bool,
+    estimator: ToneEstimator,
+) -> tuple:
+    if record_r is not None:
+        return (measure_dual_record(record_t, record_r, freq_hz, estimator=estimator),)
+    return (
+        measure_single_record(
+            record_t,
+            freq_hz,
+            vin_peak,
+            compute_phase=compute_phase,
+            estimator=estimator,
+        ),
+    )
+
+
+def _measure_streams(
+    tone_t: StreamingToneAccumulator,
+    tone_r: StreamingToneAccumulator | None,
+    vin_peak: float,
+    compute_phase: bool,
+) -> tuple:
+    if tone_r is not None:
+        return (measure_dual_stream(tone_t, tone_r),)
+    return (measure_single_stream(tone_t, vin_peak, compute_phase=compute_phase),)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import bisect
+import math
+
+import numpy as np
+
+RANGE_HIGH_RATIO = 0.85
+RANGE_LOW_RATIO = 0.55
+RANGE_TARGET_RATIO = 0.7
+PREDICT_NEIGHBOURS = 3
+PREDICT_MAX_STEP = 4.0
+
+
+def target_range_for(vpp: float, current_range: float, *, max_shrink: float = 0.5) -> float:
+    ratio = vpp / current_range
+    if ratio > RANGE_HIGH_RATIO:
+        return vpp / RANGE_TARGET_RATIO
+    if 0.0 < ratio < RANGE_LOW_RATIO:
+        return max(vpp / RANGE_TARGET_RATIO, current_range * max_shrink)
+    return current_range
+
+
+class VppPredictor:
+    def __init__(self, neighbours: int = PREDICT_NEIGHBOURS, max_step: float = PREDICT_MAX_STEP) -> None:
+        self._neighbours = max(1, int(neighbours))
+        self._max_log_step = math.log(max(float(max_step), 1.0))
+        self._log_f: list[float] = []
+        self._log_v: list[float] = []
+
+    def __len__(self) -> int:
+        return len(self._log_f)
+
+    def observe(self, freq_hz: float, vpp: float) -> None:
+        if not (freq_hz > 0 and vpp > 0 and math.isfinite(freq_hz) and math.isfinite(vpp)):
+            return
+        log_f = math.log(freq_hz)
+        i = bisect.bisect_left(self._log_f, log_f)
+        self._log_f.insert(i, log_f)
+        self._log_v.insert(i, math.log(vpp))
+
+    def predict(self, freq_hz: float) -> float | None:
+        if not self._log_f or not freq_hz > 0:
+            return None
+        # Filter skirts are straight lines in log-log, so fit the nearest measured points there.
+        log_f = math.log(freq_hz)
+        i = bisect.bisect_left(self._log_f, log_f)
+        lo = max(0, i - self._neighbours)
+        hi = min(len(self._log_f), i + self._neighbours)
+        x = np.asarray(self._log_f[lo:hi])
+        y = np.asarray(self._log_v[lo:hi])
+        nearest = np.argsort(np.abs(x - log_f), kind="stable")[: self._neighbours]
+        x, y = x[nearest], y[nearest]
+
+        anchor = float(y[0])
+        if x.size < 2 or float(np.ptp(x)) <= 1e-12:
+            return math.exp(anchor)
+        slope, intercept = np.polyfit(x, y, 1)
+        estimate = float(slope * log_f + intercept)
+        estimate = min(max(estimate, anchor - self._max_log_step), anchor + self._max_log_step)
+        return math.exp(estimate)
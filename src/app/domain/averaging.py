@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from scipy.stats import norm, t as student_t
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_CONFIDENCE_Z = float(norm.ppf(0.5 + DEFAULT_CONFIDENCE / 2.0))
+
+
+class PhasorWelford:
+    def __init__(self) -> None:
+        self.count = 0
+        self._mean = 0j
+        self._m2 = 0.0
+
+    def add(self, value: complex) -> None:
+        self.count += 1
+        delta = complex(value) - self._mean
+        self._mean += delta / self.count
+        self._m2 += (delta.conjugate() * (complex(value) - self._mean)).real
+
+    @property
+    def mean(self) -> complex:
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.count - 1) if self.count > 1 else math.inf
+
+    def half_width(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        if self.count < 2:
+            return math.inf
+        # The variance comes from the acquisitions themselves, so small counts need the t quantile.
+        quantile = float(student_t.ppf(0.5 + confidence / 2.0, self.count - 1))
+        return quantile * math.sqrt(self.variance / self.count)
+
+    def relative_half_width(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        return self.half_width(confidence) / max(abs(self._mean), 1e-15)
+
+
+def predicted_relative_uncertainty(snr_db: float, z: float = DEFAULT_CONFIDENCE_Z) -> float:
+    # One acquisition: the in-band noise phasor scatters the tone by about 1/sqrt(SNR).
+    if not np.isfinite(snr_db):
+        return 0.0 if snr_db > 0 else math.inf
+    return z * 10.0 ** (-snr_db / 20.0)
+
+
+def needs_more_acquisitions(
+    stats: PhasorWelford,
+    first_snr_db: float,
+    target_relative: float,
+    max_acquisitions: int,
+) -> bool:
+    if stats.count >= max_acquisitions:
+        return False
+    if stats.count == 1:
+        return predicted_relative_uncertainty(first_snr_db) > target_relative
+    return stats.relative_half_width() > target_relative
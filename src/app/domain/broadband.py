@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import _WINDOW_CACHE
+
+CHIRP_DURATION_S = 1.0
+CHIRP_MAX_POINTS = 10_000_000
+CHIRP_RESOLUTION_BINS = 4
+CHIRP_SAMPLES_PER_CYCLE = 2.5
+NOISE_MIN_SEGMENT = 256
+NOISE_SEGMENTS_PER_RECORD = 8
+NOISE_BATCH_SEGMENTS = 32
+NOISE_ACQUISITIONS = 2
+
+
+@dataclass(slots=True)
+class ChirpPlan:
+    start_hz: float
+    stop_hz: float
+    duration_s: float
+    is_log: bool
+
+
+def chirp_sample_rate_hz(duration_s: float, sample_rate_hz: float, max_points: int = CHIRP_MAX_POINTS) -> float:
+    return min(max(float(sample_rate_hz), 1.0), max_points / float(duration_s))
+
+
+def plan_chirp(
+    freqs_hz: Sequence[float],
+    sample_rate_hz: float,
+    *,
+    is_log: bool,
+    duration_s: float = CHIRP_DURATION_S,
+    max_points: int = CHIRP_MAX_POINTS,
+) -> ChirpPlan:
+    freqs = np.unique(np.asarray(freqs_hz, dtype=float))
+    if freqs.size == 0 or float(freqs[0]) <= 0:
+        raise ValueError("Chirp needs positive sweep frequencies")
+    duration = float(duration_s)
+    resolution_hz = float(freqs[0])
+    if freqs.size > 1:
+        resolution_hz = min(resolution_hz, float(np.min(np.diff(freqs))))
+    if duration * resolution_hz < CHIRP_RESOLUTION_BINS:
+        raise ValueError(
+            f"A {duration:.6g} s chirp cannot resolve {resolution_hz:.6g} Hz; "
+            f"it needs at least {CHIRP_RESOLUTION_BINS / resolution_hz:.6g} s"
+        )
+    # Keep the duration the resolution needs and let the record fill it at a lower rate instead.
+    sample_rate = chirp_sample_rate_hz(duration, sample_rate_hz, max_points)
+    if sample_rate < CHIRP_SAMPLES_PER_CYCLE * float(freqs[-1]):
+        raise ValueError(
+            f"{max_points} points over {duration:.6g} s sample at {sample_rate:.6g} Hz, "
+            f"too slow for a chirp up to {float(freqs[-1]):.6g} Hz"
+        )
+    return ChirpPlan(
+        start_hz=float(freqs[0]),
+        stop_hz=float(freqs[-1]),
+        duration_s=duration,
+        is_log=bool(is_log),
+    )
+
+
+def synthesize_chirp(times: np.ndarray, plan: ChirpPlan) -> np.ndarray:
+    t = np.mod(np.asarray(times, dtype=float), plan.duration_s)
+    f0, f1, span = plan.start_hz, plan.stop_hz, plan.duration_s
+    if plan.is_log and f1 > f0:
+        rate = math.log(f1 / f0)
+        phase = 2.0 * np.pi * f0 * span / rate * np.expm1(rate * t / span)
+    else:
+        phase = 2.0 * np.pi * (f0 * t + 0.5 * (f1 - f0) * t * t / span)
+    return np.sin(phase)
+
+
+def _band_edges(freqs: np.ndarray, is_log: bool) -> np.ndarray:
+    if freqs.size == 1:
+        return np.array([0.0, np.inf])
+    mids = np.sqrt(freqs[:-1] * freqs[1:]) if is_log else 0.5 * (freqs[:-1] + freqs[1:])
+    return np.concatenate(([0.0], mids, [np.inf]))
+
+
+def band_transfer(
+    volts_out: np.ndarray,
+    volts_in: np.ndarray,
+    dt: float,
+    freqs_hz: Sequence[float],
+    *,
+    is_log: bool,
+    magnitude_only: bool = False,
+    smoothing_bins: int = 8,
+) -> np.ndarray:
+    freqs = np.asarray(freqs_hz, dtype=float)
+    n = min(len(volts_out), len(volts_in))
+    out = np.fft.rfft(volts_out[:n] - np.mean(volts_out[:n]))
+    inp = np.fft.rfft(volts_in[:n] - np.mean(volts_in[:n]))
+    bins_hz = np.fft.rfftfreq(n, d=dt)
+
+    # H1 per band: sum(Y X*) / sum(|X|^2) over at most +-smoothing_bins around each sweep frequency,
+    # never reaching into a neighbour's band.
+    edges = np.clip(np.searchsorted(bins_hz, _band_edges(freqs, is_log)), 0, bins_hz.size - 1)
+    nearest = np.clip(np.rint(freqs / bins_hz[1]).astype(int), 0, bins_hz.size - 1)
+    starts = np.minimum(np.maximum(edges[:-1], nearest - smoothing_bins), nearest)
+    stops = np.maximum(np.minimum(edges[1:], nearest + smoothing_bins + 1), nearest + 1)
+
+    auto = np.concatenate(([0.0], np.cumsum(np.abs(inp) ** 2)))
+    power_in = np.maximum(auto[stops] - auto[starts], 1e-30)
+    if magnitude_only:
+        # Without a time-aligned input only the band power ratio is meaningful.
+        power_out = np.concatenate(([0.0], np.cumsum(np.abs(out) ** 2)))
+        return np.sqrt((power_out[stops] - power_out[starts]) / power_in).astype(np.complex128)
+
+    cross = np.concatenate(([0.0], np.cumsum(out * np.conj(inp))))
+    return (cross[stops] - cross[starts]) / power_in
+
+
+def measure_chirp(
+    record_test: WaveformRecord,
+    record_ref: WaveformRecord | None,
+    freqs_hz: Sequence[float],
+    plan: ChirpPlan,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+) -> list[tuple[float, float, float | None, complex | None]]:
+    volts_test = record_test.volts
+    if record_ref is not None:
+        volts_ref = record_ref.volts
+        reported = True
+    else:
+        volts_ref = vin_peak * synthesize_chirp(record_test.times, plan)
+        reported = compute_phase
+
+    gain_complex = band_transfer(
+        volts_test, volts_ref, record_test.dt, freqs_hz, is_log=plan.is_log, magnitude_only=not reported
+    )
+    gain_linear = np.maximum(np.abs(gain_complex), 1e-15)
+    gain_db = 20.0 * np.log10(gain_linear)
+    phase_deg = np.degrees(np.angle(gain_complex))
+    return [
+        (
+            float(gain_linear[i]),
+            float(gain_db[i]),
+            float(phase_deg[i]) if reported else None,
+            complex(gain_complex[i]) if reported else None,
+        )
+        for i in range(gain_complex.size)
+    ]
+
+
+def noise_segment_length(freqs_hz: Sequence[float], sample_rate_hz: float, record_points: int) -> int:
+    freqs = np.sort(np.asarray(freqs_hz, dtype=float))
+    spacing = float(np.min(np.diff(freqs))) if freqs.size > 1 else float(freqs[0])
+    wanted = 2.0 * float(sample_rate_hz) / max(spacing, 1e-12)
+    nperseg = 1 << max(int(math.ceil(math.log2(max(wanted, 1.0)))), 0)
+    # With 50% overlap a record of n points yields about 2n/nperseg - 1 segments.
+    limit = max(NOISE_MIN_SEGMENT, 2 * int(record_points) // (NOISE_SEGMENTS_PER_RECORD + 1))
+    return int(min(max(nperseg, NOISE_MIN_SEGMENT), limit))
+
+
+class WelchH1:
+    def __init__(self, nperseg: int, dt: float, *, overlap: float = 0.5, batch: int = NOISE_BATCH_SEGMENTS) -> None:
+        self.nperseg = int(nperseg)
+        self._step = max(1, int(round(self.nperseg * (1.0 - overlap))))
+        self._batch = max(1, int(batch))
+        self._window = _WINDOW_CACHE.get(self.nperseg).window
+        self.freqs_hz = np.fft.rfftfreq(self.nperseg, dt)
+        self._pxx = np.zeros(self.freqs_hz.size)
+        self._pyy = np.zeros(self.freqs_hz.size)
+        self._pxy = np.zeros(self.freqs_hz.size, dtype=np.complex128)
+        self.segments = 0
+
+    def feed(self, volts_out: np.ndarray, volts_in: np.ndarray) -> None:
+        n = min(len(volts_out), len(volts_in))
+        if n < self.nperseg:
+            return
+        # Strided views over the records; only one batch of segments is materialised at a time.
+        out_segments = np.lib.stride_tricks.sliding_window_view(volts_out[:n], self.nperseg)[:: self._step]
+        in_segments = np.lib.stride_tricks.sliding_window_view(volts_in[:n], self.nperseg)[:: self._step]
+        for start in range(0, out_segments.shape[0], self._batch):
+            y = out_segments[start : start + self._batch]
+            x = in_segments[start : start + self._batch]
+            fy = np.fft.rfft((y - y.mean(axis=1, keepdims=True)) * self._window, axis=1)
+            fx = np.fft.rfft((x - x.mean(axis=1, keepdims=True)) * self._window, axis=1)
+            self._pxx += np.sum(np.abs(fx) ** 2, axis=0)
+            self._pyy += np.sum(np.abs(fy) ** 2, axis=0)
+            self._pxy += np.sum(fy * np.conj(fx), axis=0)
+            self.segments += fy.shape[0]
+
+    def transfer(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        if self.segments == 0:
+            raise ValueError("Record is shorter than one Welch segment")
+        pxx = np.maximum(self._pxx, 1e-30)
+        pyy = np.maximum(self._pyy, 1e-30)
+        h1 = self._pxy / pxx
+        coherence = np.clip(np.abs(self._pxy) ** 2 / (pxx * pyy), 0.0, 1.0)
+        return self.freqs_hz, h1, coherence
+
+
+def measure_noise(
+    records_test: Sequence[WaveformRecord],
+    records_ref: Sequence[WaveformRecord],
+    freqs_hz: Sequence[float],
+    nperseg: int,
+) -> tuple[list[tuple[float, float, float, complex]], np.ndarray, int]:
+    welch = WelchH1(nperseg, records_test[0].dt)
+    for record_test, record_ref in zip(records_test, records_ref):
+        welch.feed(record_test.volts, record_ref.volts)
+    bins_hz, h1, coherence = welch.transfer()
+
+    freqs = np.asarray(freqs_hz, dtype=float)
+    gain_complex = np.interp(freqs, bins_hz, h1.real) + 1j * np.interp(freqs, bins_hz, h1.imag)
+    coherence_at = np.interp(freqs, bins_hz, coherence)
+
+    gain_linear = np.maximum(np.abs(gain_complex), 1e-15)
+    gain_db = 20.0 * np.log10(gain_linear)
+    phase_deg = np.degrees(np.angle(gain_complex))
+    points = [
+        (float(gain_linear[i]), float(gain_db[i]), float(phase_deg[i]), complex(gain_complex[i]))
+        for i in range(freqs.size)
+    ]
+    return points, coherence_at, welch.segments
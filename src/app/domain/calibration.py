@@ -82,6 +82,7 @@ def build_reference_interpolator(curve: ReferenceCurve) -> Callable[[np.ndarray]
 def apply_reference_to_point(point: SweepPoint, ref_value: complex | float, use_phase: bool) -> SweepPoint:
     eps = 1e-12
     ref_abs = max(float(np.abs(ref_value)), eps)
+    gain_ci = point.gain_ci / ref_abs if point.gain_ci is not None else None
 
     if use_phase:
         if point.gain_complex is not None:
@@ -101,6 +102,8 @@ def apply_reference_to_point(point: SweepPoint, ref_value: complex | float, use_
             gain_db=gain_db,
             phase_deg=phase_deg,
             gain_complex=complex(corrected),
+            acquisitions=point.acquisitions,
+            gain_ci=gain_ci,
         )
 
     gain_linear = float(point.gain_linear / ref_abs)
@@ -111,4 +114,6 @@ def apply_reference_to_point(point: SweepPoint, ref_value: complex | float, use_
         gain_db=gain_db,
         phase_deg=point.phase_deg,
         gain_complex=point.gain_complex,
+        acquisitions=point.acquisitions,
+        gain_ci=gain_ci,
     )
@@ -33,3 +33,32 @@ class MagnitudePhaseMode(str, Enum):
     MAG = "magnitude"
     PHASE = "phase"
     MAG_AND_PHASE = "magnitude_phase"
+
+
+class DspExecutor(str, Enum):
+    INLINE = "inline"
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+class VerifyPolicy(str, Enum):
+    ALWAYS = "always"
+    EVERY_N = "every_n"
+    FIRST = "first"
+    TONE = "tone"
+
+
+class SweepMode(str, Enum):
+    STEPPED = "stepped"
+    MULTISINE = "multisine"
+    CHIRP = "chirp"
+    NOISE = "noise"
+    ADAPTIVE = "adaptive"
+
+
+class ToneEstimator(str, Enum):
+    FFT = "fft"
+    SINGLE_BIN = "single_bin"
+    COHERENT = "coherent"
+    SINE_FIT = "sine_fit"
+    ZOOM = "zoom"
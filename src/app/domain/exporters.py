@@ -26,6 +26,11 @@ def result_to_arrays(result: SweepResult) -> dict[str, np.ndarray]:
     if complex_values:
         arrays["gain_complex_real"] = np.array([v.real for v in complex_values], dtype=float)
         arrays["gain_complex_imag"] = np.array([v.imag for v in complex_values], dtype=float)
+    if any(p.acquisitions != 1 or p.gain_ci is not None for p in result.points):
+        arrays["acquisitions"] = np.array([p.acquisitions for p in result.points], dtype=float)
+        arrays["gain_ci"] = np.array(
+            [np.nan if p.gain_ci is None else p.gain_ci for p in result.points], dtype=float
+        )
     return arrays
 
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import bisect
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -9,12 +10,29 @@ from app.domain.enums import (
     ConnectionMode,
     CorrectionMode,
     CouplingMode,
+    DspExecutor,
     ImpedanceMode,
     MagnitudePhaseMode,
+    SweepMode,
+    ToneEstimator,
     TriggerMode,
+    VerifyPolicy,
 )
 
 
+@dataclass(slots=True)
+class SweepSegment:
+    start_hz: float
+    stop_hz: float
+    step_hz: float | None
+    step_count: int | None
+    is_log: bool
+    points_per_decade: float | None = None
+    record_points: int | None = None
+    full_scale_v: float | None = None
+    averages: int = 1
+
+
 @dataclass(slots=True)
 class SweepSpec:
     start_hz: float
@@ -22,6 +40,8 @@ class SweepSpec:
     step_hz: float | None
     step_count: int | None
     is_log: bool
+    points_per_decade: float | None = None
+    segments: list[SweepSegment] = field(default_factory=list)
 
 
 @dataclass(slots=True)
@@ -38,6 +58,20 @@ class RunMode:
     trigger_mode: TriggerMode
     auto_range: bool
     auto_reset: bool
+    estimator: ToneEstimator = ToneEstimator.FFT
+    sweep_mode: SweepMode = SweepMode.STEPPED
+    streaming: bool = False
+    dsp_executor: DspExecutor = DspExecutor.INLINE
+    max_in_flight: int = 4
+    adaptive_averaging: bool = False
+    target_uncertainty: float = 0.01
+    max_averages: int = 8
+    refine_tolerance_db: float = 1.0
+    refine_tolerance_deg: float = 10.0
+    refine_budget: int = 200
+    pipelined: bool = False
+    verify_policy: VerifyPolicy = VerifyPolicy.ALWAYS
+    verify_every: int = 10
 
 
 @dataclass(slots=True)
@@ -79,6 +113,8 @@ class SweepPoint:
     gain_db: float
     phase_deg: float | None = None
     gain_complex: complex | None = None
+    acquisitions: int = 1
+    gain_ci: float | None = None
 
 
 @dataclass(slots=True)
@@ -89,6 +125,12 @@ class SweepResult:
     def append(self, point: SweepPoint) -> None:
         self.points.append(point)
 
+    def insert_sorted(self, point: SweepPoint) -> None:
+        if not self.points or self.points[-1].freq_hz <= point.freq_hz:
+            self.points.append(point)
+            return
+        bisect.insort_right(self.points, point, key=lambda p: p.freq_hz)
+
     @property
     def is_empty(self) -> bool:
         return len(self.points) == 0
@@ -111,6 +153,52 @@ class SweepResult:
         return np.array(values, dtype=np.complex128)
 
 
+@dataclass(slots=True)
+class WaveformRecord:
+    codes: np.ndarray
+    scale: float
+    offset: float
+    t0: float
+    dt: float
+
+    def __len__(self) -> int:
+        return int(self.codes.size)
+
+    @property
+    def times(self) -> np.ndarray:
+        return self.t0 + self.dt * np.arange(self.codes.size, dtype=np.float64)
+
+    @property
+    def volts(self) -> np.ndarray:
+        return self.codes.astype(np.float64) * self.scale + self.offset
+
+    def volts_as(self, dtype: type = np.float32) -> np.ndarray:
+        return self.codes.astype(dtype) * dtype(self.scale) + dtype(self.offset)
+
+    def bounds(self) -> tuple[float, float]:
+        if self.codes.size == 0:
+            return float("nan"), float("nan")
+        lo = float(np.min(self.codes)) * self.scale + self.offset
+        hi = float(np.max(self.codes)) * self.scale + self.offset
+        return min(lo, hi), max(lo, hi)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.codes.nbytes)
+
+    @classmethod
+    def from_arrays(cls, times: np.ndarray, volts: np.ndarray) -> WaveformRecord:
+        times = np.asarray(times, dtype=np.float64)
+        dt = float((times[-1] - times[0]) / (times.size - 1)) if times.size > 1 else 1.0
+        return cls(
+            codes=np.asarray(volts, dtype=np.float64),
+            scale=1.0,
+            offset=0.0,
+            t0=float(times[0]) if times.size else 0.0,
+            dt=dt,
+        )
+
+
 @dataclass(slots=True)
 class ReferenceCurve:
     freq_hz: np.ndarray
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass, replace
+
+import numpy as np
+
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import _uniform_dft
+from app.domain.sweep_engine import compute_sampling_window_s
+
+DEFAULT_ARB_SAMPLES = 16_384
+DEFAULT_MAX_TONES = 32
+DEFAULT_BASE_DIVISOR = 64
+MULTISINE_MIN_PERIODS = 2
+MULTISINE_MAX_POINTS = 10_000_000
+MULTISINE_SAMPLES_PER_CYCLE = 2.5
+
+
+@dataclass(slots=True)
+class MultisineDesign:
+    base_hz: float
+    harmonics: np.ndarray
+    freqs_hz: np.ndarray
+    phases_rad: np.ndarray
+    samples: np.ndarray
+    tone_amplitude: float
+    crest_factor: float
+
+    def at_base(self, base_hz: float) -> MultisineDesign:
+        return replace(self, base_hz=float(base_hz), freqs_hz=self.harmonics * float(base_hz))
+
+
+def _common_base_hz(freqs: np.ndarray, divisor: int) -> float:
+    if freqs.size > 1:
+        gap = float(np.min(np.diff(freqs)))
+        ratios = freqs / gap
+        if gap > 0 and np.allclose(ratios, np.round(ratios), rtol=0.0, atol=1e-6):
+            return gap
+    return float(freqs[0]) / divisor
+
+
+def _synthesize(harmonics: np.ndarray, phases: np.ndarray, samples: int) -> np.ndarray:
+    spectrum = np.zeros(samples // 2 + 1, dtype=np.complex128)
+    spectrum[harmonics] = 0.5 * samples * np.exp(1j * (phases - 0.5 * np.pi))
+    return np.fft.irfft(spectrum, n=samples)
+
+
+def _crest_factor(x: np.ndarray) -> float:
+    rms = float(np.sqrt(np.mean(x * x)))
+    return float(np.max(np.abs(x))) / max(rms, 1e-15)
+
+
+def design_multisine(
+    freqs_hz: Sequence[float],
+    *,
+    samples: int = DEFAULT_ARB_SAMPLES,
+    base_divisor: int = DEFAULT_BASE_DIVISOR,
+    iterations: int = 20,
+) -> MultisineDesign:
+    freqs = np.sort(np.asarray(freqs_hz, dtype=float))
+    if freqs.size == 0 or freqs[0] <= 0:
+        raise ValueError("Multisine needs at least one positive frequency")
+
+    base_hz = _common_base_hz(freqs, base_divisor)
+    harmonics = np.maximum(np.round(freqs / base_hz).astype(int), 1)
+    if np.unique(harmonics).size != harmonics.size:
+        raise ValueError("Multisine tones collapse onto the same harmonic")
+    if harmonics[-1] >= samples // 2:
+        raise ValueError("Multisine harmonic exceeds the arbitrary waveform length")
+
+    # Schroeder phases, then clip-and-rephase iterations to push the crest factor down.
+    k = np.arange(harmonics.size)
+    phases = -np.pi * k * (k + 1) / harmonics.size
+    x = _synthesize(harmonics, phases, samples)
+    best_phases, best_crest = phases, _crest_factor(x)
+
+    for _ in range(iterations):
+        limit = 0.9 * float(np.max(np.abs(x)))
+        spectrum = np.fft.rfft(np.clip(x, -limit, limit))
+        phases = np.angle(spectrum[harmonics]) + 0.5 * np.pi
+        x = _synthesize(harmonics, phases, samples)
+        crest = _crest_factor(x)
+        if crest < best_crest:
+            best_phases, best_crest = phases, crest
+
+    x = _synthesize(harmonics, best_phases, samples)
+    peak = float(np.max(np.abs(x)))
+    return MultisineDesign(
+        base_hz=base_hz,
+        harmonics=harmonics,
+        freqs_hz=harmonics * base_hz,
+        phases_rad=np.mod(best_phases, 2.0 * np.pi),
+        samples=x / peak,
+        tone_amplitude=1.0 / peak,
+        crest_factor=best_crest,
+    )
+
+
+def plan_multisine_blocks(
+    freqs_hz: Sequence[float],
+    *,
+    max_tones: int = DEFAULT_MAX_TONES,
+    samples: int = DEFAULT_ARB_SAMPLES,
+    base_divisor: int = DEFAULT_BASE_DIVISOR,
+    oversample: int = 8,
+) -> list[np.ndarray]:
+    freqs = np.asarray(freqs_hz, dtype=float)
+    max_harmonic = samples // (2 * oversample)
+
+    blocks: list[np.ndarray] = []
+    start = 0
+    while start < freqs.size:
+        stop = start + 1
+        while stop < freqs.size and stop - start < max_tones:
+            candidate = np.sort(freqs[start : stop + 1])
+            base_hz = _common_base_hz(candidate, base_divisor)
+            harmonics = np.round(candidate / base_hz)
+            if harmonics[-1] > max_harmonic or np.unique(harmonics).size != harmonics.size:
+                break
+            stop += 1
+        blocks.append(freqs[start:stop])
+        start = stop
+    return blocks
+
+
+def multisine_capture(
+    design: MultisineDesign,
+    sample_rate_hz: float,
+    points: int,
+    *,
+    max_points: int = MULTISINE_MAX_POINTS,
+) -> tuple[float, float]:
+    window_s = compute_sampling_window_s(
+        freq_hz=design.base_hz,
+        sample_rate_hz=sample_rate_hz,
+        points=points,
+        min_cycles=MULTISINE_MIN_PERIODS,
+        max_points=0,
+    )
+    # Hold whole base periods even if the record has to fill the window at a lower rate.
+    sample_rate = min(max(float(sample_rate_hz), 1.0), max_points / window_s)
+    top_hz = float(design.freqs_hz[-1])
+    if sample_rate < MULTISINE_SAMPLES_PER_CYCLE * top_hz:
+        raise ValueError(
+            f"{MULTISINE_MIN_PERIODS} periods of {design.base_hz:.6g} Hz in {max_points} points "
+            f"sample at {sample_rate:.6g} Hz, too slow for a tone at {top_hz:.6g} Hz"
+        )
+    return window_s, sample_rate
+
+
+def _tone_phasors(record: WaveformRecord, design: MultisineDesign) -> np.ndarray:
+    volts = record.volts
+    periods = int(math.floor(len(volts) * record.dt * design.base_hz + 1e-6))
+    if periods < 1:
+        raise ValueError(f"Record is shorter than one {design.base_hz:.6g} Hz multisine period")
+    n = min(len(volts), int(round(periods / (design.base_hz * record.dt))))
+    segment = volts[:n]
+    tones, _energy = _uniform_dft(
+        segment, float(np.mean(segment)), design.freqs_hz, record.t0, record.dt, rectangular=True
+    )
+    return 2.0 * tones / n
+
+
+def measure_multisine(
+    record_test: WaveformRecord,
+    record_ref: WaveformRecord | None,
+    design: MultisineDesign,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+) -> list[tuple[float, float, float | None, complex | None]]:
+    phasor_test = _tone_phasors(record_test, design)
+    if record_ref is not None:
+        phasor_ref = _tone_phasors(record_ref, design)
+        gain_complex = phasor_test / np.where(np.abs(phasor_ref) > 1e-15, phasor_ref, 1e-15)
+        reported = np.ones(gain_complex.size, dtype=bool)
+    else:
+        # Each tone leaves the AWG as tone_amplitude * sin(2 pi f t + phase) of the panel peak,
+        # i.e. a cosine phasor at phase - pi/2.
+        tone_peak = max(vin_peak * design.tone_amplitude, 1e-15)
+        gain_complex = phasor_test * np.exp(-1j * (design.phases_rad - 0.5 * np.pi)) / tone_peak
+        reported = np.full(gain_complex.size, compute_phase)
+
+    gain_linear = np.maximum(np.abs(gain_complex), 1e-15)
+    gain_db = 20.0 * np.log10(gain_linear)
+    phase_deg = np.degrees(np.angle(gain_complex))
+    return [
+        (
+            float(gain_linear[i]),
+            float(gain_db[i]),
+            float(phase_deg[i]) if reported[i] else None,
+            complex(gain_complex[i]) if reported[i] else None,
+        )
+        for i in range(gain_complex.size)
+    ]
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import numpy as np
+
+REFINE_MIN_RELATIVE_SPAN = 1e-4
+
+
+def refinement_candidates(
+    freqs_hz: np.ndarray,
+    gain_db: np.ndarray,
+    phase_deg: np.ndarray | None,
+    *,
+    tol_db: float,
+    tol_deg: float,
+    is_log: bool,
+    min_relative_span: float = REFINE_MIN_RELATIVE_SPAN,
+) -> np.ndarray:
+    freqs = np.asarray(freqs_hz, dtype=float)
+    if freqs.size < 2:
+        return np.empty(0)
+    order = np.argsort(freqs, kind="stable")
+    freqs = freqs[order]
+
+    severity = np.abs(np.diff(np.asarray(gain_db, dtype=float)[order])) / tol_db
+    if phase_deg is not None and len(phase_deg) == freqs.size:
+        step = np.diff(np.asarray(phase_deg, dtype=float)[order])
+        wrapped = np.abs((step + 180.0) % 360.0 - 180.0)
+        severity = np.maximum(severity, wrapped / tol_deg)
+
+    lo, hi = freqs[:-1], freqs[1:]
+    wide = (hi - lo) > min_relative_span * hi
+    mids = np.sqrt(lo * hi) if is_log else 0.5 * (lo + hi)
+
+    # Worst intervals first so a tight budget is spent where the curve moves most.
+    keep = np.flatnonzero((severity > 1.0) & wide)
+    return mids[keep[np.argsort(-severity[keep], kind="stable")]]
@@ -1,9 +1,98 @@
 from __future__ import annotations
 
 import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 
 import numpy as np
 
+from app.domain.enums import ToneEstimator
+from app.domain.models import WaveformRecord
+from app.domain.sweep_engine import COHERENT_TOLERANCE_CYCLES
+
+_DFT_CHUNK = 65_536
+_ROW_ESTIMATORS = (ToneEstimator.SINGLE_BIN, ToneEstimator.COHERENT, ToneEstimator.ZOOM)
+TONE_FIT_POINTS = 65_536
+FIT_PHASE_TOLERANCE_RAD = 1e-6
+WINDOW_CACHE_BYTES = 64 * 1024 * 1024
+COHERENT_SEARCH_CYCLES = 4096
+
+_WINDOW_BUILDERS = {
+    "hann": np.hanning,
+    "rect": np.ones,
+}
+
+
+@dataclass(slots=True)
+class WindowPlan:
+    window: np.ndarray
+    coherent_gain: float
+    energy: float
+
+
+class WindowCache:
+    def __init__(self, max_bytes: int = WINDOW_CACHE_BYTES) -> None:
+        self._max_bytes = max(0, int(max_bytes))
+        self._entries: OrderedDict[tuple[int, str], WindowPlan] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, n: int, kind: str = "hann") -> WindowPlan:
+        key = (int(n), kind)
+        with self._lock:
+            plan = self._entries.get(key)
+            if plan is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return plan
+            self.misses += 1
+
+        window = _WINDOW_BUILDERS[kind](int(n)).astype(float)
+        window.setflags(write=False)
+        plan = WindowPlan(
+            window=window,
+            coherent_gain=float(np.sum(window)),
+            energy=float(np.sum(window**2)),
+        )
+        if window.nbytes > self._max_bytes:
+            return plan
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.window.nbytes
+            self._entries[key] = plan
+            self._bytes += window.nbytes
+            while self._bytes > self._max_bytes:
+                _key, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.window.nbytes
+        return plan
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries), "bytes": self._bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+
+_WINDOW_CACHE = WindowCache()
+
+
+def window_cache_stats() -> dict[str, int]:
+    return _WINDOW_CACHE.stats()
+
+
+def clear_window_cache() -> None:
+    _WINDOW_CACHE.clear()
+
 
 def calc_vin_peak(vpp_panel: float, awg_impedance: str, osc_impedance: str) -> float:
     source_r = 50.0
@@ -26,60 +115,543 @@ def _parabolic_interp_delta(m1: float, m0: float, p1: float) -> float:
     return 0.5 * (m1_ln - p1_ln) / denominator
 
 
-def _complex_tone_at(times: np.ndarray, volts_ac: np.ndarray, f_hz: float, window: np.ndarray) -> complex:
-    return np.sum(window * volts_ac * np.exp(-1j * 2.0 * np.pi * f_hz * times))
+def _uniform_time_base(times: np.ndarray) -> tuple[float, float] | None:
+    n = len(times)
+    if n < 2:
+        return None
+    t0 = float(times[0])
+    dt = float(times[1] - times[0])
+    if dt <= 0:
+        return None
+    tol = abs(dt) * 1e-3
+    if abs(float(times[-1]) - (t0 + dt * (n - 1))) > tol:
+        return None
+    mid = n // 2
+    if abs(float(times[mid]) - (t0 + dt * mid)) > tol:
+        return None
+    return t0, dt
+
+
+def _record_base(record: WaveformRecord) -> tuple[float, float] | None:
+    if len(record) < 2 or record.dt <= 0:
+        return None
+    return record.t0, record.dt
+
+
+def _sample_chunk(samples: np.ndarray | WaveformRecord, start: int, stop: int) -> np.ndarray:
+    # Records stay as raw codes; only the chunk being worked on is scaled to volts.
+    if isinstance(samples, WaveformRecord):
+        return samples.codes[start:stop].astype(np.float64) * samples.scale + samples.offset
+    return samples[start:stop]
+
+
+def _sample_mean(samples: np.ndarray | WaveformRecord) -> float:
+    if isinstance(samples, WaveformRecord):
+        return float(np.mean(samples.codes, dtype=np.float64)) * samples.scale + samples.offset
+    return float(np.mean(samples))
 
 
-def _windowed_fft(times: np.ndarray, volts: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, int, int, int]:
-    volts_ac = volts - np.mean(volts)
-    window = np.hanning(len(volts_ac))
-    fft_values = np.fft.rfft(window * volts_ac)
-    return volts_ac, window, fft_values, len(volts_ac), 0, len(fft_values)
+def _sample_head(samples: np.ndarray | WaveformRecord, n: int) -> np.ndarray | WaveformRecord:
+    if isinstance(samples, WaveformRecord):
+        return WaveformRecord(
+            codes=samples.codes[:n], scale=samples.scale, offset=samples.offset, t0=samples.t0, dt=samples.dt
+        )
+    return samples[:n]
 
 
-def _tone_metrics(times: np.ndarray, volts: np.ndarray, target_hz: float) -> tuple[float, float, complex, np.ndarray, int, int]:
-    volts_ac = volts - np.mean(volts)
-    window = np.hanning(len(volts_ac))
-    spectrum = np.fft.rfft(window * volts_ac)
-    freqs = np.fft.rfftfreq(len(volts_ac), times[1] - times[0])
+def _as_volts(samples: np.ndarray | WaveformRecord) -> np.ndarray:
+    return samples.volts if isinstance(samples, WaveformRecord) else samples
 
-    k0 = int(np.argmin(np.abs(freqs - target_hz)))
+
+def _uniform_dft(
+    volts: np.ndarray | WaveformRecord,
+    mean: float,
+    freqs_hz: np.ndarray,
+    t0: float,
+    dt: float,
+    *,
+    window: np.ndarray | None = None,
+    rectangular: bool = False,
+    dtype: type = np.complex128,
+) -> tuple[np.ndarray, float]:
+    # sum_n w[n] * (x[n] - mean) * exp(-j 2 pi f (t0 + n dt)), one bounded chunk at a time.
+    n = len(volts)
+    freqs = np.asarray(freqs_hz, dtype=float)
+    span = min(_DFT_CHUNK, n)
+    kernel = np.exp(-2j * np.pi * np.outer(freqs, np.arange(span) * dt)).astype(dtype)
+
+    acc = np.zeros(freqs.size, dtype=np.complex128)
+    energy = 0.0
+    for start in range(0, n, span):
+        stop = min(start + span, n)
+        if rectangular:
+            w = np.ones(stop - start, dtype=float)
+        else:
+            w = _hann_segment(start, stop, n) if window is None else window[start:stop]
+        energy += float(np.dot(w, w))
+        segment = w * (_sample_chunk(volts, start, stop) - mean)
+        if dtype == np.complex64:
+            segment = segment.astype(np.complex64 if np.iscomplexobj(segment) else np.float32)
+        rotation = np.exp(-2j * np.pi * freqs * (t0 + start * dt))
+        acc += rotation * (kernel[:, : stop - start] @ segment)
+    return acc, energy
+
+
+def _complex_tone_at(
+    times: np.ndarray,
+    volts_ac: np.ndarray,
+    f_hz: float,
+    window: np.ndarray,
+    *,
+    dtype: type = np.complex128,
+    base: tuple[float, float] | None = None,
+) -> complex:
+    base = base if base is not None else _uniform_time_base(times)
+    if base is not None:
+        tone, _energy = _uniform_dft(volts_ac, 0.0, np.array([f_hz]), base[0], base[1], window=window, dtype=dtype)
+        return complex(tone[0])
+
+    acc = 0j
+    for start in range(0, len(volts_ac), _DFT_CHUNK):
+        stop = min(start + _DFT_CHUNK, len(volts_ac))
+        kernel = np.exp(-1j * 2.0 * np.pi * f_hz * times[start:stop]).astype(dtype)
+        acc += complex(np.dot(kernel, window[start:stop] * volts_ac[start:stop]))
+    return acc
+
+
+def _hann_segment(start: int, stop: int, n: int) -> np.ndarray:
+    if n <= 1:
+        return np.ones(stop - start, dtype=float)
+    idx = np.arange(start, stop, dtype=float)
+    return 0.5 - 0.5 * np.cos(2.0 * np.pi * idx / (n - 1))
+
+
+def _chunked_dft(
+    times: np.ndarray,
+    volts: np.ndarray,
+    mean: float,
+    freqs_hz: np.ndarray,
+    *,
+    t_origin: float = 0.0,
+) -> tuple[np.ndarray, float]:
+    base = _uniform_time_base(times)
+    if base is not None:
+        return _uniform_dft(volts, mean, freqs_hz, base[0] - t_origin, base[1])
+
+    n = len(volts)
+    freqs = np.asarray(freqs_hz, dtype=float)
+    acc = np.zeros(freqs.size, dtype=np.complex128)
+    energy = 0.0
+    for start in range(0, n, _DFT_CHUNK):
+        stop = min(start + _DFT_CHUNK, n)
+        window = _hann_segment(start, stop, n)
+        energy += float(np.dot(window, window))
+        segment = window * (volts[start:stop] - mean)
+        kernel = np.exp(-2j * np.pi * np.outer(freqs, times[start:stop] - t_origin))
+        acc += kernel @ segment
+    return acc, energy
+
+
+def _single_bin_tone_metrics(
+    times: np.ndarray | None,
+    volts: np.ndarray | WaveformRecord,
+    target_hz: float,
+    *,
+    base: tuple[float, float] | None = None,
+) -> tuple[float, float, complex, np.ndarray, int, int]:
+    n = len(volts)
+    base = base if base is not None else _uniform_time_base(times)
+    dt = base[1] if base is not None else times[1] - times[0]
+    bin_hz = 1.0 / (n * dt)
+    n_bins = n // 2 + 1
+
+    k0 = int(min(max(round(target_hz / bin_hz), 0), n_bins - 1))
     lo = max(0, k0 - 2)
-    hi = min(len(spectrum), k0 + 3)
+    hi = min(n_bins, k0 + 3)
+
+    mean = _sample_mean(volts)
+    if base is not None:
+        band, energy = _uniform_dft(volts, mean, np.arange(lo, hi) * bin_hz, 0.0, dt)
+    else:
+        band, energy = _chunked_dft(times, volts, mean, np.arange(lo, hi) * bin_hz, t_origin=times[0])
 
-    band_energy = np.sum(np.abs(spectrum[lo:hi]) ** 2)
-    amplitude_peak = (2.0 / np.sqrt(np.sum(window**2) * len(volts_ac))) * np.sqrt(max(band_energy, 1e-30))
+    band_energy = float(np.sum(np.abs(band) ** 2))
+    amplitude_peak = (2.0 / np.sqrt(energy * n)) * np.sqrt(max(band_energy, 1e-30))
 
-    mags = np.abs(spectrum)
-    if 1 <= k0 <= mags.size - 2:
-        delta = _parabolic_interp_delta(mags[k0 - 1], mags[k0], mags[k0 + 1])
+    if 1 <= k0 <= n_bins - 2:
+        mags = np.abs(band[k0 - 1 - lo : k0 + 2 - lo])
+        delta = _parabolic_interp_delta(mags[0], mags[1], mags[2])
     else:
         delta = 0.0
+    f_hat = (k0 + delta) * bin_hz
 
-    if freqs.size > 1:
-        f_hat = freqs[k0] + delta * (freqs[1] - freqs[0])
+    if base is not None:
+        tone, _energy = _uniform_dft(volts, mean, np.array([f_hat]), base[0], dt)
     else:
-        f_hat = freqs[k0]
+        tone, _energy = _chunked_dft(times, volts, mean, np.array([f_hat]))
+    if abs(tone[0]) < 1e-15:
+        angle = np.angle(np.sum(band))
+    else:
+        angle = np.angle(tone[0])
+
+    phasor = amplitude_peak * np.exp(1j * angle)
+    return amplitude_peak, float(np.degrees(angle)), phasor, band, 0, len(band)
+
+
+def _coherent_tone_metrics(
+    times: np.ndarray | None,
+    volts: np.ndarray | WaveformRecord,
+    target_hz: float,
+    *,
+    base: tuple[float, float] | None = None,
+) -> tuple[float, float, complex, np.ndarray, int, int] | None:
+    base = base if base is not None else _uniform_time_base(times)
+    if base is None or target_hz <= 0:
+        return None
+
+    t0, dt = base
+    samples_per_cycle = 1.0 / (target_hz * dt)
+    max_cycles = int(math.floor(len(volts) / samples_per_cycle + 1e-6))
+    if max_cycles < 1:
+        return None
+    # Replan from the record's own dt: the capture may not be the one the sweep planned for.
+    cycles = np.arange(max_cycles, max(0, max_cycles - COHERENT_SEARCH_CYCLES), -1)
+    points = np.minimum(np.rint(cycles * samples_per_cycle), len(volts))
+    within = np.flatnonzero(np.abs(points / samples_per_cycle - cycles) <= COHERENT_TOLERANCE_CYCLES)
+    if within.size == 0:
+        return None
+    n = int(points[within[0]])
+
+    segment = _sample_head(volts, n)
+    mean = _sample_mean(segment)
+    tone, _energy = _uniform_dft(segment, mean, np.array([target_hz]), t0, dt, rectangular=True)
+
+    amplitude_peak = 2.0 * abs(tone[0]) / n
+    angle = float(np.angle(tone[0]))
+    phasor = amplitude_peak * np.exp(1j * angle)
+    return amplitude_peak, float(np.degrees(angle)), phasor, tone, 0, 1
+
 
-    tone = _complex_tone_at(times, volts_ac, f_hat, window)
-    if abs(tone) < 1e-15:
-        angle = np.angle(np.sum(spectrum[lo:hi]))
+def _zoom_tone_metrics(
+    times: np.ndarray | None,
+    volts: np.ndarray | WaveformRecord,
+    target_hz: float,
+    *,
+    oversample: int = 16,
+    min_baseband_points: int = 64,
+    base: tuple[float, float] | None = None,
+) -> tuple[float, float, complex, np.ndarray, int, int] | None:
+    base = base if base is not None else _uniform_time_base(times)
+    if base is None or target_hz <= 0:
+        return None
+
+    t0, dt = base
+    n = len(volts)
+    factor = int(max(1, min(1.0 / (dt * oversample * target_hz), n // min_baseband_points)))
+    m = n // factor
+    # Without real decimation the boxcar cannot reject the 2f image, so leave it to the single-bin path.
+    if factor <= 2 or m < 8:
+        return None
+
+    # Heterodyne to DC and block-average by `factor`; the boxcar nulls land on multiples of
+    # the baseband rate, so nothing but the chunk and the short baseband record is allocated.
+    mean = _sample_mean(volts)
+    span = max(factor, (_DFT_CHUNK // factor) * factor)
+    kernel = np.exp(-2j * np.pi * target_hz * dt * np.arange(span))
+    baseband = np.empty(m, dtype=np.complex128)
+    for start in range(0, m * factor, span):
+        stop = min(start + span, m * factor)
+        rotation = np.exp(-2j * np.pi * target_hz * (t0 + start * dt))
+        mixed = (_sample_chunk(volts, start, stop) - mean) * kernel[: stop - start] * rotation
+        baseband[start // factor : stop // factor] = mixed.reshape(-1, factor).mean(axis=1)
+
+    plan = _WINDOW_CACHE.get(m)
+    spectrum = np.fft.fft(baseband * plan.window)
+    band = spectrum[np.arange(-2, 3) % m]
+
+    band_energy = float(np.sum(np.abs(band) ** 2))
+    amplitude_peak = (2.0 / np.sqrt(plan.energy * m)) * np.sqrt(max(band_energy, 1e-30))
+
+    mags = np.abs(band[1:4])
+    delta = _parabolic_interp_delta(mags[0], mags[1], mags[2])
+    offset_hz = delta / (m * factor * dt)
+
+    center_t0 = t0 + 0.5 * (factor - 1) * dt
+    tone, _energy = _uniform_dft(baseband, 0.0, np.array([offset_hz]), center_t0, factor * dt, window=plan.window)
+    if abs(tone[0]) < 1e-15:
+        angle = np.angle(np.sum(band))
     else:
-        angle = np.angle(tone)
+        angle = np.angle(tone[0])
 
     phasor = amplitude_peak * np.exp(1j * angle)
-    return amplitude_peak, float(np.degrees(angle)), phasor, spectrum, lo, hi
+    return amplitude_peak, float(np.degrees(angle)), phasor, band, 0, len(band)
 
 
-def measure_single_channel(
+class StreamingToneAccumulator:
+    def __init__(self, target_hz: float, points: int, t0: float, dt: float) -> None:
+        self._n = int(points)
+        self._t0 = float(t0)
+        self._dt = float(dt)
+        self.target_hz = float(target_hz)
+
+        bin_hz = 1.0 / (self._n * self._dt)
+        n_bins = self._n // 2 + 1
+        self._k0 = int(min(max(round(self.target_hz / bin_hz), 0), n_bins - 1))
+        self._n_bins = n_bins
+        self._bin_hz = bin_hz
+        lo = max(0, self._k0 - 2)
+        hi = min(n_bins, self._k0 + 3)
+        self._lo = lo
+
+        # Band bins are referenced to the first sample (rfft convention); the last entry is the
+        # stimulus tone on the absolute time axis, which carries the reported phase.
+        self._freqs = np.append(np.arange(lo, hi) * bin_hz, self.target_hz)
+        self._origins = np.append(np.full(hi - lo, self._t0), 0.0)
+        self._kernel = np.empty((self._freqs.size, 0), dtype=np.complex128)
+
+        self._position = 0
+        self._sum_x = 0.0
+        self._energy = 0.0
+        self._acc_x = np.zeros(self._freqs.size, dtype=np.complex128)
+        self._acc_w = np.zeros(self._freqs.size, dtype=np.complex128)
+        self.vmin = math.inf
+        self.vmax = -math.inf
+
+    @property
+    def points_fed(self) -> int:
+        return self._position
+
+    def feed(self, block: np.ndarray) -> None:
+        values = np.asarray(block, dtype=float)
+        count = min(values.size, self._n - self._position)
+        if count <= 0:
+            return
+        values = values[:count]
+
+        if self._kernel.shape[1] < count:
+            self._kernel = np.exp(-2j * np.pi * np.outer(self._freqs, np.arange(count) * self._dt))
+
+        start = self._position
+        window = _hann_segment(start, start + count, self._n)
+        elapsed = self._t0 + start * self._dt - self._origins
+        rotation = np.exp(-2j * np.pi * self._freqs * elapsed)
+        kernel = self._kernel[:, :count]
+
+        self._acc_x += rotation * (kernel @ (window * values))
+        self._acc_w += rotation * (kernel @ window)
+        self._sum_x += float(np.sum(values))
+        self._energy += float(np.dot(window, window))
+        self.vmin = min(self.vmin, float(np.min(values)))
+        self.vmax = max(self.vmax, float(np.max(values)))
+        self._position += count
+
+    def result(self) -> tuple[float, float, complex, np.ndarray]:
+        if self._position == 0:
+            raise ValueError("No waveform samples were fed")
+
+        mean = self._sum_x / self._position
+        values = self._acc_x - mean * self._acc_w
+        band = values[:-1]
+
+        band_energy = float(np.sum(np.abs(band) ** 2))
+        amplitude_peak = (2.0 / np.sqrt(max(self._energy, 1e-30) * self._position)) * np.sqrt(
+            max(band_energy, 1e-30)
+        )
+
+        tone = values[-1]
+        angle = np.angle(np.sum(band)) if abs(tone) < 1e-15 else np.angle(tone)
+        phasor = amplitude_peak * np.exp(1j * angle)
+        return amplitude_peak, float(np.degrees(angle)), phasor, band
+
+
+def sine_fit(
     times: np.ndarray,
     volts: np.ndarray,
     target_hz: float,
-    vin_peak: float,
     *,
+    fit_frequency: bool = True,
+    iterations: int = 8,
+    strict: bool = False,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, float]:
+    # IEEE-1057 least-squares fit of a*cos(wt) + b*sin(wt) + c per row. The 4-parameter
+    # variant refines one frequency shared by all rows, which share the same stimulus.
+    t = np.asarray(times, dtype=float)
+    rows = np.atleast_2d(np.asarray(volts, dtype=float))
+    omega = 2.0 * np.pi * float(target_hz)
+
+    def solve_linear(w: float) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        basis = np.column_stack([np.cos(w * t), np.sin(w * t), np.ones_like(t)])
+        gram_inv = np.linalg.pinv(basis.T @ basis)
+        projections = basis.T @ rows.T
+        return basis, gram_inv, gram_inv @ projections
+
+    basis, gram_inv, params = solve_linear(omega)
+    span = float(t[-1] - t[0]) if t.size > 1 else 0.0
+    converged = not fit_frequency
+    if fit_frequency:
+        for _ in range(max(0, int(iterations))):
+            a, b = params[0], params[1]
+            slope = t * (b[:, np.newaxis] * basis[:, 0] - a[:, np.newaxis] * basis[:, 1])
+            coupling = basis.T @ slope.T
+            rhs = basis.T @ rows.T
+            numerator = np.sum(np.einsum("nr,rn->r", slope.T, rows) - np.einsum("ir,ij,jr->r", coupling, gram_inv, rhs))
+            denominator = np.sum(np.einsum("rn,rn->r", slope, slope) - np.einsum("ir,ij,jr->r", coupling, gram_inv, coupling))
+            if denominator <= 0:
+                break
+            d_omega = numerator / denominator
+            if not np.isfinite(d_omega) or abs(d_omega) > 0.5 * omega:
+                break
+            omega += d_omega
+            basis, gram_inv, params = solve_linear(omega)
+            # Converged once the step no longer moves the phase across the record.
+            converged = abs(d_omega) * span <= FIT_PHASE_TOLERANCE_RAD
+            if abs(d_omega) <= 1e-12 * omega:
+                break
+    if strict and not converged:
+        raise ValueError(f"Sine fit did not converge near {target_hz:.6g} Hz")
+
+    phasor = params[0] - 1j * params[1]
+    amplitude = np.abs(phasor)
+    return amplitude, np.degrees(np.angle(phasor)), phasor, omega / (2.0 * np.pi)
+
+
+def _shares_time_base(times_a: np.ndarray, times_b: np.ndarray) -> bool:
+    if times_a is times_b:
+        return True
+    return times_a.shape == times_b.shape and bool(np.array_equal(times_a, times_b))
+
+
+def _tone_metrics_batch(
+    times: np.ndarray | None,
+    volts: np.ndarray,
+    target_hz: float,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+    phasor_dtype: type = np.complex128,
+    *,
+    base: tuple[float, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, int, int]:
+    rows = np.atleast_2d(np.asarray(volts, dtype=float))
+    base = base if base is not None else _uniform_time_base(times)
+    if estimator in _ROW_ESTIMATORS:
+        metrics = [_tone_metrics(times, row, target_hz, estimator, base=base) for row in rows]
+        return (
+            np.array([m[0] for m in metrics], dtype=float),
+            np.array([m[1] for m in metrics], dtype=float),
+            np.array([m[2] for m in metrics], dtype=np.complex128),
+            np.vstack([m[3] for m in metrics]),
+            metrics[0][4],
+            metrics[0][5],
+        )
+    n = rows.shape[1]
+    if times is None:
+        times = base[0] + base[1] * np.arange(n, dtype=np.float64)
+    if estimator == ToneEstimator.SINE_FIT:
+        amplitude, phase_deg, phasor, _freq_hz = sine_fit(times, rows, target_hz)
+        return amplitude, phase_deg, phasor, phasor[:, np.newaxis], 0, 1
+
+    plan = _WINDOW_CACHE.get(n)
+    window = plan.window
+    bin_hz = 1.0 / (n * (base[1] if base is not None else times[1] - times[0]))
+    volts_ac = rows - np.mean(rows, axis=1, keepdims=True)
+    spectrum = np.fft.rfft(volts_ac * window, axis=1)
+
+    k0 = min(max(int(round(target_hz / bin_hz)), 0), spectrum.shape[1] - 1)
+    lo = max(0, k0 - 2)
+    hi = min(spectrum.shape[1], k0 + 3)
+
+    band_energy = np.sum(np.abs(spectrum[:, lo:hi]) ** 2, axis=1)
+    amplitude_peak = (2.0 / np.sqrt(plan.energy * n)) * np.sqrt(np.maximum(band_energy, 1e-30))
+
+    phase_deg = np.empty(rows.shape[0], dtype=float)
+    phasor = np.empty(rows.shape[0], dtype=np.complex128)
+    for row in range(rows.shape[0]):
+        if 1 <= k0 <= spectrum.shape[1] - 2:
+            mags = np.abs(spectrum[row, k0 - 1 : k0 + 2])
+            delta = _parabolic_interp_delta(mags[0], mags[1], mags[2])
+        else:
+            delta = 0.0
+        f_hat = (k0 + delta) * bin_hz
+
+        tone = _complex_tone_at(times, volts_ac[row], f_hat, window, dtype=phasor_dtype, base=base)
+        if abs(tone) < 1e-15:
+            angle = np.angle(np.sum(spectrum[row, lo:hi]))
+        else:
+            angle = np.angle(tone)
+
+        phase_deg[row] = np.degrees(angle)
+        phasor[row] = amplitude_peak[row] * np.exp(1j * angle)
+
+    return amplitude_peak, phase_deg, phasor, spectrum, lo, hi
+
+
+def _tone_metrics(
+    times: np.ndarray | None,
+    volts: np.ndarray | WaveformRecord,
+    target_hz: float,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+    *,
+    base: tuple[float, float] | None = None,
+) -> tuple[float, float, complex, np.ndarray, int, int]:
+    # `times` may be None when a uniform `base` is given; records then stay as raw codes.
+    base = base if base is not None else _uniform_time_base(times)
+    if estimator == ToneEstimator.SINGLE_BIN:
+        return _single_bin_tone_metrics(times, volts, target_hz, base=base)
+    if estimator == ToneEstimator.COHERENT:
+        metrics = _coherent_tone_metrics(times, volts, target_hz, base=base)
+        if metrics is not None:
+            return metrics
+        estimator = ToneEstimator.FFT
+    if estimator == ToneEstimator.ZOOM:
+        metrics = _zoom_tone_metrics(times, volts, target_hz, base=base)
+        if metrics is not None:
+            return metrics
+        return _single_bin_tone_metrics(times, volts, target_hz, base=base)
+    amplitude, phase_deg, phasor, spectrum, lo, hi = _tone_metrics_batch(
+        times, _as_volts(volts), target_hz, estimator, base=base
+    )
+    return float(amplitude[0]), float(phase_deg[0]), complex(phasor[0]), spectrum[0], lo, hi
+
+
+def _gain_from_phasors(
+    amp_test: float,
+    phasor_test: complex,
+    band_test: np.ndarray,
+    amp_ref: float,
+    phasor_ref: complex,
+    band_ref: np.ndarray,
+) -> tuple[float, float, float, complex]:
+    if abs(phasor_test) < 1e-15 or abs(phasor_ref) < 1e-15:
+        phasor_test = amp_test * np.exp(1j * np.angle(np.sum(band_test)))
+        phasor_ref = amp_ref * np.exp(1j * np.angle(np.sum(band_ref)))
+
+    gain_complex = phasor_test / (phasor_ref if abs(phasor_ref) > 1e-15 else 1e-15 + 0j)
+    gain_linear = max(abs(gain_complex), 1e-15)
+    gain_db = 20.0 * math.log10(gain_linear)
+    phase_deg = float(np.degrees(np.angle(gain_complex)))
+    return gain_linear, gain_db, phase_deg, gain_complex
+
+
+def measure_tones(
+    times: np.ndarray,
+    volts: np.ndarray,
+    target_hz: float,
+    *,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+    phasor_dtype: type = np.complex128,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    amplitude, phase_deg, phasor, _spectrum, _lo, _hi = _tone_metrics_batch(
+        times, volts, target_hz, estimator, phasor_dtype
+    )
+    return amplitude, phase_deg, phasor
+
+
+def _single_channel_gain(
+    amplitude_peak: float,
+    phasor: complex,
+    vin_peak: float,
     compute_phase: bool,
+    phase_deg: float,
 ) -> tuple[float, float, float | None, complex | None]:
-    amplitude_peak, phase_deg, phasor, _spectrum, _lo, _hi = _tone_metrics(times, volts, target_hz)
     gain_linear = max(amplitude_peak / max(vin_peak, 1e-15), 1e-15)
     gain_db = 20.0 * math.log10(gain_linear)
 
@@ -90,24 +662,202 @@ def measure_single_channel(
     return gain_linear, gain_db, phase_deg, gain_complex
 
 
+def measure_single_channel(
+    times: np.ndarray,
+    volts: np.ndarray,
+    target_hz: float,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+) -> tuple[float, float, float | None, complex | None]:
+    amplitude_peak, phase_deg, phasor, _spectrum, _lo, _hi = _tone_metrics(times, volts, target_hz, estimator)
+    return _single_channel_gain(amplitude_peak, phasor, vin_peak, compute_phase, phase_deg)
+
+
+def measure_single_stream(
+    tone: StreamingToneAccumulator,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+) -> tuple[float, float, float | None, complex | None]:
+    amplitude_peak, phase_deg, phasor, _band = tone.result()
+    return _single_channel_gain(amplitude_peak, phasor, vin_peak, compute_phase, phase_deg)
+
+
+def measure_dual_stream(
+    tone_test: StreamingToneAccumulator,
+    tone_ref: StreamingToneAccumulator,
+) -> tuple[float, float, float, complex]:
+    amp_test, _phase_test, phasor_test, band_test = tone_test.result()
+    amp_ref, _phase_ref, phasor_ref, band_ref = tone_ref.result()
+    return _gain_from_phasors(amp_test, phasor_test, band_test, amp_ref, phasor_ref, band_ref)
+
+
+def measure_single_record(
+    record: WaveformRecord,
+    target_hz: float,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+) -> tuple[float, float, float | None, complex | None]:
+    amplitude_peak, phase_deg, phasor, _spectrum, _lo, _hi = _record_metrics(record, target_hz, estimator)
+    return _single_channel_gain(amplitude_peak, phasor, vin_peak, compute_phase, phase_deg)
+
+
+def measure_dual_record(
+    record_test: WaveformRecord,
+    record_ref: WaveformRecord,
+    target_hz: float,
+    *,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+) -> tuple[float, float, float, complex]:
+    same_base = (
+        len(record_test) == len(record_ref)
+        and record_test.t0 == record_ref.t0
+        and record_test.dt == record_ref.dt
+    )
+    if estimator == ToneEstimator.SINE_FIT and same_base:
+        # The 4-parameter fit shares one frequency between both channels, so it needs them together.
+        times = record_test.times
+        return measure_dual_channel(times, record_test.volts, times, record_ref.volts, target_hz, estimator=estimator)
+
+    amp_test, _phase_test, phasor_test, spectrum_t, lo_t, hi_t = _record_metrics(record_test, target_hz, estimator)
+    amp_ref, _phase_ref, phasor_ref, spectrum_r, lo_r, hi_r = _record_metrics(record_ref, target_hz, estimator)
+    return _gain_from_phasors(
+        amp_test, phasor_test, spectrum_t[lo_t:hi_t], amp_ref, phasor_ref, spectrum_r[lo_r:hi_r]
+    )
+
+
+def _spectrum_snr_db(spectrum: np.ndarray, lo: int, hi: int) -> float:
+    power = np.abs(spectrum) ** 2
+    noise_bins = np.concatenate((power[1:lo], power[hi:]))
+    if noise_bins.size == 0:
+        return math.inf
+    # The median skips harmonics and spurs; /ln 2 turns the median of exponential bin powers into their mean.
+    noise = float(np.median(noise_bins)) / math.log(2.0) * (hi - lo)
+    tone = float(np.sum(power[lo:hi])) - noise
+    return 10.0 * math.log10(max(tone, 1e-30) / max(noise, 1e-30))
+
+
+def _record_metrics(
+    record: WaveformRecord, target_hz: float, estimator: ToneEstimator
+) -> tuple[float, float, complex, np.ndarray, int, int]:
+    base = _record_base(record)
+    if base is None:
+        return _tone_metrics(record.times, record.volts, target_hz, estimator)
+    return _tone_metrics(None, record, target_hz, estimator, base=base)
+
+
+def _record_tone_metrics(
+    record: WaveformRecord, target_hz: float, estimator: ToneEstimator
+) -> tuple[float, complex, float, np.ndarray, float]:
+    amplitude, phase_deg, phasor, spectrum, lo, hi = _record_metrics(record, target_hz, estimator)
+    band = spectrum[lo:hi]
+    if hi - lo >= len(spectrum):
+        _amp, _phase, _phasor, spectrum, lo, hi = _record_metrics(record, target_hz, ToneEstimator.FFT)
+    return amplitude, phasor, phase_deg, band, _spectrum_snr_db(spectrum, lo, hi)
+
+
+def measure_record_with_snr(
+    record_test: WaveformRecord,
+    record_ref: WaveformRecord | None,
+    target_hz: float,
+    vin_peak: float,
+    *,
+    compute_phase: bool,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+) -> tuple[tuple[float, float, float | None, complex | None], float]:
+    amp_t, phasor_t, phase_t, band_t, snr_t = _record_tone_metrics(record_test, target_hz, estimator)
+    if record_ref is None:
+        return _single_channel_gain(amp_t, phasor_t, vin_peak, compute_phase, phase_t), snr_t
+
+    amp_r, phasor_r, _phase_r, band_r, snr_r = _record_tone_metrics(record_ref, target_hz, estimator)
+    return _gain_from_phasors(amp_t, phasor_t, band_t, amp_r, phasor_r, band_r), min(snr_t, snr_r)
+
+
+def coarse_tone_hz(volts: np.ndarray, dt: float) -> float:
+    n = len(volts)
+    if n < 4:
+        raise ValueError("Record is too short to locate a tone")
+    window = _WINDOW_CACHE.get(n).window
+    magnitude = np.abs(np.fft.rfft(window * (volts - np.mean(volts))))
+    peak = int(np.argmax(magnitude[1:])) + 1
+    delta = 0.0
+    if peak + 1 < magnitude.size:
+        delta = _parabolic_interp_delta(magnitude[peak - 1], magnitude[peak], magnitude[peak + 1])
+    return (peak + delta) / (n * dt)
+
+
+def estimate_record_frequency(record: WaveformRecord) -> float:
+    # A prefix is plenty for a frequency check; the Gauss-Newton fit only converges from within
+    # about half a bin, so it starts at the interpolated FFT peak rather than the requested frequency.
+    n = min(len(record), TONE_FIT_POINTS)
+    volts = record.codes[:n].astype(np.float64) * record.scale + record.offset
+    times = record.t0 + record.dt * np.arange(n, dtype=np.float64)
+    seed_hz = coarse_tone_hz(volts, record.dt)
+    *_fit, freq_hz = sine_fit(times, volts, seed_hz, strict=True)
+    return float(freq_hz)
+
+
 def measure_dual_channel(
     times_test: np.ndarray,
     volts_test: np.ndarray,
     times_ref: np.ndarray,
     volts_ref: np.ndarray,
     target_hz: float,
+    *,
+    estimator: ToneEstimator = ToneEstimator.FFT,
 ) -> tuple[float, float, float, complex]:
-    amp_test, _phase_test, phasor_test, spectrum_t, lo_t, hi_t = _tone_metrics(times_test, volts_test, target_hz)
-    amp_ref, _phase_ref, phasor_ref, spectrum_r, lo_r, hi_r = _tone_metrics(times_ref, volts_ref, target_hz)
+    if _shares_time_base(times_test, times_ref) and len(volts_test) == len(volts_ref):
+        return measure_multi_channel(
+            times_test, np.atleast_2d(volts_test), volts_ref, target_hz, estimator=estimator
+        )[0]
 
-    if abs(phasor_test) < 1e-15 or abs(phasor_ref) < 1e-15:
-        phase_test = np.angle(np.sum(spectrum_t[lo_t:hi_t]))
-        phase_ref = np.angle(np.sum(spectrum_r[lo_r:hi_r]))
-        phasor_test = amp_test * np.exp(1j * phase_test)
-        phasor_ref = amp_ref * np.exp(1j * phase_ref)
+    amp_test, _phase_test, phasor_test, spectrum_t, lo_t, hi_t = _tone_metrics(
+        times_test, volts_test, target_hz, estimator
+    )
+    amp_ref, _phase_ref, phasor_ref, spectrum_r, lo_r, hi_r = _tone_metrics(times_ref, volts_ref, target_hz, estimator)
+    return _gain_from_phasors(
+        amp_test, phasor_test, spectrum_t[lo_t:hi_t], amp_ref, phasor_ref, spectrum_r[lo_r:hi_r]
+    )
 
-    gain_complex = phasor_test / (phasor_ref if abs(phasor_ref) > 1e-15 else 1e-15 + 0j)
-    gain_linear = max(abs(gain_complex), 1e-15)
-    gain_db = 20.0 * math.log10(gain_linear)
-    phase_deg = float(np.degrees(np.angle(gain_complex)))
-    return gain_linear, gain_db, phase_deg, gain_complex
+
+def measure_multi_channel(
+    times: np.ndarray,
+    volts_tests: np.ndarray,
+    volts_ref: np.ndarray,
+    target_hz: float,
+    *,
+    estimator: ToneEstimator = ToneEstimator.FFT,
+) -> list[tuple[float, float, float, complex]]:
+    tests = np.atleast_2d(np.asarray(volts_tests, dtype=float))
+    volts_ref = np.asarray(volts_ref, dtype=float)
+    if estimator in _ROW_ESTIMATORS:
+        # These estimators stream each row in chunks; stacking would only add a full-size copy.
+        base = _uniform_time_base(times)
+        amp_ref, _phase_ref, phasor_ref, spectrum_r, lo_r, hi_r = _tone_metrics(
+            times, volts_ref, target_hz, estimator, base=base
+        )
+        results = []
+        for row in tests:
+            amp, _phase, phasor, spectrum, lo, hi = _tone_metrics(times, row, target_hz, estimator, base=base)
+            results.append(_gain_from_phasors(amp, phasor, spectrum[lo:hi], amp_ref, phasor_ref, spectrum_r[lo_r:hi_r]))
+        return results
+
+    stacked = np.vstack([tests, volts_ref[np.newaxis, :]])
+    amplitude, _phase_deg, phasor, spectrum, lo, hi = _tone_metrics_batch(times, stacked, target_hz, estimator)
+
+    ref = tests.shape[0]
+    return [
+        _gain_from_phasors(
+            float(amplitude[row]),
+            complex(phasor[row]),
+            spectrum[row, lo:hi],
+            float(amplitude[ref]),
+            complex(phasor[ref]),
+            spectrum[ref, lo:hi],
+        )
+        for row in range(ref)
+    ]
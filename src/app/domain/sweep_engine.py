@@ -1,31 +1,105 @@
 from __future__ import annotations
 
+import math
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass
+
 import numpy as np
 
-from app.domain.models import SweepSpec
+from app.domain.enums import ToneEstimator
+from app.domain.models import SweepSegment, SweepSpec
 
+DEFAULT_MIN_CYCLES = 10
+SINE_FIT_MIN_CYCLES = 2
+PLAN_CHUNK_POINTS = 65_536
+TIMEBASE_DIVISIONS = 10
+SEGMENT_BOUNDARY_RTOL = 1e-9
+COHERENT_TOLERANCE_CYCLES = 1e-3
 
-def generate_frequency_points(spec: SweepSpec) -> np.ndarray:
-    if spec.is_log:
-        step_count = max(1, int(spec.step_count or 1))
-        return np.logspace(np.log10(spec.start_hz), np.log10(spec.stop_hz), step_count)
 
-    step_hz = float(spec.step_hz or 0.0)
-    if step_hz <= 0:
-        raise ValueError("Linear sweep requires step_hz > 0")
+@dataclass(slots=True)
+class FrequencyPlan:
+    start_hz: float
+    step: float
+    count: int
+    is_log: bool
+    last_hz: float
+
+    @classmethod
+    def from_spec(cls, spec: SweepSpec | SweepSegment) -> FrequencyPlan:
+        start = float(spec.start_hz)
+        stop = float(spec.stop_hz)
+        if spec.is_log:
+            decades = max(math.log10(stop / start), 0.0)
+            if spec.points_per_decade:
+                step = 1.0 / float(spec.points_per_decade)
+                count = int(math.floor(decades / step + 1e-9)) + 1
+                # Keep the stop frequency when the decade grid falls short of it.
+                if decades - (count - 1) * step > 1e-9:
+                    count += 1
+            else:
+                count = max(1, int(spec.step_count or 1))
+                step = decades / (count - 1) if count > 1 else 0.0
+            return cls(start_hz=start, step=step, count=count, is_log=True, last_hz=stop if count > 1 else start)
+
+        step_hz = float(spec.step_hz or 0.0)
+        if step_hz <= 0:
+            raise ValueError("Linear sweep requires step_hz > 0")
+        if np.isclose(start, stop):
+            return cls(start_hz=start, step=step_hz, count=1, is_log=False, last_hz=start)
+
+        count = max(1, int(math.floor((stop - start + 1e-9) / step_hz)) + 1)
+        return cls(start_hz=start, step=step_hz, count=count, is_log=False, last_hz=start + step_hz * (count - 1))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def values(self, start: int = 0, stop: int | None = None) -> np.ndarray:
+        stop = self.count if stop is None else min(int(stop), self.count)
+        start = min(max(int(start), 0), stop)
+        index = np.arange(start, stop, dtype=np.float64)
+        if self.is_log:
+            out = 10.0 ** (math.log10(self.start_hz) + index * self.step)
+        else:
+            out = self.start_hz + index * self.step
+        if stop == self.count and stop > start:
+            out[-1] = self.last_hz
+        return out
+
+    def __getitem__(self, index: int) -> float:
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("FrequencyPlan index out of range")
+        return float(self.values(index, index + 1)[0])
 
-    if np.isclose(spec.start_hz, spec.stop_hz):
-        return np.array([spec.start_hz], dtype=float)
+    def chunks(self, size: int = PLAN_CHUNK_POINTS) -> Iterator[np.ndarray]:
+        size = max(1, int(size))
+        for start in range(0, self.count, size):
+            yield self.values(start, start + size)
 
-    values: list[float] = []
-    current = spec.start_hz
-    while spec.stop_hz - current >= -1e-9:
-        values.append(current)
-        current += step_hz
+    def __iter__(self) -> Iterator[float]:
+        for chunk in self.chunks():
+            yield from chunk.tolist()
 
-    if not values:
-        values = [spec.start_hz]
-    return np.array(values, dtype=float)
+    def to_array(self) -> np.ndarray:
+        return self.values()
+
+
+def segment_point_count(plans: Sequence[FrequencyPlan]) -> int:
+    # Adjacent segments usually share their boundary frequency; it is measured once.
+    total = 0
+    last_hz = -math.inf
+    for plan in plans:
+        total += len(plan)
+        if len(plan) and plan[0] <= last_hz * (1.0 + SEGMENT_BOUNDARY_RTOL):
+            total -= 1
+        last_hz = plan.last_hz
+    return total
+
+
+def generate_frequency_points(spec: SweepSpec) -> np.ndarray:
+    return FrequencyPlan.from_spec(spec).to_array()
 
 
 def compute_sampling_window_s(
@@ -34,7 +108,7 @@ def compute_sampling_window_s(
     points: int,
     *,
     min_window_s: float = 1e-6,
-    min_cycles: int = 10,
+    min_cycles: int = DEFAULT_MIN_CYCLES,
     max_points: int = 10_000_000,
 ) -> float:
     freq = max(float(freq_hz), 1e-12)
@@ -43,3 +117,77 @@ def compute_sampling_window_s(
     if max_points > 0:
         target = min(target, max_points / sr)
     return target
+
+
+def quantize_window_s(window_s: float | np.ndarray, divisions: int = TIMEBASE_DIVISIONS) -> float | np.ndarray:
+    # Scopes only offer 1-2-5 horizontal scales; round up so the window never loses cycles.
+    scale = np.maximum(np.asarray(window_s, dtype=float), 1e-15) / divisions
+    decade = 10.0 ** np.floor(np.log10(scale))
+    ratio = scale / decade * (1.0 - 1e-9)
+    mantissa = np.select([ratio <= 1.0, ratio <= 2.0, ratio <= 5.0], [1.0, 2.0, 5.0], 10.0)
+    quantized = mantissa * decade * divisions
+    return float(quantized) if quantized.ndim == 0 else quantized
+
+
+def min_cycles_for_estimator(estimator: ToneEstimator) -> int:
+    if estimator == ToneEstimator.SINE_FIT:
+        return SINE_FIT_MIN_CYCLES
+    return DEFAULT_MIN_CYCLES
+
+
+@dataclass(slots=True)
+class CoherentPlan:
+    sample_rate_hz: float
+    points: int
+    cycles: int
+    window_s: float
+    cycle_error: float
+
+
+def plan_coherent_acquisition(
+    freq_hz: float,
+    sample_rates_hz: Sequence[float],
+    record_lengths: Sequence[int],
+    *,
+    min_cycles: int = DEFAULT_MIN_CYCLES,
+    tolerance_cycles: float = COHERENT_TOLERANCE_CYCLES,
+    search_cycles: int = 4096,
+) -> CoherentPlan | None:
+    freq = max(float(freq_hz), 1e-12)
+    best: CoherentPlan | None = None
+
+    for sample_rate in sample_rates_hz:
+        sr = float(sample_rate)
+        if sr <= 2.0 * freq:
+            continue
+        samples_per_cycle = sr / freq
+
+        for record_length in record_lengths:
+            max_cycles = int(math.floor(int(record_length) / samples_per_cycle))
+            if max_cycles < 1:
+                continue
+
+            first = min(max(1, int(min_cycles)), max_cycles)
+            cycles = np.arange(first, min(max_cycles, first + search_cycles) + 1)
+            points = np.rint(cycles * samples_per_cycle)
+            errors = np.abs(points / samples_per_cycle - cycles)
+
+            within = np.flatnonzero(errors <= tolerance_cycles)
+            pick = int(within[0]) if within.size else int(np.argmin(errors))
+            candidate = CoherentPlan(
+                sample_rate_hz=sr,
+                points=int(points[pick]),
+                cycles=int(cycles[pick]),
+                window_s=float(points[pick] / sr),
+                cycle_error=float(errors[pick]),
+            )
+
+            if best is None:
+                best = candidate
+                continue
+            candidate_ok = candidate.cycle_error <= tolerance_cycles
+            best_ok = best.cycle_error <= tolerance_cycles
+            if (candidate_ok, -candidate.points, -candidate.cycle_error) > (best_ok, -best.points, -best.cycle_error):
+                best = candidate
+
+    return best
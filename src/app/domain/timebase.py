@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from app.domain.sweep_engine import (
+    COHERENT_TOLERANCE_CYCLES,
+    DEFAULT_MIN_CYCLES,
+    TIMEBASE_DIVISIONS,
+    CoherentPlan,
+    plan_coherent_acquisition,
+    quantize_window_s,
+)
+
+
+@dataclass(slots=True)
+class TimebaseSetting:
+    scale_s: float
+    window_s: float
+    sample_rate_hz: float
+    record_points: int
+    memory_depth: int
+
+
+@dataclass(slots=True)
+class TimebaseModel:
+    max_sample_rate_hz: float
+    memory_depths: tuple[int, ...]
+    min_scale_s: float
+    max_scale_s: float
+    divisions: int = TIMEBASE_DIVISIONS
+
+    def predict(self, window_s: float, points: int) -> TimebaseSetting:
+        scale = quantize_window_s(window_s, self.divisions) / self.divisions
+        scale = min(max(scale, self.min_scale_s), self.max_scale_s)
+        depth = next((d for d in self.memory_depths if d >= points), self.memory_depths[-1])
+        return self._setting(scale, depth)
+
+    def scales(self) -> list[float]:
+        scales: list[float] = []
+        exponent = math.floor(math.log10(self.min_scale_s))
+        while 10.0**exponent <= self.max_scale_s * (1.0 + 1e-9):
+            for mantissa in (1.0, 2.0, 5.0):
+                scale = mantissa * 10.0**exponent
+                if self.min_scale_s * (1.0 - 1e-9) <= scale <= self.max_scale_s * (1.0 + 1e-9):
+                    scales.append(scale)
+            exponent += 1
+        return scales
+
+    def plan_coherent(
+        self, freq_hz: float, points: int, *, min_cycles: int = DEFAULT_MIN_CYCLES
+    ) -> tuple[TimebaseSetting, CoherentPlan] | None:
+        best: tuple[TimebaseSetting, CoherentPlan] | None = None
+        best_key: tuple[bool, bool, int, float, float] | None = None
+        for scale in self.scales():
+            for depth in self.memory_depths:
+                setting = self._setting(scale, depth)
+                # Plan against the rate this scale/depth pair really yields, never past the record it holds.
+                plan = plan_coherent_acquisition(
+                    freq_hz,
+                    [setting.sample_rate_hz],
+                    [min(int(points), setting.record_points)],
+                    min_cycles=min_cycles,
+                )
+                if plan is None:
+                    continue
+                key = (
+                    plan.cycles >= min_cycles,
+                    plan.cycle_error <= COHERENT_TOLERANCE_CYCLES,
+                    plan.points,
+                    -setting.window_s,
+                    -plan.cycle_error,
+                )
+                if best_key is None or key > best_key:
+                    best, best_key = (setting, plan), key
+        return best
+
+    def _setting(self, scale: float, depth: int) -> TimebaseSetting:
+        window = scale * self.divisions
+        # The scope fills the chosen memory depth across the window unless that exceeds its ADC rate.
+        sample_rate = min(self.max_sample_rate_hz, depth / window)
+        return TimebaseSetting(
+            scale_s=scale,
+            window_s=window,
+            sample_rate_hz=sample_rate,
+            record_points=int(round(sample_rate * window)),
+            memory_depth=int(depth),
+        )
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
-from app.domain.enums import CorrectionMode, CouplingMode, ImpedanceMode, TriggerMode
-from app.domain.models import AppSettings, ChannelSelection, OscSettings, SweepSpec
+from app.domain.enums import CorrectionMode, CouplingMode, ImpedanceMode, SweepMode, TriggerMode
+from app.domain.models import AppSettings, ChannelSelection, OscSettings, RunMode, SweepSegment, SweepSpec
 
 
 class ValidationError(ValueError):
     pass
 
 
-def validate_sweep_spec(spec: SweepSpec) -> None:
+def validate_sweep_spec(spec: SweepSpec | SweepSegment) -> None:
     if spec.start_hz <= 0:
         raise ValidationError("start_hz must be > 0")
     if spec.stop_hz <= 0:
@@ -17,13 +17,34 @@ def validate_sweep_spec(spec: SweepSpec) -> None:
         raise ValidationError("stop_hz must be >= start_hz")
 
     if spec.is_log:
-        if not spec.step_count or spec.step_count <= 0:
+        if spec.points_per_decade is not None:
+            if spec.points_per_decade <= 0:
+                raise ValidationError("points_per_decade must be > 0")
+        elif not spec.step_count or spec.step_count <= 0:
             raise ValidationError("step_count must be > 0 for logarithmic sweep")
     else:
         if not spec.step_hz or spec.step_hz <= 0:
             raise ValidationError("step_hz must be > 0 for linear sweep")
 
 
+def validate_segments(segments: list[SweepSegment], sweep_mode: SweepMode) -> None:
+    if segments and sweep_mode != SweepMode.STEPPED:
+        raise ValidationError("Segmented sweeps require the stepped sweep mode")
+    for number, segment in enumerate(segments, start=1):
+        try:
+            validate_sweep_spec(segment)
+        except ValidationError as exc:
+            raise ValidationError(f"Segment {number}: {exc}") from exc
+        if segment.record_points is not None and segment.record_points <= 0:
+            raise ValidationError(f"Segment {number}: record_points must be > 0")
+        if segment.full_scale_v is not None and segment.full_scale_v <= 0:
+            raise ValidationError(f"Segment {number}: full_scale_v must be > 0")
+        if segment.averages <= 0:
+            raise ValidationError(f"Segment {number}: averages must be > 0")
+        if number > 1 and segment.start_hz < segments[number - 2].stop_hz:
+            raise ValidationError(f"Segment {number}: segments must be ascending and must not overlap")
+
+
 def validate_channels(channels: ChannelSelection, correction_mode: CorrectionMode, trigger_mode: TriggerMode) -> None:
     if channels.awg_ch <= 0 or channels.osc_test_ch <= 0:
         raise ValidationError("Channel index must be positive")
@@ -44,9 +65,26 @@ def validate_osc_settings(settings: OscSettings) -> None:
         raise ValidationError("50-ohm impedance does not support AC coupling")
 
 
+def validate_run_mode(run_mode: RunMode) -> None:
+    if run_mode.sweep_mode == SweepMode.NOISE and run_mode.correction_mode != CorrectionMode.DUAL:
+        raise ValidationError("noise excitation requires dual correction")
+    if run_mode.max_in_flight <= 0:
+        raise ValidationError("max_in_flight must be > 0")
+    if run_mode.sweep_mode == SweepMode.ADAPTIVE and (
+        run_mode.refine_tolerance_db <= 0 or run_mode.refine_tolerance_deg <= 0 or run_mode.refine_budget <= 0
+    ):
+        raise ValidationError("adaptive sweep needs positive refine tolerances and budget")
+    if run_mode.verify_every <= 0:
+        raise ValidationError("verify_every must be > 0")
+    if run_mode.adaptive_averaging and (run_mode.target_uncertainty <= 0 or run_mode.max_averages <= 0):
+        raise ValidationError("adaptive averaging needs target_uncertainty > 0 and max_averages > 0")
+
+
 def validate_settings(settings: AppSettings) -> None:
     validate_sweep_spec(settings.sweep)
+    validate_segments(settings.sweep.segments, settings.run_mode.sweep_mode)
     validate_osc_settings(settings.setup.osc_settings)
+    validate_run_mode(settings.run_mode)
     validate_channels(
         settings.setup.channels,
         settings.run_mode.correction_mode,
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import numpy as np
+
+
 class EquipsAwgAdapter:
     def __init__(self, model: str, visa_address: str) -> None:
         try:
@@ -34,6 +37,21 @@ class EquipsAwgAdapter:
     def get_amplitude_vpp(self, channel: int) -> float:
         return float(self._inst.get_amp(ch=channel))
 
+    def load_arbitrary(self, samples: np.ndarray, channel: int) -> None:
+        self._inst.set_arb_waveform(samples=np.asarray(samples, dtype=float), ch=channel)
+
+    def select_sine(self, channel: int) -> None:
+        self._inst.set_sine(ch=channel)
+
+    def start_chirp(self, start_hz: float, stop_hz: float, duration_s: float, is_log: bool, channel: int) -> None:
+        self._inst.set_sweep(start=start_hz, stop=stop_hz, time_s=duration_s, log=is_log, ch=channel)
+
+    def stop_chirp(self, channel: int) -> None:
+        self._inst.set_sweep_off(ch=channel)
+
+    def start_noise(self, channel: int) -> None:
+        self._inst.set_noise(ch=channel)
+
     def close(self) -> None:
         try:
             self._inst.inst_close()
@@ -1,7 +1,17 @@
 from __future__ import annotations
 
+import queue
+import threading
+
 import numpy as np
 
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import StreamingToneAccumulator
+from app.domain.timebase import TimebaseModel
+from app.infrastructure.instruments.timebase_models import TIMEBASE_MODELS
+
+_STREAM_QUEUE_DEPTH = 4
+
 class EquipsOscAdapter:
     def __init__(self, model: str, visa_address: str) -> None:
         try:
@@ -14,9 +24,17 @@ class EquipsOscAdapter:
         if model not in inst_mapping:
             raise ValueError(f"Unsupported OSC model: {model}")
         self._inst = inst_mapping[model](name=model, visa_address=visa_address)
+        self._model = model
+        self._sample_rate: float | None = None
+        self._xscale: tuple[float, float | None] | None = None
+        self._memory_depth: int | None = None
+        self._cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
 
     def reset(self) -> None:
         self._inst.rst()
+        self._invalidate_acquisition()
+        self._xscale = None
+        self._memory_depth = None
 
     def output_on(self, channel: int) -> None:
         self._inst.set_on(ch=channel)
@@ -24,6 +42,15 @@ class EquipsOscAdapter:
     def set_timebase(self, window_s: float, offset_s: float | None = None) -> None:
         xscale = float(window_s) / 10.0
         self._inst.set_x(xscale=xscale, xoffset=offset_s)
+        if self._xscale != (xscale, offset_s):
+            self._xscale = (xscale, offset_s)
+            self._invalidate_acquisition()
+
+    def set_record_length(self, points: int) -> None:
+        self._inst.set_record_length(points=int(points))
+        if self._memory_depth != int(points):
+            self._memory_depth = int(points)
+            self._invalidate_acquisition()
 
     def set_vertical(self, channel: int, full_scale_v: float, offset_v: float) -> None:
         yscale = float(full_scale_v) / 8.0
@@ -51,13 +78,74 @@ class EquipsOscAdapter:
         else:
             self._inst.quick_measure()
 
-    def read_waveform(self, channel: int, points: int | None) -> tuple[np.ndarray, np.ndarray]:
+    def read_waveform(self, channel: int, points: int | None) -> WaveformRecord:
+        request_points = points if points and points > 0 else 10_000
+        codes, preamble = self._inst.read_raw_codes(ch=channel, points=request_points)
+        return WaveformRecord(
+            codes=codes,
+            scale=float(preamble["y_scale"]),
+            offset=float(preamble["y_offset"]),
+            t0=float(preamble["t0"]),
+            dt=float(preamble["dt"]),
+        )
+
+    def read_tone(self, channel: int, points: int | None, target_hz: float) -> StreamingToneAccumulator:
         request_points = points if points and points > 0 else 10_000
-        times, volts = self._inst.read_raw_waveform(ch=channel, points=request_points)
-        return np.asarray(times, dtype=float), np.asarray(volts, dtype=float)
+        preamble = self._inst.read_waveform_preamble(ch=channel, points=request_points)
+        accumulator = StreamingToneAccumulator(
+            target_hz, preamble["n"], t0=preamble["t0"], dt=preamble["dt"]
+        )
+        scale = float(preamble["y_scale"])
+        offset = float(preamble["y_offset"])
+
+        blocks: queue.Queue = queue.Queue(maxsize=_STREAM_QUEUE_DEPTH)
+        errors: list[BaseException] = []
+
+        def consume() -> None:
+            while True:
+                codes = blocks.get()
+                if codes is None:
+                    return
+                if errors:
+                    continue
+                try:
+                    accumulator.feed(codes.astype(np.float64) * scale + offset)
+                except BaseException as exc:
+                    errors.append(exc)
+
+        worker = threading.Thread(target=consume, daemon=True)
+        worker.start()
+        try:
+            for _, codes in self._inst.iter_waveform_blocks(preamble):
+                if errors:
+                    break
+                blocks.put(codes)
+        finally:
+            blocks.put(None)
+            worker.join()
+
+        if errors:
+            raise errors[0]
+        return accumulator
 
     def get_sample_rate(self) -> float:
-        return float(self._inst.get_sample_rate())
+        if self._sample_rate is not None:
+            self._cache_stats["hits"] += 1
+            return self._sample_rate
+        self._cache_stats["misses"] += 1
+        self._sample_rate = float(self._inst.get_sample_rate())
+        return self._sample_rate
+
+    def sample_rate_cache_stats(self) -> dict[str, int]:
+        return dict(self._cache_stats)
+
+    def _invalidate_acquisition(self) -> None:
+        if self._sample_rate is not None:
+            self._cache_stats["invalidations"] += 1
+        self._sample_rate = None
+
+    def timebase_model(self) -> TimebaseModel | None:
+        return TIMEBASE_MODELS.get(self._model)
 
     def close(self) -> None:
         try:
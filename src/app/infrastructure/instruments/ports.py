@@ -4,6 +4,10 @@ from typing import Protocol
 
 import numpy as np
 
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import StreamingToneAccumulator
+from app.domain.timebase import TimebaseModel
+
 
 class AwgPort(Protocol):
     def reset(self) -> None: ...
@@ -13,6 +17,11 @@ class AwgPort(Protocol):
     def get_frequency(self, channel: int) -> float: ...
     def set_amplitude_vpp(self, vpp: float, channel: int) -> None: ...
     def get_amplitude_vpp(self, channel: int) -> float: ...
+    def load_arbitrary(self, samples: np.ndarray, channel: int) -> None: ...
+    def select_sine(self, channel: int) -> None: ...
+    def start_chirp(self, start_hz: float, stop_hz: float, duration_s: float, is_log: bool, channel: int) -> None: ...
+    def stop_chirp(self, channel: int) -> None: ...
+    def start_noise(self, channel: int) -> None: ...
     def close(self) -> None: ...
 
 
@@ -20,6 +29,7 @@ class OscPort(Protocol):
     def reset(self) -> None: ...
     def output_on(self, channel: int) -> None: ...
     def set_timebase(self, window_s: float, offset_s: float | None = None) -> None: ...
+    def set_record_length(self, points: int) -> None: ...
     def set_vertical(self, channel: int, full_scale_v: float, offset_v: float) -> None: ...
     def get_vertical(self, channel: int) -> tuple[float, float]: ...
     def set_coupling(self, channel: int, mode: str) -> None: ...
@@ -27,8 +37,11 @@ class OscPort(Protocol):
     def arm_trigger(self, channel: int, level_v: float) -> None: ...
     def set_free_run(self) -> None: ...
     def single_acquire(self, triggered: bool) -> None: ...
-    def read_waveform(self, channel: int, points: int | None) -> tuple[np.ndarray, np.ndarray]: ...
+    def read_waveform(self, channel: int, points: int | None) -> WaveformRecord: ...
+    def read_tone(self, channel: int, points: int | None, target_hz: float) -> StreamingToneAccumulator: ...
     def get_sample_rate(self) -> float: ...
+    def sample_rate_cache_stats(self) -> dict[str, int]: ...
+    def timebase_model(self) -> TimebaseModel | None: ...
     def close(self) -> None: ...
 
 
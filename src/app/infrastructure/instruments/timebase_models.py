@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from mapping import Mapping
+
+from app.domain.timebase import TimebaseModel
+
+_TEK_DEPTHS = (1_000, 10_000, 100_000, 1_000_000, 5_000_000, 10_000_000)
+_RIGOL_DHO_DEPTHS = (1_000, 10_000, 100_000, 1_000_000, 10_000_000, 25_000_000)
+
+TIMEBASE_MODELS: dict[str, TimebaseModel] = {
+    Mapping.mapping_MDO_34: TimebaseModel(
+        max_sample_rate_hz=2.5e9, memory_depths=_TEK_DEPTHS, min_scale_s=1e-9, max_scale_s=1000.0
+    ),
+    Mapping.mapping_MDO_3024: TimebaseModel(
+        max_sample_rate_hz=2.5e9, memory_depths=_TEK_DEPTHS, min_scale_s=1e-9, max_scale_s=1000.0
+    ),
+    Mapping.mapping_DHO_1202: TimebaseModel(
+        max_sample_rate_hz=2e9, memory_depths=_RIGOL_DHO_DEPTHS, min_scale_s=2e-9, max_scale_s=1000.0
+    ),
+    Mapping.mapping_DHO_1204: TimebaseModel(
+        max_sample_rate_hz=2e9, memory_depths=_RIGOL_DHO_DEPTHS, min_scale_s=2e-9, max_scale_s=1000.0
+    ),
+}
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TextIO
+
+from app.domain.models import AppSettings, SweepPoint
+from app.infrastructure.persistence.settings_repo_json import JsonSettingsRepository
+
+
+class JsonlSweepCheckpoint:
+    def __init__(self, path: Path, stream: TextIO) -> None:
+        self.path = path
+        self._stream = stream
+
+    def append(self, point: SweepPoint) -> None:
+        self.write_record(
+            {
+                "type": "point",
+                "freq_hz": point.freq_hz,
+                "gain_linear": point.gain_linear,
+                "gain_db": point.gain_db,
+                "phase_deg": point.phase_deg,
+                "gain_complex": (
+                    None if point.gain_complex is None else [point.gain_complex.real, point.gain_complex.imag]
+                ),
+                "acquisitions": point.acquisitions,
+                "gain_ci": point.gain_ci,
+            }
+        )
+
+    def finish(self, status: str) -> None:
+        self.write_record({"type": "status", "status": status, "at": _now()})
+        self.close()
+
+    def close(self) -> None:
+        if not self._stream.closed:
+            self._stream.close()
+
+    def write_record(self, record: dict[str, object]) -> None:
+        if self._stream.closed:
+            return
+        # One line per record, flushed so a crash loses at most the point being written.
+        self._stream.write(json.dumps(record, ensure_ascii=True) + "\n")
+        self._stream.flush()
+
+
+class JsonlCheckpointRepository:
+    def __init__(self, directory: Path | None = None, settings_codec: JsonSettingsRepository | None = None) -> None:
+        root = Path(__file__).resolve().parents[4]
+        self._directory = directory or root / "__data__" / "checkpoints"
+        self._codec = settings_codec or JsonSettingsRepository()
+
+    def start(self, settings: AppSettings) -> JsonlSweepCheckpoint:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        path = self._directory / f"{datetime.now().strftime('%Y%m%d_%H_%M_%S')}_sweep.jsonl"
+        checkpoint = JsonlSweepCheckpoint(path, path.open("a", encoding="utf-8"))
+        checkpoint.write_record({"type": "plan", "started_at": _now(), "settings": self._codec.encode(settings)})
+        return checkpoint
+
+    def resume(self, file_path: str) -> tuple[JsonlSweepCheckpoint, AppSettings, list[SweepPoint]]:
+        path = Path(file_path)
+        settings: AppSettings | None = None
+        points: list[SweepPoint] = []
+        text = path.read_text(encoding="utf-8")
+        for line in text.splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A crash mid-write leaves at most one truncated trailing line.
+                continue
+            if record.get("type") == "plan":
+                settings = self._codec.decode(record["settings"])
+            elif record.get("type") == "point":
+                points.append(_point_from_record(record))
+
+        if settings is None:
+            raise ValueError(f"Checkpoint has no sweep plan: {path}")
+
+        stream = path.open("a", encoding="utf-8")
+        if text and not text.endswith("\n"):
+            stream.write("\n")
+        checkpoint = JsonlSweepCheckpoint(path, stream)
+        checkpoint.write_record({"type": "resumed", "at": _now(), "points": len(points)})
+        return checkpoint, settings, points
+
+
+def _point_from_record(record: dict[str, object]) -> SweepPoint:
+    gain_complex = record.get("gain_complex")
+    return SweepPoint(
+        freq_hz=float(record["freq_hz"]),
+        gain_linear=float(record["gain_linear"]),
+        gain_db=float(record["gain_db"]),
+        phase_deg=None if record.get("phase_deg") is None else float(record["phase_deg"]),
+        gain_complex=None if gain_complex is None else complex(gain_complex[0], gain_complex[1]),
+        acquisitions=int(record.get("acquisitions", 1)),
+        gain_ci=None if record.get("gain_ci") is None else float(record["gain_ci"]),
+    )
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
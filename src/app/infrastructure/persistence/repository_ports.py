@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from pathlib import Path
 from typing import Protocol
 
 from app.application.dto import LoadedMeasurement, SaveArtifacts, SaveTarget
-from app.domain.models import AppSettings, ReferenceCurve, SweepResult
+from app.domain.models import AppSettings, ReferenceCurve, SweepPoint, SweepResult
 
 
 class SettingsRepository(Protocol):
@@ -18,3 +19,16 @@ class MeasurementRepository(Protocol):
 
 class ReferenceRepository(Protocol):
     def load_reference(self, file_path: str) -> ReferenceCurve: ...
+
+
+class SweepCheckpoint(Protocol):
+    path: Path
+
+    def append(self, point: SweepPoint) -> None: ...
+    def finish(self, status: str) -> None: ...
+    def close(self) -> None: ...
+
+
+class CheckpointRepository(Protocol):
+    def start(self, settings: AppSettings) -> SweepCheckpoint: ...
+    def resume(self, file_path: str) -> tuple[SweepCheckpoint, AppSettings, list[SweepPoint]]: ...
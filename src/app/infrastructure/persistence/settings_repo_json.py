@@ -10,9 +10,13 @@ from app.domain.enums import (
     ConnectionMode,
     CorrectionMode,
     CouplingMode,
+    DspExecutor,
     ImpedanceMode,
     MagnitudePhaseMode,
+    SweepMode,
+    ToneEstimator,
     TriggerMode,
+    VerifyPolicy,
 )
 from app.domain.models import (
     AppSettings,
@@ -22,6 +26,7 @@ from app.domain.models import (
     InstrumentSetup,
     OscSettings,
     RunMode,
+    SweepSegment,
     SweepSpec,
 )
 from app.domain.validators import validate_settings
@@ -50,6 +55,14 @@ class JsonSettingsRepository:
         data = self._to_dict(settings)
         self._path.write_text(json.dumps(data, indent=2, ensure_ascii=True), encoding="utf-8")
 
+    def encode(self, settings: AppSettings) -> dict[str, object]:
+        return self._to_dict(settings)
+
+    def decode(self, payload: dict[str, object]) -> AppSettings:
+        settings = self._from_dict(payload)
+        validate_settings(settings)
+        return settings
+
     def _default_settings(self) -> AppSettings:
         return AppSettings(
             schema_version=1,
@@ -98,6 +111,10 @@ class JsonSettingsRepository:
         payload = asdict(settings)
         payload["run_mode"]["correction_mode"] = settings.run_mode.correction_mode.value
         payload["run_mode"]["trigger_mode"] = settings.run_mode.trigger_mode.value
+        payload["run_mode"]["estimator"] = settings.run_mode.estimator.value
+        payload["run_mode"]["sweep_mode"] = settings.run_mode.sweep_mode.value
+        payload["run_mode"]["dsp_executor"] = settings.run_mode.dsp_executor.value
+        payload["run_mode"]["verify_policy"] = settings.run_mode.verify_policy.value
         payload["setup"]["awg"]["connect_mode"] = settings.setup.awg.connect_mode.value
         payload["setup"]["osc"]["connect_mode"] = settings.setup.osc.connect_mode.value
         payload["setup"]["awg_settings"]["impedance"] = settings.setup.awg_settings.impedance.value
@@ -134,12 +151,32 @@ class JsonSettingsRepository:
                     else int(sweep_payload.get("step_count", 100))
                 ),
                 is_log=bool(sweep_payload.get("is_log", False)),
+                points_per_decade=(
+                    None
+                    if sweep_payload.get("points_per_decade") is None
+                    else float(sweep_payload.get("points_per_decade"))
+                ),
+                segments=[self._segment_from_dict(item) for item in sweep_payload.get("segments", [])],
             ),
             run_mode=RunMode(
                 correction_mode=CorrectionMode(str(run_payload.get("correction_mode", CorrectionMode.NONE.value))),
                 trigger_mode=TriggerMode(str(run_payload.get("trigger_mode", TriggerMode.FREE_RUN.value))),
                 auto_range=bool(run_payload.get("auto_range", True)),
                 auto_reset=bool(run_payload.get("auto_reset", True)),
+                estimator=ToneEstimator(str(run_payload.get("estimator", ToneEstimator.FFT.value))),
+                sweep_mode=SweepMode(str(run_payload.get("sweep_mode", SweepMode.STEPPED.value))),
+                streaming=bool(run_payload.get("streaming", False)),
+                dsp_executor=DspExecutor(str(run_payload.get("dsp_executor", DspExecutor.INLINE.value))),
+                max_in_flight=int(run_payload.get("max_in_flight", 4)),
+                adaptive_averaging=bool(run_payload.get("adaptive_averaging", False)),
+                target_uncertainty=float(run_payload.get("target_uncertainty", 0.01)),
+                max_averages=int(run_payload.get("max_averages", 8)),
+                refine_tolerance_db=float(run_payload.get("refine_tolerance_db", 1.0)),
+                refine_tolerance_deg=float(run_payload.get("refine_tolerance_deg", 10.0)),
+                refine_budget=int(run_payload.get("refine_budget", 200)),
+                pipelined=bool(run_payload.get("pipelined", False)),
+                verify_policy=VerifyPolicy(str(run_payload.get("verify_policy", VerifyPolicy.ALWAYS.value))),
+                verify_every=int(run_payload.get("verify_every", 10)),
             ),
             setup=InstrumentSetup(
                 awg=InstrumentEndpoint(
@@ -185,3 +222,20 @@ class JsonSettingsRepository:
             ),
             auto_save_data=bool(payload.get("auto_save_data", True)),
         )
+
+    def _segment_from_dict(self, payload: dict[str, object]) -> SweepSegment:
+        def optional(key: str, cast: type) -> object:
+            value = payload.get(key)
+            return None if value is None else cast(value)
+
+        return SweepSegment(
+            start_hz=float(payload.get("start_hz", 1e6)),
+            stop_hz=float(payload.get("stop_hz", 100e6)),
+            step_hz=optional("step_hz", float),
+            step_count=optional("step_count", int),
+            is_log=bool(payload.get("is_log", False)),
+            points_per_decade=optional("points_per_decade", float),
+            record_points=optional("record_points", int),
+            full_scale_v=optional("full_scale_v", float),
+            averages=int(payload.get("averages", 1)),
+        )
@@ -120,6 +120,10 @@ class AppWindow(tk.Tk):
         tk.Entry(parent, textvariable=self.vm.step_count).grid(row=row, column=1, sticky="ew")
         row += 1
 
+        add_label("Pts/decade", row)
+        tk.Entry(parent, textvariable=self.vm.points_per_decade).grid(row=row, column=1, sticky="ew")
+        row += 1
+
         tk.Checkbutton(parent, text="Log sweep", variable=self.vm.is_log).grid(row=row, column=0, columnspan=2, sticky="w")
         row += 1
 
@@ -185,10 +189,75 @@ class AppWindow(tk.Tk):
         )
         row += 1
 
+        add_label("Sweep mode", row)
+        ttk.Combobox(parent, textvariable=self.vm.sweep_mode, values=["stepped", "multisine", "chirp", "noise", "adaptive"], width=10).grid(
+            row=row, column=1, sticky="ew"
+        )
+        row += 1
+
+        add_label("Estimator", row)
+        ttk.Combobox(
+            parent,
+            textvariable=self.vm.estimator,
+            values=["fft", "single_bin", "coherent", "sine_fit", "zoom"],
+            width=10,
+        ).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("DSP", row)
+        ttk.Combobox(parent, textvariable=self.vm.dsp_executor, values=["inline", "thread", "process"], width=10).grid(
+            row=row, column=1, sticky="ew"
+        )
+        row += 1
+
+        add_label("DSP in flight", row)
+        tk.Entry(parent, textvariable=self.vm.max_in_flight).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Target uncert.", row)
+        tk.Entry(parent, textvariable=self.vm.target_uncertainty).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Max averages", row)
+        tk.Entry(parent, textvariable=self.vm.max_averages).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Refine dB", row)
+        tk.Entry(parent, textvariable=self.vm.refine_tolerance_db).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Refine deg", row)
+        tk.Entry(parent, textvariable=self.vm.refine_tolerance_deg).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Refine budget", row)
+        tk.Entry(parent, textvariable=self.vm.refine_budget).grid(row=row, column=1, sticky="ew")
+        row += 1
+
+        add_label("Verify AWG", row)
+        ttk.Combobox(parent, textvariable=self.vm.verify_policy, values=["always", "every_n", "first", "tone"], width=10).grid(
+            row=row, column=1, sticky="ew"
+        )
+        row += 1
+
+        add_label("Verify every", row)
+        tk.Entry(parent, textvariable=self.vm.verify_every).grid(row=row, column=1, sticky="ew")
+        row += 1
+
         tk.Checkbutton(parent, text="Auto range", variable=self.vm.auto_range).grid(row=row, column=0, columnspan=2, sticky="w")
         row += 1
         tk.Checkbutton(parent, text="Auto reset", variable=self.vm.auto_reset).grid(row=row, column=0, columnspan=2, sticky="w")
         row += 1
+        tk.Checkbutton(parent, text="Stream DSP", variable=self.vm.streaming).grid(row=row, column=0, columnspan=2, sticky="w")
+        row += 1
+        tk.Checkbutton(parent, text="Adaptive averaging", variable=self.vm.adaptive_averaging).grid(
+            row=row, column=0, columnspan=2, sticky="w"
+        )
+        row += 1
+        tk.Checkbutton(parent, text="Pipeline AWG retune", variable=self.vm.pipelined).grid(
+            row=row, column=0, columnspan=2, sticky="w"
+        )
+        row += 1
         tk.Checkbutton(parent, text="Enable calibration", variable=self.vm.calibration_enabled).grid(
             row=row, column=0, columnspan=2, sticky="w"
         )
@@ -236,6 +305,8 @@ class AppWindow(tk.Tk):
         self.btn_save_settings.pack(side=tk.LEFT, padx=2)
         self.btn_load_settings = tk.Button(buttons2, text="Load Settings", width=11)
         self.btn_load_settings.pack(side=tk.LEFT, padx=2)
+        self.btn_resume = tk.Button(buttons2, text="Resume", width=9)
+        self.btn_resume.pack(side=tk.LEFT, padx=2)
 
         parent.grid_columnconfigure(1, weight=1)
 
@@ -243,6 +314,7 @@ class AppWindow(tk.Tk):
         self,
         *,
         on_start,
+        on_resume,
         on_stop,
         on_save_data,
         on_load_data,
@@ -254,6 +326,7 @@ class AppWindow(tk.Tk):
         on_mag_phase_change,
     ) -> None:
         self.btn_start.configure(command=on_start)
+        self.btn_resume.configure(command=on_resume)
         self.btn_stop.configure(command=on_stop)
         self.btn_save_data.configure(command=on_save_data)
         self.btn_load_data.configure(command=on_load_data)
@@ -16,6 +16,7 @@ from app.application.events import (
     SweepWarning,
 )
 from app.application.services.connection_monitor import ConnectionMonitor
+from app.application.use_cases.checkpoint_sweep import CheckpointSweepUseCase
 from app.application.use_cases.load_measurement import LoadMeasurementUseCase
 from app.application.use_cases.load_reference import LoadReferenceUseCase
 from app.application.use_cases.save_measurement import SaveMeasurementUseCase
@@ -23,7 +24,11 @@ from app.application.use_cases.settings_use_case import SettingsUseCase
 from app.application.use_cases.start_sweep import StartSweepUseCase
 from app.application.use_cases.stop_sweep import StopSweepUseCase
 from app.domain.models import AppSettings, SweepResult
-from app.infrastructure.instruments.equips_factory import create_instrument_ports, resolve_visa_address
+from app.infrastructure.instruments.equips_factory import (
+    InstrumentPorts,
+    create_instrument_ports,
+    resolve_visa_address,
+)
 from app.infrastructure.instruments.ports import ResourceScannerPort
 from app.presentation.tk import dialogs
 from app.presentation.tk.app_window import AppWindow
@@ -41,6 +46,7 @@ class TkController:
         save_measurement_use_case: SaveMeasurementUseCase,
         load_measurement_use_case: LoadMeasurementUseCase,
         load_reference_use_case: LoadReferenceUseCase,
+        checkpoint_use_case: CheckpointSweepUseCase,
         scanner: ResourceScannerPort,
     ) -> None:
         self.window = window
@@ -50,6 +56,7 @@ class TkController:
         self.save_measurement_use_case = save_measurement_use_case
         self.load_measurement_use_case = load_measurement_use_case
         self.load_reference_use_case = load_reference_use_case
+        self.checkpoint_use_case = checkpoint_use_case
 
         self._event_queue: queue.Queue[object] = queue.Queue()
         self._latest_result = SweepResult()
@@ -70,6 +77,7 @@ class TkController:
     def initialize(self) -> None:
         self.window.bind_actions(
             on_start=self.on_start,
+            on_resume=self.on_resume,
             on_stop=self.on_stop,
             on_save_data=self.on_save_data,
             on_load_data=self.on_load_data,
@@ -106,14 +114,51 @@ class TkController:
             dialogs.show_warning(self.window, f"Invalid settings: {exc}")
             return
 
-        stop_event = threading.Event()
-        self._stop_use_case = StopSweepUseCase(stop_event=stop_event)
+        try:
+            cmd = self.checkpoint_use_case.start(
+                settings,
+                calibration_enabled=bool(self.vm.calibration_enabled.get()),
+                reference_interpolator=self._reference_interpolator,
+            )
+        except Exception as exc:  # noqa: BLE001
+            dialogs.show_warning(self.window, f"Checkpointing disabled: {exc}")
+            cmd = StartSweepCommand(
+                settings=settings,
+                calibration_enabled=bool(self.vm.calibration_enabled.get()),
+                reference_interpolator=self._reference_interpolator,
+            )
+
+        self._launch(cmd, ports)
+
+    def on_resume(self) -> None:
+        if self._sweep_thread and self._sweep_thread.is_alive():
+            return
 
-        cmd = StartSweepCommand(
-            settings=settings,
-            calibration_enabled=bool(self.vm.calibration_enabled.get()),
-            reference_interpolator=self._reference_interpolator,
+        fp = dialogs.ask_open_file(
+            title="Resume sweep",
+            initial_dir=self._root_dir / "__data__" / "checkpoints",
+            filetypes=[("Sweep checkpoint", "*.jsonl"), ("All files", "*.*")],
         )
+        if fp is None:
+            return
+
+        try:
+            cmd = self.checkpoint_use_case.resume(
+                str(fp),
+                calibration_enabled=bool(self.vm.calibration_enabled.get()),
+                reference_interpolator=self._reference_interpolator,
+            )
+            ports = create_instrument_ports(cmd.settings.setup)
+        except Exception as exc:  # noqa: BLE001
+            dialogs.show_warning(self.window, f"Failed to resume sweep: {exc}")
+            return
+
+        settings_to_vm(cmd.settings, self.vm)
+        self._launch(cmd, ports)
+
+    def _launch(self, cmd: StartSweepCommand, ports: InstrumentPorts) -> None:
+        stop_event = threading.Event()
+        self._stop_use_case = StopSweepUseCase(stop_event=stop_event)
 
         self._ports = ports
         start_use_case = StartSweepUseCase(awg=ports.awg, osc=ports.osc, stop_event=stop_event)
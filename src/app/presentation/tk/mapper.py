@@ -6,9 +6,13 @@ from app.domain.enums import (
     ConnectionMode,
     CorrectionMode,
     CouplingMode,
+    DspExecutor,
     ImpedanceMode,
     MagnitudePhaseMode,
+    SweepMode,
+    ToneEstimator,
     TriggerMode,
+    VerifyPolicy,
 )
 from app.domain.models import (
     AppSettings,
@@ -32,6 +36,14 @@ def _safe_int(value: str, default: int) -> int:
         return default
 
 
+def _safe_float(value: str, default: float) -> float:
+    parsed = CvtTools.parse_general_val(value)
+    try:
+        return float(parsed)
+    except Exception:
+        return default
+
+
 
 def vm_to_settings(vm: ViewModel) -> AppSettings:
     freq_unit = vm.freq_unit.get()
@@ -42,6 +54,7 @@ def vm_to_settings(vm: ViewModel) -> AppSettings:
 
     step_hz = None if is_log else float(CvtTools.parse_to_hz(vm.step_freq.get(), freq_unit))
     step_count = _safe_int(vm.step_count.get(), 100) if is_log else None
+    points_per_decade = _safe_float(vm.points_per_decade.get(), 0.0) if is_log else 0.0
 
     correction_mode = CorrectionMode(vm.correction_mode.get())
     trigger_mode = TriggerMode(vm.trigger_mode.get())
@@ -55,12 +68,28 @@ def vm_to_settings(vm: ViewModel) -> AppSettings:
             step_hz=step_hz,
             step_count=step_count,
             is_log=is_log,
+            points_per_decade=points_per_decade if points_per_decade > 0 else None,
+            segments=list(vm.sweep_segments),
         ),
         run_mode=RunMode(
             correction_mode=correction_mode,
             trigger_mode=trigger_mode,
             auto_range=bool(vm.auto_range.get()),
             auto_reset=bool(vm.auto_reset.get()),
+            estimator=ToneEstimator(vm.estimator.get()),
+            sweep_mode=SweepMode(vm.sweep_mode.get()),
+            streaming=bool(vm.streaming.get()),
+            dsp_executor=DspExecutor(vm.dsp_executor.get()),
+            max_in_flight=_safe_int(vm.max_in_flight.get(), 4),
+            adaptive_averaging=bool(vm.adaptive_averaging.get()),
+            target_uncertainty=_safe_float(vm.target_uncertainty.get(), 0.01),
+            max_averages=_safe_int(vm.max_averages.get(), 8),
+            refine_tolerance_db=_safe_float(vm.refine_tolerance_db.get(), 1.0),
+            refine_tolerance_deg=_safe_float(vm.refine_tolerance_deg.get(), 10.0),
+            refine_budget=_safe_int(vm.refine_budget.get(), 200),
+            pipelined=bool(vm.pipelined.get()),
+            verify_policy=VerifyPolicy(vm.verify_policy.get()),
+            verify_every=_safe_int(vm.verify_every.get(), 10),
         ),
         setup=InstrumentSetup(
             awg=InstrumentEndpoint(
@@ -109,6 +138,10 @@ def settings_to_vm(settings: AppSettings, vm: ViewModel) -> None:
         vm.step_freq.set(str(round(settings.sweep.step_hz / scale, 6)))
     vm.step_count.set(str(settings.sweep.step_count or 100))
     vm.is_log.set(settings.sweep.is_log)
+    vm.sweep_segments = list(settings.sweep.segments)
+    vm.points_per_decade.set(
+        "" if settings.sweep.points_per_decade is None else str(settings.sweep.points_per_decade)
+    )
 
     vm.awg_model.set(settings.setup.awg.model)
     vm.osc_model.set(settings.setup.osc.model)
@@ -135,8 +168,22 @@ def settings_to_vm(settings: AppSettings, vm: ViewModel) -> None:
 
     vm.correction_mode.set(settings.run_mode.correction_mode.value)
     vm.trigger_mode.set(settings.run_mode.trigger_mode.value)
+    vm.estimator.set(settings.run_mode.estimator.value)
+    vm.sweep_mode.set(settings.run_mode.sweep_mode.value)
     vm.auto_range.set(settings.run_mode.auto_range)
     vm.auto_reset.set(settings.run_mode.auto_reset)
+    vm.streaming.set(settings.run_mode.streaming)
+    vm.dsp_executor.set(settings.run_mode.dsp_executor.value)
+    vm.max_in_flight.set(str(settings.run_mode.max_in_flight))
+    vm.adaptive_averaging.set(settings.run_mode.adaptive_averaging)
+    vm.target_uncertainty.set(str(settings.run_mode.target_uncertainty))
+    vm.max_averages.set(str(settings.run_mode.max_averages))
+    vm.refine_tolerance_db.set(str(settings.run_mode.refine_tolerance_db))
+    vm.refine_tolerance_deg.set(str(settings.run_mode.refine_tolerance_deg))
+    vm.refine_budget.set(str(settings.run_mode.refine_budget))
+    vm.pipelined.set(settings.run_mode.pipelined)
+    vm.verify_policy.set(settings.run_mode.verify_policy.value)
+    vm.verify_every.set(str(settings.run_mode.verify_every))
 
     vm.magnitude_phase_mode.set(settings.magnitude_phase_mode.value)
     vm.auto_save_data.set(settings.auto_save_data)
@@ -23,6 +23,8 @@ class ViewModel:
         self.step_freq = tk.StringVar(root, value="1.0")
         self.step_count = tk.StringVar(root, value="100")
         self.is_log = tk.BooleanVar(root, value=False)
+        self.points_per_decade = tk.StringVar(root, value="")
+        self.sweep_segments: list = []
 
         self.awg_amp = tk.StringVar(root, value="1.0")
         self.awg_imp = tk.StringVar(root, value=Mapping.mapping_imp_r50)
@@ -40,8 +42,22 @@ class ViewModel:
 
         self.correction_mode = tk.StringVar(root, value="none")
         self.trigger_mode = tk.StringVar(root, value="free_run")
+        self.estimator = tk.StringVar(root, value="fft")
+        self.sweep_mode = tk.StringVar(root, value="stepped")
         self.auto_range = tk.BooleanVar(root, value=True)
         self.auto_reset = tk.BooleanVar(root, value=True)
+        self.streaming = tk.BooleanVar(root, value=False)
+        self.dsp_executor = tk.StringVar(root, value="inline")
+        self.max_in_flight = tk.StringVar(root, value="4")
+        self.adaptive_averaging = tk.BooleanVar(root, value=False)
+        self.target_uncertainty = tk.StringVar(root, value="0.01")
+        self.max_averages = tk.StringVar(root, value="8")
+        self.refine_tolerance_db = tk.StringVar(root, value="1.0")
+        self.refine_tolerance_deg = tk.StringVar(root, value="10.0")
+        self.refine_budget = tk.StringVar(root, value="200")
+        self.pipelined = tk.BooleanVar(root, value=False)
+        self.verify_policy = tk.StringVar(root, value="always")
+        self.verify_every = tk.StringVar(root, value="10")
         self.calibration_enabled = tk.BooleanVar(root, value=False)
         self.auto_save_data = tk.BooleanVar(root, value=True)
 
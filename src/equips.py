@@ -346,16 +346,83 @@ class instAWG(InstrumentBase):
     def set_on(self, ch:int):
         self.set_error("Function not implemented")
 
+    def set_arb_waveform(self, samples: np.ndarray, ch: int):
+        self.set_error("Function not implemented")
+
+    def set_sine(self, ch: int):
+        self.set_error("Function not implemented")
+
+    def set_sweep(self, start: float, stop: float, time_s: float, log: bool, ch: int):
+        self.set_error("Function not implemented")
+
+    def set_sweep_off(self, ch: int):
+        self.set_error("Function not implemented")
+
+    def set_noise(self, ch: int):
+        self.set_error("Function not implemented")
+
     def rst(self):
         super().rst()
 
 class instOSC(InstrumentBase):
     Equip_Type = "osc"
     chan_num = 4
+    acq_timeout_s = 15.0
+    acq_timeout_margin_s = 5.0
+    poll_interval_max_s = 0.05
+    # Whether *OPC? blocks until a single-sequence acquisition has finished.
+    opc_waits_acquisition = False
 
     def __init__(self, name="", visa_address=""):
         super().__init__(name, visa_address)
         self.sampling_rate = 0 
+        self.acq_window_s = 0.0
+
+    def acquisition_timeout_s(self) -> float:
+        # A long window must be allowed to finish before the fixed timeout can apply.
+        return max(self.acq_timeout_s, self.acq_window_s + self.acq_timeout_margin_s)
+
+    def wait_opc(self, timeout_s: float = None):
+        self.check_open()
+        timeout_s = self.acquisition_timeout_s() if timeout_s is None else timeout_s
+        previous = self.Inst.timeout
+        self.Inst.timeout = int(1000 * timeout_s)
+        try:
+            done = self.query("*OPC?").strip() == "1"
+        except bATEinst_Exception:
+            done = False
+        finally:
+            self.Inst.timeout = previous
+        if not done:
+            self.set_error("Operation not complete after %.1f s" % timeout_s)
+
+    def wait_until(self, is_done, timeout_s: float = None, expected_s: float = 0.0) -> bool:
+        # Nothing can finish before the expected time; afterwards poll at a quarter of it,
+        # backing off towards poll_interval_max_s.
+        if timeout_s is None:
+            timeout_s = self.acquisition_timeout_s()
+        if expected_s > 0:
+            timeout_s = max(timeout_s, expected_s + self.acq_timeout_margin_s)
+        deadline = time.perf_counter() + timeout_s
+        interval = min(max(expected_s / 4.0, 1e-3), self.poll_interval_max_s)
+        if expected_s > 0:
+            time.sleep(expected_s)
+        while True:
+            try:
+                if is_done():
+                    return True
+            except Exception:
+                pass
+            if time.perf_counter() >= deadline:
+                return False
+            time.sleep(interval)
+            interval = min(2.0 * interval, self.poll_interval_max_s)
+
+    def wait_acquisition(self, is_done):
+        if self.opc_waits_acquisition:
+            self.wait_opc()
+        elif not self.wait_until(is_done, expected_s=self.acq_window_s):
+            self.set_error("Acquisition not complete after %.1f s" % self.acquisition_timeout_s())
 
     def set_x(self, xscale: float, xoffset: float=None):
         self.set_error("Function not implemented")
@@ -366,6 +433,9 @@ class instOSC(InstrumentBase):
     def get_y(self, ch: int) -> Tuple[float]:
         self.set_error("Function not implemented")
 
+    def set_record_length(self, points: int):
+        self.set_error("Function not implemented")
+
     def get_sample_rate(self) -> int:
         self.set_error("Function not implemented")
 
@@ -375,9 +445,31 @@ class instOSC(InstrumentBase):
     def trig_measure(self, ch: int):
         self.set_error("Function not implemented")
     
-    def read_raw_waveform(self, ch: int, points: int) -> Tuple[np.array]:
+    def read_waveform_preamble(self, ch: int, points: int) -> dict:
         self.set_error("Function not implemented")
 
+    def iter_waveform_blocks(self, preamble: dict):
+        self.set_error("Function not implemented")
+
+    def read_raw_codes(self, ch: int = None, points: int = None) -> Tuple[np.array, dict]:
+        preamble = self.read_waveform_preamble(ch, points)
+        n = preamble["n"]
+        codes = np.zeros(n, dtype=preamble["dtype"])
+        for offset, block in self.iter_waveform_blocks(preamble):
+            stop = min(offset + len(block), n)
+            codes[offset:stop] = block[:stop - offset]
+        return codes, preamble
+
+    def read_raw_waveform(self, ch: int = None, points: int = None) -> Tuple[np.array]:
+        codes, preamble = self.read_raw_codes(ch, points)
+        n = len(codes)
+
+        idx = np.arange(n, dtype=np.float64)
+        times = preamble["t0"] + preamble["dt"] * idx
+        volts = codes.astype(np.float64) * preamble["y_scale"] + preamble["y_offset"]
+
+        return times, volts
+
     def set_free_run(self):
         self.set_error("Function not implemented")
 
@@ -577,6 +669,7 @@ class instOSC_DS1104(InstrumentBase):
 class instOSC_MDO34(instOSC):
     Model_Supported = ["MDO34", "MDO3024"]
     chan_num = 4
+    opc_waits_acquisition = True
 
     def __init__(self, name, visa_address: str):
         super().__init__(name=name, visa_address=visa_address)
@@ -588,6 +681,7 @@ class instOSC_MDO34(instOSC):
 
     def set_x(self, xscale: float, xoffset: float = 0.0):
         self.x_write([":HORizontal:SCAle %6e" %xscale, "*OPC?"])
+        self.acq_window_s = 10.0 * xscale
 
         if xoffset is not None:
             self.x_write([":HORizontal:POSition %6e" %xoffset, "*OPC?"])
@@ -614,34 +708,21 @@ class instOSC_MDO34(instOSC):
             "ACQuire:STATE 1",        
         ])
 
-        t0 = time.time()
-        while time.time()-t0 < 15.0:        
-            if self.query("ACQuire:STATE?").strip() == "0":
-                break
-            time.sleep(0.05)
+        self.wait_acquisition(self._acquisition_stopped)
+
+    def _acquisition_stopped(self) -> bool:
+        return self.query("ACQuire:STATE?").strip() == "0"
 
     def quick_measure(self):
         self.x_write(["*CLS",
                       "ACQuire:STOPAfter SEQuence",
                       "ACQuire:STATE RUN"])
         
-        t0 = time.time()
-        while time.time() - t0 < 4.0:
-            try:
-                st = self.query("TRIGger:STATE?").strip().upper()
-                if st != "RUN":
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        self.wait_until(lambda: self.query("TRIGger:STATE?").strip().upper() != "RUN", timeout_s=4.0)
         
         self.x_write(["TRIGger FORCe"])
         
-        t0 = time.time()
-        while time.time()-t0 < 15.0:        
-            if self.query("ACQuire:STATE?").strip() == "0":
-                break
-            time.sleep(0.05)
+        self.wait_acquisition(self._acquisition_stopped)
         
     def auto_run(self):
         self.x_write(["TRIGger:A:MODe AUTO", "ACQuire:STOPAfter RUNStop", "ACQuire:STATE 1"])
@@ -674,19 +755,18 @@ class instOSC_MDO34(instOSC):
                 dd = self.read_block()
                 fid.write(dd)
 
-    def read_raw_waveform(self, ch: int = None, points: int = None) -> Tuple[np.array]:
-
-        time.sleep(0.2)
+    def read_waveform_preamble(self, ch: int = None, points: int = None) -> dict:
 
         try:
             _pts = int(points) if points is not None else None
         except Exception:
             _pts = None
+        ch = ch if ch else 1
         self.x_write([":WFMO:ENC BIN",
                       ":WFMO:BN_FMT RI",
                       ":WFMO:BYT_O MSB",
                       ":WFMO:BYT_N 1",
-                      f":DAT:SOU CH{ch if ch else 1}",
+                      f":DAT:SOU CH{ch}",
                       ":DAT:START 1",
                       f":DAT:STOP {_pts if _pts else 20000000}",
                       "*OPC?"])
@@ -700,31 +780,33 @@ class instOSC_MDO34(instOSC):
         y_zero  =  float(self.x_write(":WFMO:YZEro?")[0])
 
         n = n_total if _pts is None else min(n_total, int(_pts))
-        n = int(n)
-        raw_bytes = bytearray(n)
-        n_block = 20000
-
-        for k in range(1, n, n_block):
-            start = k
-            stop = min(k + n_block - 1, n)
+        return {"ch": ch,
+                "n": int(n),
+                "t0": x_zero - x_inc * pt_off,
+                "dt": x_inc,
+                "y_scale": y_mult,
+                "y_offset": y_zero - y_off * y_mult,
+                "dtype": np.int8}
+
+    def iter_waveform_blocks(self, preamble: dict, n_block: int = 20000):
+        ch = preamble["ch"]
+        n = preamble["n"]
+        for start in range(1, n + 1, n_block):
+            stop = min(start + n_block - 1, n)
             self.x_write([f":DAT:SOU CH{ch}", 
                           f":DAT:START {start}",
                           f":DAT:STOP {stop}",
                           "*OPC?"])
             self.write("CURV?")
             block = self.read_block()
-            raw_bytes[start - 1 : start - 1 + len(block)] = block
-
-        raw     = np.frombuffer(raw_bytes, dtype=np.int8)
-        idx   = np.arange(n, dtype=np.float64)
-        times = x_zero + x_inc * (idx - pt_off)
-        volts   = (raw.astype(np.float64) - y_off) * y_mult + y_zero
-
-        return times, volts
+            yield start - 1, np.frombuffer(bytes(block), dtype=np.int8)
 
     def read_raw_data(self):
         self.x_write(("CURV?"))
 
+    def set_record_length(self, points: int):
+        self.x_write([":HORizontal:RECOrdlength %d" % int(points), "*OPC?"])
+
     def get_sample_rate(self) -> int:
         sampling_rate = int(float(self.x_write(["ACQ:MAXS?"])[0].strip()))
         return sampling_rate
@@ -757,6 +839,7 @@ class instOSC_MDO34(instOSC):
 class instOSC_MDO3024(instOSC):
     Model_Supported = ["MDO3024", "MDO34"]
     chan_num = 4
+    opc_waits_acquisition = True
 
     def __init__(self, name, visa_address: str):
         super().__init__(name=name, visa_address=visa_address)
@@ -768,6 +851,7 @@ class instOSC_MDO3024(instOSC):
 
     def set_x(self, xscale: float, xoffset: float = 0.0):
         self.x_write([":HORizontal:SCAle %6e" %xscale, "*OPC?"])
+        self.acq_window_s = 10.0 * xscale
 
         if xoffset is not None:
             self.x_write([":HORizontal:POSition %6e" %xoffset, "*OPC?"])
@@ -794,11 +878,10 @@ class instOSC_MDO3024(instOSC):
             "ACQuire:STATE 1",        
         ])
 
-        t0 = time.time()
-        while time.time()-t0 < 15.0:        
-            if self.query("ACQuire:STATE?").strip() == "0":
-                break
-            time.sleep(0.05)
+        self.wait_acquisition(self._acquisition_stopped)
+
+    def _acquisition_stopped(self) -> bool:
+        return self.query("ACQuire:STATE?").strip() == "0"
 
     def quick_measure(self):
         time.sleep(0.1)
@@ -823,10 +906,7 @@ class instOSC_MDO3024(instOSC):
         time.sleep(0.5)
         self.x_write(["TRIGger FORCe"])
 
-        while time.time()-t0 < 10.0:        
-            if self.query("ACQuire:STATE?").strip() == "0":
-                return
-            time.sleep(0.1)
+        self.wait_acquisition(self._acquisition_stopped)
         
     def auto_run(self):
         self.x_write(["TRIGger:A:MODe AUTO", "ACQuire:STOPAfter RUNStop", "ACQuire:STATE 1"])
@@ -859,19 +939,18 @@ class instOSC_MDO3024(instOSC):
                 dd = self.read_block()
                 fid.write(dd)
 
-    def read_raw_waveform(self, ch: int = None, points: int = None) -> Tuple[np.array]:
-
-        time.sleep(0.2)
+    def read_waveform_preamble(self, ch: int = None, points: int = None) -> dict:
 
         try:
             _pts = int(points) if points is not None else None
         except Exception:
             _pts = None
+        ch = ch if ch else 1
         self.x_write([":WFMO:ENC BIN",
                       ":WFMO:BN_FMT RI",
                       ":WFMO:BYT_O MSB",
                       ":WFMO:BYT_N 1",
-                      f":DAT:SOU CH{ch if ch else 1}",
+                      f":DAT:SOU CH{ch}",
                       ":DAT:START 1",
                       f":DAT:STOP {_pts if _pts else 20000000}",
                       "*OPC?"])
@@ -885,31 +964,33 @@ class instOSC_MDO3024(instOSC):
         y_zero  =  float(self.x_write(":WFMO:YZEro?")[0])
 
         n = n_total if _pts is None else min(n_total, int(_pts))
-        n = int(n)
-        raw_bytes = bytearray(n)
-        n_block = 20000
-
-        for k in range(1, n, n_block):
-            start = k
-            stop = min(k + n_block - 1, n)
+        return {"ch": ch,
+                "n": int(n),
+                "t0": x_zero - x_inc * pt_off,
+                "dt": x_inc,
+                "y_scale": y_mult,
+                "y_offset": y_zero - y_off * y_mult,
+                "dtype": np.int8}
+
+    def iter_waveform_blocks(self, preamble: dict, n_block: int = 20000):
+        ch = preamble["ch"]
+        n = preamble["n"]
+        for start in range(1, n + 1, n_block):
+            stop = min(start + n_block - 1, n)
             self.x_write([f":DAT:SOU CH{ch}", 
                           f":DAT:START {start}",
                           f":DAT:STOP {stop}",
                           "*OPC?"])
             self.write("CURV?")
             block = self.read_block()
-            raw_bytes[start - 1 : start - 1 + len(block)] = block
-
-        raw     = np.frombuffer(raw_bytes, dtype=np.int8)
-        idx   = np.arange(n, dtype=np.float64)
-        times = x_zero + x_inc * (idx - pt_off)
-        volts   = (raw.astype(np.float64) - y_off) * y_mult + y_zero
-
-        return times, volts
+            yield start - 1, np.frombuffer(bytes(block), dtype=np.int8)
 
     def read_raw_data(self):
         self.x_write(("CURV?"))
 
+    def set_record_length(self, points: int):
+        self.x_write([":HORizontal:RECOrdlength %d" % int(points), "*OPC?"])
+
     def get_sample_rate(self) -> int:
         sampling_rate = int(float(self.x_write(["ACQ:MAXS?"])[0].strip()))
         return sampling_rate
@@ -950,6 +1031,7 @@ class instOSC_DHO1202(instOSC):
         cmds = []
         if xscale is not None:
             cmds.append(f":TIMebase:MAIN:SCALe {xscale}")
+            self.acq_window_s = 10.0 * float(xscale)
         if xoffset is not None:
             cmds.append(f":TIMebase:MAIN:OFFSet {xoffset}")
         if cmds:
@@ -977,6 +1059,14 @@ class instOSC_DHO1202(instOSC):
         offs  = float(self.x_write(f":CHANnel{ch}:OFFSet?")[0].strip())
         return (scale, offs)
 
+    def set_record_length(self, points: int):
+        """
+        Set the acquisition memory depth (1k, 10k, ... points).
+        """
+        depth = int(points)
+        token = f"{depth // 1_000_000}M" if depth >= 1_000_000 else f"{depth // 1_000}k"
+        self.x_write([f":ACQuire:MDEPth {token}", "*OPC?"])
+
     def get_sample_rate(self) -> int:
         """
         Read the current sample rate in Hz.
@@ -992,14 +1082,10 @@ class instOSC_DHO1202(instOSC):
         """
         self.x_write(["*CLS", ":STOP", ":SINGle"])
 
-        t0 = time.time()
-        while time.time() - t0 < 15.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "STOP": 
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        self.wait_acquisition(self._trigger_stopped)
+
+    def _trigger_stopped(self) -> bool:
+        return self.query(":TRIGger:STATus?").strip().upper() == "STOP"
 
 
     def quick_measure(self):
@@ -1012,32 +1098,17 @@ class instOSC_DHO1202(instOSC):
             ":SINGle"                            
         ])
 
-        t0 = time.time()
-        while time.time() - t0 < 2.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "WAIT":  # Waiting for trigger
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        # Waiting for trigger
+        self.wait_until(lambda: self.query(":TRIGger:STATus?").strip().upper() == "WAIT", timeout_s=2.0)
 
         # Poll until the acquisition finishes.
-        t0 = time.time()
-        while time.time() - t0 < 15.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "STOP":  # Acquisition complete
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        self.wait_acquisition(self._trigger_stopped)
 
-    def read_raw_waveform(self, ch: int, points: int):
+    def read_waveform_preamble(self, ch: int, points: int) -> dict:
         """
-        Read the raw waveform from a channel and convert it to time/voltage arrays.
+        Stop acquisition and read the waveform scaling for a channel.
         """
 
-        time.sleep(0.2)
-
         self.x_write([":STOP"])  
         self.x_write([
             f":WAVeform:SOURce CHANnel{ch}",
@@ -1052,22 +1123,21 @@ class instOSC_DHO1202(instOSC):
         yref = float(self.query(":WAVeform:YREFerence?"))
         yorg = float(self.query(":WAVeform:YORigin?"))
 
-        raw_bytes = bytearray(points)
-        block = 20000  
+        return {"ch": ch,
+                "n": int(points),
+                "t0": xorg - xinc * xref,
+                "dt": xinc,
+                "y_scale": yinc,
+                "y_offset": -(yorg + yref) * yinc,
+                "dtype": np.uint8}
 
+    def iter_waveform_blocks(self, preamble: dict, block: int = 20000):
+        points = preamble["n"]
         for start in range(1, points + 1, block):
             stop = min(start + block - 1, points)
             self.x_write([f":WAVeform:STARt {start}", f":WAVeform:STOP {stop}"])
             chunk = self.read_block(":WAVeform:DATA?")
-            raw_bytes[start - 1 : start - 1 + len(chunk)] = chunk
-
-        data = np.frombuffer(raw_bytes, dtype=np.uint8)
-        idx = np.arange(len(data), dtype=np.float64)
-
-        times = xorg + xinc * (idx - xref)  
-        volts = (data.astype(np.float64) - yorg - yref) * yinc
-
-        return times, volts
+            yield start - 1, np.frombuffer(bytes(chunk), dtype=np.uint8)
 
 
     def set_free_run(self):
@@ -1116,6 +1186,7 @@ class instOSC_DHO1204(instOSC):
         cmds = []
         if xscale is not None:
             cmds.append(f":TIMebase:MAIN:SCALe {xscale}")
+            self.acq_window_s = 10.0 * float(xscale)
         if xoffset is not None:
             cmds.append(f":TIMebase:MAIN:OFFSet {xoffset}")
         if cmds:
@@ -1143,6 +1214,14 @@ class instOSC_DHO1204(instOSC):
         offs  = float(self.x_write(f":CHANnel{ch}:OFFSet?")[0].strip())
         return (scale, offs)
 
+    def set_record_length(self, points: int):
+        """
+        Set the acquisition memory depth (1k, 10k, ... points).
+        """
+        depth = int(points)
+        token = f"{depth // 1_000_000}M" if depth >= 1_000_000 else f"{depth // 1_000}k"
+        self.x_write([f":ACQuire:MDEPth {token}", "*OPC?"])
+
     def get_sample_rate(self) -> int:
         """
         Read the current sampling rate in Hz.
@@ -1157,14 +1236,10 @@ class instOSC_DHO1204(instOSC):
         """
         self.x_write(["*CLS", ":STOP", ":SINGle"])
 
-        t0 = time.time()
-        while time.time() - t0 < 15.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "STOP": 
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        self.wait_acquisition(self._trigger_stopped)
+
+    def _trigger_stopped(self) -> bool:
+        return self.query(":TRIGger:STATus?").strip().upper() == "STOP"
 
     def quick_measure(self):
         """
@@ -1176,35 +1251,20 @@ class instOSC_DHO1204(instOSC):
             ":SINGle"                            
         ])
 
-        t0 = time.time()
-        while time.time() - t0 < 2.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "WAIT":  # Waiting for trigger
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        # Waiting for trigger
+        self.wait_until(lambda: self.query(":TRIGger:STATus?").strip().upper() == "WAIT", timeout_s=2.0)
 
         # Force a trigger once.
         self.x_write([":TFORce"])
 
         # Poll until acquisition finishes.
-        t0 = time.time()
-        while time.time() - t0 < 15.0:
-            try:
-                if self.query(":TRIGger:STATus?").strip().upper() == "STOP":  # Acquisition complete
-                    break
-            except Exception:
-                pass
-            time.sleep(0.05)
+        self.wait_acquisition(self._trigger_stopped)
 
-    def read_raw_waveform(self, ch: int, points: int):
+    def read_waveform_preamble(self, ch: int, points: int) -> dict:
         """
-        Read raw waveform data for a channel and convert to time/voltage.
+        Stop acquisition and read the waveform scaling for a channel.
         """
 
-        time.sleep(0.2)
-
         self.x_write([":STOP"])  
         self.x_write([
             f":WAVeform:SOURce CHANnel{ch}",
@@ -1219,22 +1279,21 @@ class instOSC_DHO1204(instOSC):
         yref = float(self.query(":WAVeform:YREFerence?"))
         yorg = float(self.query(":WAVeform:YORigin?"))
 
-        raw_bytes = bytearray(points)
-        block = 20000  
+        return {"ch": ch,
+                "n": int(points),
+                "t0": xorg - xinc * xref,
+                "dt": xinc,
+                "y_scale": yinc,
+                "y_offset": -(yorg + yref) * yinc,
+                "dtype": np.uint8}
 
+    def iter_waveform_blocks(self, preamble: dict, block: int = 20000):
+        points = preamble["n"]
         for start in range(1, points + 1, block):
             stop = min(start + block - 1, points)
             self.x_write([f":WAVeform:STARt {start}", f":WAVeform:STOP {stop}"])
             chunk = self.read_block(":WAVeform:DATA?")
-            raw_bytes[start - 1 : start - 1 + len(chunk)] = chunk
-
-        data = np.frombuffer(raw_bytes, dtype=np.uint8)
-        idx = np.arange(len(data), dtype=np.float64)
-
-        times = xorg + xinc * (idx - xref)  
-        volts = (data.astype(np.float64) - yorg - yref) * yinc
-
-        return times, volts
+            yield start - 1, np.frombuffer(bytes(chunk), dtype=np.uint8)
 
 
     def set_free_run(self):
@@ -1465,6 +1524,30 @@ class instAWG_DG4102(instAWG):
         amp = float(self.x_write(f":SOUR{ch}:VOLT:AMPL?")[0].strip())
         return amp
    
+    def set_arb_waveform(self, samples: np.ndarray, ch: int = None):
+        values = ",".join("%.4f" % v for v in np.clip(np.asarray(samples, dtype=float), -1.0, 1.0))
+        self.x_write([f":SOUR{ch}:APPL:USER", "*OPC?"])
+        self.x_write([f":SOUR{ch}:DATA VOLATILE,{values}", "*OPC?"])
+
+    def set_sine(self, ch: int = None):
+        self.set_mode(self.MODE.SIN, ch)
+
+    def set_sweep(self, start: float, stop: float, time_s: float, log: bool = False, ch: int = None):
+        self.x_write([f":SOUR{ch}:APPL:SIN", "*OPC?"])
+        self.x_write([f":SOUR{ch}:SWE:SPAC {'LOG' if log else 'LIN'}",
+                      f":SOUR{ch}:FREQ:STAR {start}",
+                      f":SOUR{ch}:FREQ:STOP {stop}",
+                      f":SOUR{ch}:SWE:TIME {time_s}",
+                      f":SOUR{ch}:SWE:TRIG:SOUR INT",
+                      f":SOUR{ch}:SWE:STAT ON",
+                      "*OPC?"])
+
+    def set_sweep_off(self, ch: int = None):
+        self.x_write([f":SOUR{ch}:SWE:STAT OFF", "*OPC?"])
+
+    def set_noise(self, ch: int = None):
+        self.set_mode("NOIS", ch)
+
     def set_burst_phase(self,ph, ch=None):
         for ch in self.ch2chs(ch):
             self.x_write([":SOUR%d:BURS:PHAS %.4f" %(ch,ph), "*OPC?"] )
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import multiprocessing
+
+from app.application.use_cases.checkpoint_sweep import CheckpointSweepUseCase
 from app.application.use_cases.load_measurement import LoadMeasurementUseCase
 from app.application.use_cases.load_reference import LoadReferenceUseCase
 from app.application.use_cases.save_measurement import SaveMeasurementUseCase
 from app.application.use_cases.settings_use_case import SettingsUseCase
 from app.infrastructure.instruments.resource_scanner import PyVisaResourceScanner
+from app.infrastructure.persistence.checkpoint_repo_jsonl import JsonlCheckpointRepository
 from app.infrastructure.persistence.measurement_repo_mat_csv import MatCsvMeasurementRepository
 from app.infrastructure.persistence.reference_repo_mat import MatReferenceRepository
 from app.infrastructure.persistence.settings_repo_json import JsonSettingsRepository
@@ -19,6 +23,7 @@ def main() -> None:
     settings_repo = JsonSettingsRepository()
     measurement_repo = MatCsvMeasurementRepository()
     reference_repo = MatReferenceRepository()
+    checkpoint_repo = JsonlCheckpointRepository(settings_codec=settings_repo)
 
     controller = TkController(
         window=window,
@@ -27,6 +32,7 @@ def main() -> None:
         save_measurement_use_case=SaveMeasurementUseCase(measurement_repo),
         load_measurement_use_case=LoadMeasurementUseCase(measurement_repo),
         load_reference_use_case=LoadReferenceUseCase(reference_repo),
+        checkpoint_use_case=CheckpointSweepUseCase(checkpoint_repo),
         scanner=PyVisaResourceScanner(),
     )
     controller.initialize()
@@ -35,4 +41,6 @@ def main() -> None:
 
 
 if __name__ == "__main__":
+    # Frozen builds re-run this script in each process-pool worker; let them exit into the worker loop.
+    multiprocessing.freeze_support()
     main()
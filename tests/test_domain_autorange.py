@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.domain.autorange import VppPredictor, target_range_for
+
+
+class AutorangeTests(unittest.TestCase):
+    def test_predictor_extrapolates_log_log_slope(self) -> None:
+        predictor = VppPredictor()
+        self.assertIsNone(predictor.predict(1_000.0))
+        for freq in (1_000.0, 2_000.0, 4_000.0):
+            predictor.observe(freq, 1_000.0 / freq)
+
+        self.assertAlmostEqual(predictor.predict(8_000.0), 0.125, places=9)
+        self.assertAlmostEqual(predictor.predict(3_000.0), 1.0 / 3.0, places=9)
+
+    def test_predictor_limits_a_single_step(self) -> None:
+        predictor = VppPredictor(max_step=4.0)
+        predictor.observe(1_000.0, 1.0)
+        predictor.observe(1_001.0, 0.5)
+
+        self.assertAlmostEqual(predictor.predict(10_000.0), 0.5 / 4.0, places=9)
+
+    def test_target_range_keeps_in_band_signal(self) -> None:
+        self.assertEqual(target_range_for(0.7, 1.0), 1.0)
+        self.assertAlmostEqual(target_range_for(0.9, 1.0), 0.9 / 0.7)
+        self.assertEqual(target_range_for(0.07, 1.0), 0.5)
+        self.assertAlmostEqual(target_range_for(0.07, 1.0, max_shrink=0.0), 0.1)
+
+
+if __name__ == "__main__":
+    unittest.main()
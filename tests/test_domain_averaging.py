@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+from scipy.stats import t as student_t
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.domain.averaging import PhasorWelford, needs_more_acquisitions, predicted_relative_uncertainty
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import measure_record_with_snr
+
+
+class AveragingTests(unittest.TestCase):
+    def test_welford_matches_batch_statistics(self) -> None:
+        rng = np.random.default_rng(3)
+        values = 0.5 + 0.2j + 0.01 * (rng.normal(size=50) + 1j * rng.normal(size=50))
+        stats = PhasorWelford()
+        for value in values:
+            stats.add(value)
+
+        self.assertAlmostEqual(abs(stats.mean - np.mean(values)), 0.0, places=12)
+        self.assertAlmostEqual(stats.variance, float(np.var(values, ddof=1)), places=12)
+        self.assertAlmostEqual(
+            stats.half_width(), student_t.ppf(0.975, 49) * np.sqrt(np.var(values, ddof=1) / 50), places=12
+        )
+
+    def test_first_acquisition_snr_decides_whether_to_average(self) -> None:
+        fs = 100_000
+        t = np.arange(4096) / fs
+        rng = np.random.default_rng(5)
+        clean = WaveformRecord.from_arrays(t, np.sin(2.0 * np.pi * 1_000.0 * t))
+        noisy = WaveformRecord.from_arrays(t, np.sin(2.0 * np.pi * 1_000.0 * t) + rng.normal(0.0, 0.3, t.size))
+
+        _gain, snr_clean = measure_record_with_snr(clean, None, 1_000.0, 1.0, compute_phase=False)
+        _gain, snr_noisy = measure_record_with_snr(noisy, None, 1_000.0, 1.0, compute_phase=False)
+        self.assertGreater(snr_clean, snr_noisy)
+
+        stats = PhasorWelford()
+        stats.add(1.0)
+        self.assertFalse(needs_more_acquisitions(stats, snr_clean, 0.01, 8))
+        self.assertTrue(needs_more_acquisitions(stats, snr_noisy, 0.01, 8))
+        self.assertFalse(needs_more_acquisitions(stats, snr_noisy, 0.01, 1))
+        self.assertLess(predicted_relative_uncertainty(snr_clean), 0.01)
+
+    def test_two_acquisitions_use_the_t_quantile(self) -> None:
+        stats = PhasorWelford()
+        stats.add(1.0)
+        stats.add(1.002)
+
+        self.assertAlmostEqual(stats.half_width(), 12.706 * 0.001, places=5)
+        self.assertTrue(needs_more_acquisitions(stats, 60.0, 0.005, 8))
+
+
+if __name__ == "__main__":
+    unittest.main()
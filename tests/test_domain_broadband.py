@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.domain.broadband import (
+    chirp_sample_rate_hz,
+    measure_chirp,
+    measure_noise,
+    noise_segment_length,
+    plan_chirp,
+    synthesize_chirp,
+)
+from app.domain.models import WaveformRecord
+
+
+def _first_order_lowpass(x: np.ndarray, fs: float, corner_hz: float) -> np.ndarray:
+    # Periodic steady-state response: filter two periods and keep the second.
+    alpha = 1.0 - np.exp(-2.0 * np.pi * corner_hz / fs)
+    y = np.zeros(2 * x.size)
+    state = 0.0
+    for i, value in enumerate(np.tile(x, 2)):
+        state += alpha * (value - state)
+        y[i] = state
+    return y[x.size :]
+
+
+class ChirpTests(unittest.TestCase):
+    def test_log_chirp_recovers_lowpass_response(self) -> None:
+        fs = 200_000.0
+        freqs = np.logspace(2, 4, 12)
+        plan = plan_chirp(freqs, fs, is_log=True, duration_s=0.25)
+        t = np.arange(int(round(plan.duration_s * fs))) / fs
+        ref = 0.5 * synthesize_chirp(t, plan)
+        test = _first_order_lowpass(ref, fs, 2_000.0)
+
+        alpha = 1.0 - np.exp(-2.0 * np.pi * 2_000.0 / fs)
+        z = np.exp(-2j * np.pi * freqs / fs)
+        expected = alpha / (1.0 - (1.0 - alpha) * z)
+
+        record_ref = WaveformRecord(codes=ref, scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs)
+        record_test = WaveformRecord(codes=test, scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs)
+        dual = measure_chirp(record_test, record_ref, freqs, plan, 0.5, compute_phase=True)
+        np.testing.assert_allclose([p[0] for p in dual], np.abs(expected), rtol=1e-3)
+        np.testing.assert_allclose([p[2] for p in dual], np.degrees(np.angle(expected)), atol=0.2)
+
+        shifted = WaveformRecord(codes=np.roll(test, 1234), scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs)
+        single = measure_chirp(shifted, None, freqs, plan, 0.5, compute_phase=False)
+        np.testing.assert_allclose([p[0] for p in single], np.abs(expected), rtol=1e-3)
+        self.assertIsNone(single[0][2])
+
+    def test_chirp_keeps_resolution_and_lowers_sample_rate(self) -> None:
+        freqs = np.logspace(1, 5, 20)
+        plan = plan_chirp(freqs, 2.5e9, is_log=True)
+
+        self.assertEqual(plan.duration_s, 1.0)
+        self.assertEqual(chirp_sample_rate_hz(plan.duration_s, 2.5e9), 1e7)
+
+        with self.assertRaisesRegex(ValueError, "cannot resolve"):
+            plan_chirp(freqs, 2.5e9, is_log=True, duration_s=0.1)
+        with self.assertRaisesRegex(ValueError, "too slow"):
+            plan_chirp(np.linspace(1e3, 5e6, 20), 2.5e9, is_log=False)
+
+    def test_welch_h1_recovers_response_and_coherence_from_noise(self) -> None:
+        fs = 100_000.0
+        rng = np.random.default_rng(7)
+        ref = 0.3 * rng.standard_normal(131_072)
+        test = _first_order_lowpass(ref, fs, 5_000.0)
+        freqs = np.linspace(500.0, 20_000.0, 40)
+
+        alpha = 1.0 - np.exp(-2.0 * np.pi * 5_000.0 / fs)
+        expected = alpha / (1.0 - (1.0 - alpha) * np.exp(-2j * np.pi * freqs / fs))
+
+        nperseg = noise_segment_length(freqs, fs, ref.size)
+        halves = [slice(0, ref.size // 2), slice(ref.size // 2, ref.size)]
+        records_test = [WaveformRecord(codes=test[h], scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs) for h in halves]
+        records_ref = [WaveformRecord(codes=ref[h], scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs) for h in halves]
+        points, coherence, segments = measure_noise(records_test, records_ref, freqs, nperseg)
+
+        self.assertGreaterEqual(segments, 8)
+        np.testing.assert_allclose([p[0] for p in points], np.abs(expected), rtol=0.02)
+        np.testing.assert_allclose([p[2] for p in points], np.degrees(np.angle(expected)), atol=1.0)
+        self.assertGreater(float(np.min(coherence)), 0.95)
+
+
+if __name__ == "__main__":
+    unittest.main()
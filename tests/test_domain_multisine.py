@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import math
+import sys
+from pathlib import Path
+import unittest
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from app.domain.models import WaveformRecord
+from app.domain.multisine import design_multisine, measure_multisine, multisine_capture, plan_multisine_blocks
+
+
+class MultisineTests(unittest.TestCase):
+    def test_blocks_cover_sweep_and_respect_tone_limit(self) -> None:
+        freqs = np.logspace(2, 6, 200)
+        blocks = plan_multisine_blocks(freqs, max_tones=32)
+
+        self.assertLessEqual(max(len(b) for b in blocks), 32)
+        np.testing.assert_array_equal(np.concatenate(blocks), freqs)
+
+    def test_design_lowers_crest_factor_and_recovers_tones(self) -> None:
+        freqs = np.arange(1_000.0, 33_000.0, 1_000.0)
+        design = design_multisine(freqs)
+
+        self.assertEqual(design.base_hz, 1_000.0)
+        self.assertLess(design.crest_factor, 2.0)
+        self.assertAlmostEqual(float(np.max(np.abs(design.samples))), 1.0)
+
+        fs = 1_000_000
+        t = np.arange(20_000) / fs
+        delay_s = 2e-6
+        ref = np.zeros(t.size)
+        for h, phase in zip(design.harmonics, design.phases_rad):
+            ref += design.tone_amplitude * np.sin(2.0 * np.pi * h * design.base_hz * t + phase)
+        test = np.interp(t - delay_s, t, 0.25 * ref)
+
+        record_ref = WaveformRecord(codes=ref, scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs)
+        record_test = WaveformRecord(codes=test, scale=1.0, offset=0.0, t0=0.0, dt=1.0 / fs)
+        points = measure_multisine(record_test, record_ref, design, 1.0, compute_phase=True)
+
+        self.assertEqual(len(points), freqs.size)
+        gain, _gain_db, phase_deg, _gain_complex = points[4]
+        self.assertAlmostEqual(gain, 0.25, delta=1e-3)
+        self.assertAlmostEqual(phase_deg, -math.degrees(2.0 * np.pi * 5_000.0 * delay_s), delta=0.5)
+
+    def test_capture_holds_whole_periods_at_a_lower_rate(self) -> None:
+        design = design_multisine([10.0, 20.0, 30.0])
+        window_s, sample_rate = multisine_capture(design, 2.5e9, 10_000)
+
+        self.assertGreaterEqual(window_s * design.base_hz, 2.0)
+        self.assertLessEqual(window_s * sample_rate, 10_000_000 * (1.0 + 1e-9))
+
+        wide = design_multisine([10.0, 20.0, 80_000.0])
+        with self.assertRaisesRegex(ValueError, "too slow"):
+            multisine_capture(wide, 2.5e9, 10_000, max_points=20_000)
+
+        short = WaveformRecord(codes=np.zeros(1_000), scale=1.0, offset=0.0, t0=0.0, dt=1e-6)
+        with self.assertRaisesRegex(ValueError, "shorter than one"):
+            measure_multisine(short, None, design, 1.0, compute_phase=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
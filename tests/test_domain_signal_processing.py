@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import math
 import sys
+import tracemalloc
 from pathlib import Path
 import unittest
 
@@ -9,7 +10,22 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
-from app.domain.signal_processing import measure_dual_channel, measure_single_channel
+from app.domain.enums import ToneEstimator
+from app.domain.models import WaveformRecord
+from app.domain.signal_processing import (
+    StreamingToneAccumulator,
+    WindowCache,
+    _complex_tone_at,
+    estimate_record_frequency,
+    measure_dual_channel,
+    measure_dual_record,
+    measure_dual_stream,
+    measure_multi_channel,
+    measure_single_channel,
+    measure_single_record,
+    measure_tones,
+    sine_fit,
+)
 
 
 class SignalProcessingTests(unittest.TestCase):
@@ -49,6 +65,268 @@ class SignalProcessingTests(unittest.TestCase):
         self.assertAlmostEqual(gain_db, 6.02, delta=0.8)
         self.assertAlmostEqual(phase_deg, 30.0, delta=5.0)
 
+    def test_multi_channel_matches_dual_channel(self) -> None:
+        fs = 200_000
+        f0 = 5_000
+        t = np.arange(0.0, 0.03, 1.0 / fs)
+
+        ref = np.sin(2.0 * np.pi * f0 * t)
+        tests = np.vstack(
+            [
+                2.0 * np.sin(2.0 * np.pi * f0 * t + math.radians(30.0)),
+                0.5 * np.sin(2.0 * np.pi * f0 * t - math.radians(45.0)),
+            ]
+        )
+
+        results = measure_multi_channel(t, tests, ref, f0)
+        self.assertEqual(len(results), 2)
+        for row, (gain, _gain_db, phase_deg, _gain_complex) in enumerate(results):
+            expected = measure_dual_channel(t, tests[row], t.copy(), ref, f0)
+            self.assertAlmostEqual(gain, expected[0], places=9)
+            self.assertAlmostEqual(phase_deg, expected[2], places=6)
+
+        self.assertAlmostEqual(results[1][0], 0.5, delta=0.03)
+        self.assertAlmostEqual(results[1][2], -45.0, delta=5.0)
+
+    def test_row_estimators_do_not_stack_channels(self) -> None:
+        n = 2_000_000
+        fs = 1e8
+        t = np.arange(n) / fs
+        ref = np.sin(2.0 * np.pi * 1e6 * t)
+        test = 0.5 * np.sin(2.0 * np.pi * 1e6 * t + 0.3)
+
+        for estimator in (ToneEstimator.SINGLE_BIN, ToneEstimator.COHERENT):
+            tracemalloc.start()
+            try:
+                gain, _gain_db, _phase, _complex = measure_multi_channel(t, test, ref, 1e6, estimator=estimator)[0]
+                _current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertAlmostEqual(gain, 0.5, places=6)
+            self.assertLess(peak, n * 8)
+
+    def test_measure_tones_returns_one_row_per_channel(self) -> None:
+        fs = 100_000
+        f0 = 1_000
+        t = np.arange(0.0, 0.02, 1.0 / fs)
+        volts = np.vstack([0.2 * np.sin(2.0 * np.pi * f0 * t), 0.8 * np.sin(2.0 * np.pi * f0 * t)])
+
+        amplitude, phase_deg, phasor = measure_tones(t, volts, f0)
+
+        self.assertEqual(amplitude.shape, (2,))
+        self.assertAlmostEqual(float(amplitude[0]), 0.2, delta=0.01)
+        self.assertAlmostEqual(float(amplitude[1]), 0.8, delta=0.04)
+        self.assertAlmostEqual(float(phase_deg[0]), float(phase_deg[1]), places=6)
+        np.testing.assert_allclose(np.abs(phasor), amplitude)
+
+    def test_single_bin_estimator_matches_fft(self) -> None:
+        fs = 250_000
+        f0 = 3_170
+        t = np.arange(0.0, 0.8, 1.0 / fs)
+
+        ref = 0.7 * np.sin(2.0 * np.pi * f0 * t) + 0.1
+        test = 1.3 * np.sin(2.0 * np.pi * f0 * t + math.radians(-60.0)) - 0.2
+
+        expected = measure_dual_channel(t, test, t, ref, f0, estimator=ToneEstimator.FFT)
+        actual = measure_dual_channel(t, test, t, ref, f0, estimator=ToneEstimator.SINGLE_BIN)
+
+        self.assertAlmostEqual(actual[0], expected[0], places=9)
+        self.assertAlmostEqual(actual[2], expected[2], places=6)
+
+        single = measure_single_channel(
+            t, test, f0, vin_peak=1.3, compute_phase=True, estimator=ToneEstimator.SINGLE_BIN
+        )
+        self.assertAlmostEqual(single[0], 1.0, delta=0.05)
+
+    def test_window_cache_counts_hits_and_evicts_oldest(self) -> None:
+        cache = WindowCache(max_bytes=3000 * 8)
+
+        first = cache.get(1000)
+        self.assertIs(cache.get(1000), first)
+        cache.get(2000)
+        cache.get(1000, kind="rect")
+
+        self.assertEqual(cache.stats(), {"hits": 1, "misses": 3, "entries": 2, "bytes": 3000 * 8})
+        self.assertAlmostEqual(first.energy, float(np.sum(np.hanning(1000) ** 2)))
+        self.assertFalse(first.window.flags.writeable)
+        self.assertIsNot(cache.get(1000), first)
+
+    def test_window_cache_skips_windows_larger_than_its_budget(self) -> None:
+        cache = WindowCache(max_bytes=1000 * 8)
+
+        cache.get(500)
+        big = cache.get(2000)
+
+        self.assertEqual(big.window.size, 2000)
+        self.assertEqual(cache.stats()["entries"], 1)
+        self.assertEqual(cache.stats()["bytes"], 500 * 8)
+
+    def test_uniform_phasor_matches_direct_evaluation(self) -> None:
+        fs = 1_000_000
+        f0 = 12_345.6
+        n = 150_001
+        t = -0.05 + np.arange(n) / fs
+        volts = 0.3 * np.cos(2.0 * np.pi * f0 * t + 0.4)
+        window = np.hanning(n)
+
+        direct = np.sum(window * volts * np.exp(-1j * 2.0 * np.pi * f0 * t))
+        fast = _complex_tone_at(t, volts, f0, window)
+        single = _complex_tone_at(t, volts, f0, window, dtype=np.complex64)
+
+        self.assertAlmostEqual(abs(fast - direct) / abs(direct), 0.0, places=7)
+        self.assertAlmostEqual(abs(single - direct) / abs(direct), 0.0, places=4)
+
+    def test_coherent_estimator_uses_integer_cycles(self) -> None:
+        fs = 1_000_000
+        f0 = 1_250.0
+        t = np.arange(0, 8_500) / fs
+        ref = 0.4 * np.sin(2.0 * np.pi * f0 * t)
+        test = 0.1 * np.sin(2.0 * np.pi * f0 * t + math.radians(75.0))
+
+        gain, _gain_db, phase_deg, _gain_complex = measure_dual_channel(
+            t, test, t, ref, f0, estimator=ToneEstimator.COHERENT
+        )
+
+        self.assertAlmostEqual(gain, 0.25, places=6)
+        self.assertAlmostEqual(phase_deg, 75.0, places=4)
+
+    def test_sine_fit_recovers_tone_from_two_cycles(self) -> None:
+        fs = 20_000
+        f_true = 10.04
+        t = np.arange(0.0, 0.2, 1.0 / fs) - 0.1
+        ref = 0.5 * np.cos(2.0 * np.pi * f_true * t + 0.3) + 0.05
+        test = 0.2 * np.cos(2.0 * np.pi * f_true * t + 0.3 + math.radians(40.0))
+
+        amplitude, _phase_deg, _phasor, freq_hz = sine_fit(t, np.vstack([test, ref]), 10.0)
+        np.testing.assert_allclose(amplitude, [0.2, 0.5], rtol=1e-6)
+        self.assertAlmostEqual(freq_hz, f_true, places=6)
+
+        gain, _gain_db, phase_deg, _gain_complex = measure_dual_channel(
+            t, test, t, ref, 10.0, estimator=ToneEstimator.SINE_FIT
+        )
+        self.assertAlmostEqual(gain, 0.4, places=6)
+        self.assertAlmostEqual(phase_deg, 40.0, places=4)
+
+    def test_record_frequency_is_found_outside_the_fit_basin(self) -> None:
+        fs = 100e6
+        t = np.arange(100_000) / fs
+        for f_true in (1.0e6, 1.001e6, 1.01e6):
+            record = WaveformRecord.from_arrays(t, np.sin(2.0 * np.pi * f_true * t + 0.3))
+            self.assertAlmostEqual(estimate_record_frequency(record) / f_true, 1.0, places=7)
+
+        with self.assertRaises(ValueError):
+            sine_fit(t, np.sin(2.0 * np.pi * 1.01e6 * t), 1.0e6, strict=True)
+
+    def test_zoom_estimator_matches_fft_on_long_record(self) -> None:
+        fs = 2_000_000
+        f0 = 2_345.0
+        t = np.arange(0.0, 0.4, 1.0 / fs) - 0.1
+        ref = 0.6 * np.sin(2.0 * np.pi * f0 * t) + 0.2
+        test = 0.3 * np.sin(2.0 * np.pi * f0 * t + math.radians(-120.0))
+
+        expected = measure_dual_channel(t, test, t, ref, f0)
+        actual = measure_dual_channel(t, test, t, ref, f0, estimator=ToneEstimator.ZOOM)
+
+        self.assertAlmostEqual(actual[0], expected[0], places=4)
+        self.assertAlmostEqual(actual[2], -120.0, delta=0.05)
+
+        amplitude, _phase_deg, _phasor = measure_tones(t, ref, f0, estimator=ToneEstimator.ZOOM)
+        self.assertAlmostEqual(float(amplitude[0]), 0.6, delta=0.01)
+
+    def test_zoom_estimator_falls_back_to_single_bin_without_decimation(self) -> None:
+        fs = 200_000
+        f0 = 21_370.0
+        t = np.arange(4000) / fs
+        ref = 0.6 * np.sin(2.0 * np.pi * f0 * t)
+        test = 0.3 * np.sin(2.0 * np.pi * f0 * t + math.radians(45.0))
+
+        expected = measure_dual_channel(t, test, t, ref, f0, estimator=ToneEstimator.SINGLE_BIN)
+        actual = measure_dual_channel(t, test, t, ref, f0, estimator=ToneEstimator.ZOOM)
+
+        self.assertEqual(actual, expected)
+        self.assertAlmostEqual(actual[2], 45.0, delta=0.05)
+
+    def test_streaming_accumulator_matches_batch_measurement(self) -> None:
+        fs = 200_000
+        f0 = 3_000.0
+        n = 10_000
+        t = np.arange(n) / fs + 0.002
+        ref = 0.5 * np.sin(2.0 * np.pi * f0 * t) + 0.1
+        test = 0.2 * np.sin(2.0 * np.pi * f0 * t + math.radians(40.0)) - 0.05
+
+        tones = []
+        for volts in (test, ref):
+            tone = StreamingToneAccumulator(f0, n, t0=float(t[0]), dt=1.0 / fs)
+            for start in range(0, n, 3_000):
+                tone.feed(volts[start:start + 3_000])
+            tones.append(tone)
+
+        self.assertEqual(tones[0].points_fed, n)
+        self.assertAlmostEqual(tones[1].vmax, 0.6, places=3)
+
+        expected = measure_dual_channel(t, test, t, ref, f0)
+        gain, _gain_db, phase_deg, _gain_complex = measure_dual_stream(tones[0], tones[1])
+        self.assertAlmostEqual(gain, expected[0], places=6)
+        self.assertAlmostEqual(phase_deg, 40.0, places=3)
+
+    def test_waveform_record_matches_float_arrays(self) -> None:
+        fs = 200_000
+        f0 = 2_500.0
+        n = 8_000
+        t = 1e-3 + np.arange(n) / fs
+        codes_ref = np.round(100.0 * np.sin(2.0 * np.pi * f0 * t)).astype(np.int8)
+        codes_test = np.round(50.0 * np.sin(2.0 * np.pi * f0 * t + math.radians(30.0))).astype(np.int8)
+        ref = WaveformRecord(codes=codes_ref, scale=0.01, offset=0.2, t0=1e-3, dt=1.0 / fs)
+        test = WaveformRecord(codes=codes_test, scale=0.01, offset=-0.1, t0=1e-3, dt=1.0 / fs)
+
+        self.assertEqual(test.nbytes, n)
+        np.testing.assert_allclose(ref.times, t)
+        self.assertEqual(ref.volts_as(np.float32).dtype, np.float32)
+        self.assertAlmostEqual(ref.bounds()[1], 1.2, places=9)
+
+        expected = measure_dual_channel(t, test.volts, t, ref.volts, f0)
+        actual = measure_dual_record(test, ref, f0)
+        np.testing.assert_allclose(actual[:3], expected[:3])
+
+    def test_coherent_estimator_replans_whole_cycles_from_record_dt(self) -> None:
+        fs = 1e6
+        f0 = fs / 7.37
+        t = np.arange(1000) / fs
+        volts = 0.7 * np.sin(2.0 * np.pi * f0 * t + 0.2)
+
+        gain, _gain_db, _phase, _complex = measure_single_channel(
+            t, volts, f0, vin_peak=0.7, compute_phase=False, estimator=ToneEstimator.COHERENT
+        )
+        self.assertAlmostEqual(gain, 1.0, places=9)
+
+    def test_uniform_estimators_read_records_as_codes(self) -> None:
+        class CodesOnlyRecord(WaveformRecord):
+            @property
+            def times(self) -> np.ndarray:
+                raise AssertionError("times materialised")
+
+            @property
+            def volts(self) -> np.ndarray:
+                raise AssertionError("volts materialised")
+
+        fs = 200_000
+        f0 = 2_500.0
+        n = 100_000
+        t = np.arange(n) / fs
+        codes_ref = np.round(100.0 * np.sin(2.0 * np.pi * f0 * t)).astype(np.int8)
+        codes_test = np.round(50.0 * np.sin(2.0 * np.pi * f0 * t + math.radians(30.0))).astype(np.int8)
+        volts_ref = codes_ref * 0.01 + 0.2
+        volts_test = codes_test * 0.01 - 0.1
+
+        for estimator in (ToneEstimator.SINGLE_BIN, ToneEstimator.COHERENT, ToneEstimator.ZOOM):
+            ref = CodesOnlyRecord(codes=codes_ref, scale=0.01, offset=0.2, t0=0.0, dt=1.0 / fs)
+            test = CodesOnlyRecord(codes=codes_test, scale=0.01, offset=-0.1, t0=0.0, dt=1.0 / fs)
+            expected = measure_dual_channel(t, volts_test, t, volts_ref, f0, estimator=estimator)
+            actual = measure_dual_record(test, ref, f0, estimator=estimator)
+            np.testing.assert_allclose(actual[:3], expected[:3], rtol=1e-9, atol=1e-9)
+            single = measure_single_record(test, f0, 1.0, compute_phase=True, estimator=estimator)
+            self.assertAlmostEqual(single[0], 0.5, places=2)
+
 
 if __name__ == "__main__":
     unittest.main()
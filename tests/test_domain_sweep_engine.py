@@ -8,8 +8,17 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
+from app.domain.enums import ToneEstimator
 from app.domain.models import SweepSpec
-from app.domain.sweep_engine import compute_sampling_window_s, generate_frequency_points
+from app.domain.sweep_engine import (
+    FrequencyPlan,
+    compute_sampling_window_s,
+    quantize_window_s,
+    generate_frequency_points,
+    min_cycles_for_estimator,
+    plan_coherent_acquisition,
+)
+from app.domain.timebase import TimebaseModel
 
 
 class SweepEngineTests(unittest.TestCase):
@@ -25,10 +34,77 @@ class SweepEngineTests(unittest.TestCase):
         self.assertAlmostEqual(points[0], 1.0)
         self.assertAlmostEqual(points[-1], 100.0)
 
+    def test_linear_plan_is_closed_form_and_lazy(self) -> None:
+        spec = SweepSpec(start_hz=1.0, stop_hz=1e6, step_hz=0.1, step_count=None, is_log=False)
+        plan = FrequencyPlan.from_spec(spec)
+
+        self.assertEqual(len(plan), 9_999_991)
+        self.assertEqual(plan[-1], 1e6)
+        self.assertAlmostEqual(plan[123_456], 1.0 + 0.1 * 123_456, places=9)
+        first = next(plan.chunks(1000))
+        np.testing.assert_allclose(first, 1.0 + 0.1 * np.arange(1000))
+
+    def test_points_per_decade_keeps_stop(self) -> None:
+        spec = SweepSpec(start_hz=10.0, stop_hz=5_000.0, step_hz=None, step_count=None, is_log=True, points_per_decade=10)
+        plan = FrequencyPlan.from_spec(spec)
+        points = plan.to_array()
+
+        np.testing.assert_allclose(points[:11], np.logspace(1, 2, 11))
+        self.assertEqual(points[-1], 5_000.0)
+        self.assertEqual(len(plan), 28)
+        np.testing.assert_array_equal(np.concatenate(list(plan.chunks(7))), points)
+
+    def test_window_rounds_up_to_scope_scale(self) -> None:
+        np.testing.assert_allclose(quantize_window_s(np.array([0.9e-3, 1e-3, 1.3e-3, 3e-3, 6e-3])), [1e-3, 1e-3, 2e-3, 5e-3, 1e-2])
+
     def test_sampling_window(self) -> None:
         window = compute_sampling_window_s(freq_hz=1e3, sample_rate_hz=1e6, points=10000)
         self.assertGreater(window, 0)
 
+    def test_sine_fit_shortens_low_frequency_window(self) -> None:
+        default = compute_sampling_window_s(freq_hz=10.0, sample_rate_hz=1e6, points=10000)
+        fitted = compute_sampling_window_s(
+            freq_hz=10.0,
+            sample_rate_hz=1e6,
+            points=10000,
+            min_cycles=min_cycles_for_estimator(ToneEstimator.SINE_FIT),
+        )
+        self.assertAlmostEqual(default, 1.0)
+        self.assertAlmostEqual(fitted, 0.2)
+
+    def test_coherent_plan_holds_integer_cycles(self) -> None:
+        plan = plan_coherent_acquisition(1_234.0, [1e6, 2.5e6], [100_000], min_cycles=10)
+
+        self.assertIsNotNone(plan)
+        assert plan is not None
+        self.assertGreaterEqual(plan.cycles, 10)
+        self.assertLessEqual(plan.points, 100_000)
+        self.assertLessEqual(plan.cycle_error, 1e-3)
+        self.assertAlmostEqual(plan.points * 1_234.0 / plan.sample_rate_hz, plan.cycles, delta=1e-3)
+        self.assertAlmostEqual(plan.window_s, plan.points / plan.sample_rate_hz)
+
+    def test_coherent_plan_requires_one_cycle(self) -> None:
+        self.assertIsNone(plan_coherent_acquisition(10.0, [1e6], [1_000]))
+
+    def test_model_coherent_plan_uses_a_reachable_timebase(self) -> None:
+        model = TimebaseModel(
+            max_sample_rate_hz=2.5e9,
+            memory_depths=(1_000, 10_000, 100_000, 1_000_000),
+            min_scale_s=1e-9,
+            max_scale_s=10.0,
+        )
+        planned = model.plan_coherent(1_234.0, 100_000, min_cycles=10)
+
+        self.assertIsNotNone(planned)
+        assert planned is not None
+        setting, plan = planned
+        self.assertIn(setting.scale_s, model.scales())
+        self.assertAlmostEqual(setting.window_s, quantize_window_s(setting.window_s))
+        self.assertEqual(plan.sample_rate_hz, setting.sample_rate_hz)
+        self.assertLessEqual(plan.points, min(100_000, setting.record_points))
+        self.assertLessEqual(plan.cycle_error, 1e-3)
+        self.assertGreaterEqual(plan.cycles, 10)
+
 
 if __name__ == "__main__":
     unittest.main()
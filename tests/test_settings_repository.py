@@ -8,6 +8,7 @@ import unittest
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from app.domain.enums import TriggerMode
+from app.domain.models import SweepSegment
 from app.infrastructure.persistence.settings_repo_json import JsonSettingsRepository
 
 
@@ -26,6 +27,19 @@ class SettingsRepositoryTests(unittest.TestCase):
             self.assertEqual(loaded.run_mode.trigger_mode, TriggerMode.TRIGGERED)
             self.assertEqual(loaded.setup.awg.visa_address, "USB::MOCK::INSTR")
 
+    def test_segments_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as td:
+            repo = JsonSettingsRepository(config_path=Path(td) / "settings.json")
+
+            settings = repo.load()
+            segment = SweepSegment(
+                start_hz=1e3, stop_hz=1e5, step_hz=None, step_count=20, is_log=True, record_points=2000, averages=4
+            )
+            settings.sweep.segments = [segment]
+            repo.save(settings)
+
+            self.assertEqual(repo.load().sweep.segments, [segment])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import sys
 from pathlib import Path
+import tempfile
 import threading
 import unittest
 
@@ -10,15 +11,28 @@ import numpy as np
 sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
 
 from app.application.dto import StartSweepCommand
-from app.application.events import SweepCompleted, SweepProgress, SweepStarted, SweepStopped
+from app.application.events import (
+    SweepCompleted,
+    SweepFailed,
+    SweepProgress,
+    SweepStarted,
+    SweepStopped,
+    SweepWarning,
+)
+from app.application.use_cases.checkpoint_sweep import CheckpointSweepUseCase
 from app.application.use_cases.start_sweep import StartSweepUseCase
+from app.domain.broadband import ChirpPlan, synthesize_chirp
 from app.domain.enums import (
     ConnectionMode,
     CorrectionMode,
     CouplingMode,
+    DspExecutor,
     ImpedanceMode,
     MagnitudePhaseMode,
+    SweepMode,
+    ToneEstimator,
     TriggerMode,
+    VerifyPolicy,
 )
 from app.domain.models import (
     AppSettings,
@@ -28,14 +42,26 @@ from app.domain.models import (
     InstrumentSetup,
     OscSettings,
     RunMode,
+    SweepSegment,
     SweepSpec,
+    WaveformRecord,
 )
+from app.domain.signal_processing import StreamingToneAccumulator
+from app.domain.sweep_engine import quantize_window_s
+from app.domain.timebase import TimebaseModel
+from app.infrastructure.persistence.checkpoint_repo_jsonl import JsonlCheckpointRepository
+from app.infrastructure.persistence.settings_repo_json import JsonSettingsRepository
 
 
 class MockAwg:
     def __init__(self) -> None:
         self.freq = 1_000.0
         self.amp = 1.0
+        self.arb: np.ndarray | None = None
+        self.chirp: ChirpPlan | None = None
+        self.noise_on = False
+        self.freq_queries = 0
+        self.freq_error = 0.0
 
     def reset(self) -> None:
         return None
@@ -48,10 +74,11 @@ class MockAwg:
 
     def set_frequency(self, hz: float, channel: int) -> None:
         _ = channel
-        self.freq = hz
+        self.freq = hz * (1.0 + self.freq_error)
 
     def get_frequency(self, channel: int) -> float:
         _ = channel
+        self.freq_queries += 1
         return self.freq
 
     def set_amplitude_vpp(self, vpp: float, channel: int) -> None:
@@ -62,6 +89,27 @@ class MockAwg:
         _ = channel
         return self.amp
 
+    def load_arbitrary(self, samples: np.ndarray, channel: int) -> None:
+        _ = channel
+        self.arb = np.asarray(samples, dtype=float)
+
+    def select_sine(self, channel: int) -> None:
+        _ = channel
+        self.arb = None
+        self.noise_on = False
+
+    def start_chirp(self, start_hz: float, stop_hz: float, duration_s: float, is_log: bool, channel: int) -> None:
+        _ = channel
+        self.chirp = ChirpPlan(start_hz=start_hz, stop_hz=stop_hz, duration_s=duration_s, is_log=is_log)
+
+    def stop_chirp(self, channel: int) -> None:
+        _ = channel
+        self.chirp = None
+
+    def start_noise(self, channel: int) -> None:
+        _ = channel
+        self.noise_on = True
+
     def close(self) -> None:
         return None
 
@@ -71,6 +119,21 @@ class MockOsc:
         self._awg = awg
         self._range = 1.0
         self._offset = 0.0
+        self.noise = 0.0
+        self.response = None
+        self.reads: list[int | None] = []
+        self.timebases: list[float] = []
+        self.record_lengths: list[int] = []
+        self.model: TimebaseModel | None = None
+        self.sample_rate_queries = 0
+        self.fail_at_read: int | None = None
+        self.acquired_freq = awg.freq
+        self.tone_reads = 0
+        self.snap_range = False
+        self.vertical_sets: list[float] = []
+        self._rng = np.random.default_rng(7)
+        self._stimulus_rng = np.random.default_rng(11)
+        self._captured_noise: np.ndarray | None = None
 
     def reset(self) -> None:
         return None
@@ -79,11 +142,16 @@ class MockOsc:
         _ = channel
 
     def set_timebase(self, window_s: float, offset_s: float | None = None) -> None:
-        _ = (window_s, offset_s)
+        _ = offset_s
+        self.timebases.append(window_s)
+
+    def set_record_length(self, points: int) -> None:
+        self.record_lengths.append(points)
 
     def set_vertical(self, channel: int, full_scale_v: float, offset_v: float) -> None:
         _ = channel
-        self._range = full_scale_v
+        self._range = quantize_window_s(full_scale_v, 1) if self.snap_range else full_scale_v
+        self.vertical_sets.append(full_scale_v)
         self._offset = offset_v
 
     def get_vertical(self, channel: int) -> tuple[float, float]:
@@ -104,18 +172,58 @@ class MockOsc:
 
     def single_acquire(self, triggered: bool) -> None:
         _ = triggered
+        # Like a real scope, the captured record keeps the frequency that was present at acquisition time.
+        self.acquired_freq = self._awg.freq
+        self._captured_noise = None
 
-    def read_waveform(self, channel: int, points: int | None) -> tuple[np.ndarray, np.ndarray]:
+    def read_waveform(self, channel: int, points: int | None) -> WaveformRecord:
         _ = channel
+        self.reads.append(points)
+        if self.fail_at_read is not None and len(self.reads) == self.fail_at_read:
+            raise RuntimeError("USB link lost")
         n = points or 5000
         sr = 200_000
-        t = np.arange(0.0, n / sr, 1.0 / sr)
-        volts = 0.5 * np.sin(2.0 * np.pi * self._awg.freq * t)
-        return t, volts
+        t = np.arange(n) / sr
+        if self._awg.noise_on:
+            # Every channel of one acquisition sees the same stretch of the noise stimulus.
+            if self._captured_noise is None or self._captured_noise.size != n:
+                self._captured_noise = self._stimulus_rng.normal(0.0, 0.3, n)
+            wave = self._captured_noise
+        elif self._awg.chirp is not None:
+            wave = synthesize_chirp(t + 0.01, self._awg.chirp)
+        elif self._awg.arb is None:
+            wave = np.sin(2.0 * np.pi * self.acquired_freq * t)
+            if self.response is not None:
+                wave *= self.response(self.acquired_freq)
+        else:
+            # Replay the arbitrary waveform as its band-limited harmonic series.
+            spectrum = np.fft.rfft(self._awg.arb) / (0.5 * self._awg.arb.size)
+            wave = np.zeros(n)
+            for k in np.flatnonzero(np.abs(spectrum) > 1e-9):
+                wave += np.abs(spectrum[k]) * np.cos(2.0 * np.pi * k * self.acquired_freq * t + np.angle(spectrum[k]))
+        if self.noise:
+            wave = wave + self._rng.normal(0.0, self.noise, n)
+        codes = np.round(np.clip(100.0 * wave, -127, 127)).astype(np.int8)
+        return WaveformRecord(codes=codes, scale=0.005, offset=0.0, t0=0.0, dt=1.0 / sr)
+
+    def read_tone(self, channel: int, points: int | None, target_hz: float) -> StreamingToneAccumulator:
+        self.tone_reads += 1
+        record = self.read_waveform(channel, points)
+        accumulator = StreamingToneAccumulator(target_hz, record.codes.size, t0=record.t0, dt=record.dt)
+        for start in range(0, record.codes.size, 1024):
+            accumulator.feed(record.codes[start : start + 1024] * record.scale + record.offset)
+        return accumulator
 
     def get_sample_rate(self) -> float:
+        self.sample_rate_queries += 1
         return 200_000.0
 
+    def sample_rate_cache_stats(self) -> dict[str, int]:
+        return {"hits": 0, "misses": self.sample_rate_queries, "invalidations": 0}
+
+    def timebase_model(self) -> TimebaseModel | None:
+        return self.model
+
     def close(self) -> None:
         return None
 
@@ -174,6 +282,492 @@ class StartSweepUseCaseTests(unittest.TestCase):
         progress_count = sum(1 for e in recorder.events if isinstance(e, SweepProgress))
         self.assertEqual(progress_count, 3)
 
+    def test_shared_timebase_is_configured_once(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=100.0, stop_hz=3000.0, step_hz=100.0, step_count=None, is_log=False)
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 30)
+        self.assertTrue(np.all(np.diff(result.freq_array()) > 0))
+        stats = result.meta["timebase_reconfigurations"]
+        self.assertEqual(stats["applied"], len(osc.timebases))
+        self.assertEqual(stats["applied"] + stats["skipped"], 30)
+        self.assertEqual(len(set(osc.timebases)), len(osc.timebases))
+        self.assertLess(stats["applied"], 5)
+
+    def test_timebase_model_replaces_sample_rate_queries(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=100.0, stop_hz=3000.0, step_hz=100.0, step_count=None, is_log=False)
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.model = TimebaseModel(
+            max_sample_rate_hz=200_000.0, memory_depths=(1_000, 10_000), min_scale_s=1e-6, max_scale_s=10.0
+        )
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 30)
+        self.assertEqual(osc.sample_rate_queries, 0)
+        self.assertEqual(result.meta["timebase_reconfigurations"]["sample_rate_queries"], 0)
+        for window in osc.timebases:
+            self.assertEqual(window, osc.model.predict(window, 4000).window_s)
+        self.assertEqual(osc.record_lengths, [10_000])
+
+    def test_coherent_plan_sends_the_window_it_assumed(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=5000.0, step_hz=1000.0, step_count=None, is_log=False)
+        settings.run_mode.estimator = ToneEstimator.COHERENT
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.model = TimebaseModel(
+            max_sample_rate_hz=200_000.0, memory_depths=(1_000, 10_000), min_scale_s=1e-6, max_scale_s=10.0
+        )
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 5)
+        plans = [osc.model.plan_coherent(f, 4000) for f in (1000.0, 2000.0, 3000.0, 4000.0, 5000.0)]
+        self.assertEqual(osc.reads, [plan.points for _setting, plan in plans])
+        windows = [setting.window_s for setting, _plan in plans]
+        self.assertEqual(osc.timebases, [w for i, w in enumerate(windows) if i == 0 or w != windows[i - 1]])
+        for window in osc.timebases:
+            self.assertEqual(window, quantize_window_s(window))
+
+    def test_failed_sweep_resumes_from_checkpoint(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=6000.0, step_hz=1000.0, step_count=None, is_log=False)
+
+        with tempfile.TemporaryDirectory() as td:
+            checkpoints = CheckpointSweepUseCase(
+                JsonlCheckpointRepository(
+                    directory=Path(td),
+                    settings_codec=JsonSettingsRepository(config_path=Path(td) / "settings.json"),
+                )
+            )
+            awg = MockAwg()
+            osc = MockOsc(awg)
+            osc.fail_at_read = 4
+            cmd = checkpoints.start(settings)
+            recorder = Recorder()
+            failed = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(cmd, recorder)
+
+            self.assertTrue(failed.is_empty)
+            failure = next(e for e in recorder.events if isinstance(e, SweepFailed))
+            self.assertIn(str(cmd.checkpoint.path), failure.message)
+
+            resumed_cmd = checkpoints.resume(str(cmd.checkpoint.path))
+            self.assertEqual([p.freq_hz for p in resumed_cmd.resume_points], [1000.0, 2000.0, 3000.0])
+
+            awg = MockAwg()
+            osc = MockOsc(awg)
+            result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(resumed_cmd, Recorder())
+
+            self.assertEqual(len(osc.reads), 3)
+            np.testing.assert_allclose(result.freq_array(), [1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 6000.0])
+            self.assertEqual(result.meta["resumed_points"], 3)
+
+    def test_pipelined_retune_overlaps_waveform_transfer(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=8000.0, step_hz=1000.0, step_count=None, is_log=False)
+        awg = MockAwg()
+        expected = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        settings.run_mode.pipelined = True
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        self.assertEqual(result.meta["awg_prefetch"], {"hits": 7, "misses": 0})
+        np.testing.assert_allclose(result.freq_array(), expected.freq_array())
+        np.testing.assert_allclose(result.gain_array(), expected.gain_array())
+
+    def test_verify_policy_skips_readbacks_between_checks(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=8000.0, step_hz=1000.0, step_count=None, is_log=False)
+        settings.run_mode.verify_policy = VerifyPolicy.EVERY_N
+        settings.run_mode.verify_every = 3
+        awg = MockAwg()
+        result = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        self.assertEqual(awg.freq_queries, 3)
+        self.assertEqual(result.meta["awg_readbacks"], {"verified": 3, "skipped": 5})
+        self.assertEqual(len(result.points), 8)
+
+    def test_tone_policy_detects_detuned_awg_from_record(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=8000.0, step_hz=1000.0, step_count=None, is_log=False)
+        settings.run_mode.verify_policy = VerifyPolicy.TONE
+        awg = MockAwg()
+        awg.freq_error = 0.01
+        recorder = Recorder()
+        result = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), recorder
+        )
+
+        warnings = [e for e in recorder.events if isinstance(e, SweepWarning) and e.code == "FREQ_MISMATCH"]
+        self.assertEqual(awg.freq_queries, 1)
+        self.assertEqual(len(warnings), 8)
+        self.assertEqual(sum("measured tone" in w.message for w in warnings), 7)
+        self.assertEqual(result.meta["awg_readbacks"], {"verified": 1, "skipped": 7})
+
+    def test_tone_policy_is_quiet_when_awg_is_on_frequency(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=8000.0, step_hz=1000.0, step_count=None, is_log=False)
+        settings.run_mode.verify_policy = VerifyPolicy.TONE
+        awg = MockAwg()
+        recorder = Recorder()
+        StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), recorder
+        )
+
+        codes = {e.code for e in recorder.events if isinstance(e, SweepWarning)}
+        self.assertFalse(codes & {"FREQ_MISMATCH", "TONE_CHECK_FAILED"})
+
+    def test_first_policy_verifies_once_per_segment(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.verify_policy = VerifyPolicy.FIRST
+        settings.sweep.segments = [
+            SweepSegment(start_hz=1000.0, stop_hz=3000.0, step_hz=1000.0, step_count=None, is_log=False),
+            SweepSegment(start_hz=4000.0, stop_hz=6000.0, step_hz=1000.0, step_count=None, is_log=False),
+        ]
+        awg = MockAwg()
+        result = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        self.assertEqual(awg.freq_queries, 2)
+        self.assertEqual(result.meta["awg_readbacks"], {"verified": 2, "skipped": 4})
+
+    def test_auto_range_presets_vertical_on_filter_skirt(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=20000.0, step_hz=None, step_count=25, is_log=True)
+        settings.run_mode.auto_range = True
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.response = lambda f: 1.0 / (1.0 + (f / 2000.0) ** 2)
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        stats = result.meta["auto_range"]
+        self.assertEqual(stats["points"], 25)
+        self.assertGreater(stats["presets"], 0)
+        self.assertLessEqual(stats["reacquisition_rate"], 0.2)
+
+    def test_auto_range_follows_the_range_the_scope_snapped_to(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=20000.0, step_hz=None, step_count=25, is_log=True)
+        settings.run_mode.auto_range = True
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.snap_range = True
+        osc.response = lambda f: 1.0 / (1.0 + (f / 2000.0) ** 2)
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        stats = result.meta["auto_range"]
+        self.assertEqual(len(result.points), 25)
+        self.assertLessEqual(stats["reacquisition_rate"], 0.2)
+        self.assertEqual(osc.get_vertical(1)[0], quantize_window_s(osc.get_vertical(1)[0], 1))
+
+    def test_thread_pool_results_are_emitted_in_frequency_order(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=8000.0, step_hz=1000.0, step_count=None, is_log=False)
+
+        awg = MockAwg()
+        inline = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+        expected = inline.run(StartSweepCommand(settings=settings), Recorder())
+
+        settings.run_mode.dsp_executor = DspExecutor.THREAD
+        settings.run_mode.max_in_flight = 3
+        awg = MockAwg()
+        use_case = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+        recorder = Recorder()
+        result = use_case.run(StartSweepCommand(settings=settings), recorder)
+
+        indices = [e.point_index for e in recorder.events if isinstance(e, SweepProgress)]
+        self.assertEqual(indices, list(range(1, 9)))
+        self.assertEqual([p.freq_hz for p in result.points], [p.freq_hz for p in expected.points])
+        np.testing.assert_allclose(
+            [p.gain_linear for p in result.points], [p.gain_linear for p in expected.points]
+        )
+        self.assertLessEqual(result.meta["dsp_peak_in_flight"], 3)
+
+    def test_adaptive_averaging_spends_acquisitions_on_noisy_points(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.adaptive_averaging = True
+        settings.run_mode.target_uncertainty = 0.01
+        settings.run_mode.max_averages = 6
+
+        awg = MockAwg()
+        clean = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+        quiet = clean.run(StartSweepCommand(settings=settings), Recorder())
+        self.assertEqual([p.acquisitions for p in quiet.points], [1, 1, 1])
+        self.assertTrue(all(p.gain_ci is None for p in quiet.points))
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.noise = 0.3
+        noisy = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        result = noisy.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertTrue(all(p.acquisitions > 1 for p in result.points))
+        self.assertEqual(result.meta["acquisitions_total"], sum(p.acquisitions for p in result.points))
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.05)
+
+    def test_adaptive_mode_refines_around_resonance(self) -> None:
+        settings = self._build_settings()
+        settings.sweep = SweepSpec(start_hz=1000.0, stop_hz=10000.0, step_hz=1000.0, step_count=None, is_log=False)
+        settings.run_mode.sweep_mode = SweepMode.ADAPTIVE
+        settings.run_mode.refine_tolerance_db = 1.0
+        settings.run_mode.refine_budget = 30
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.response = lambda f: 0.2 + 0.8 / (1.0 + ((f - 4600.0) / 300.0) ** 2)
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        freqs = result.freq_array()
+        self.assertLessEqual(len(freqs), 30)
+        self.assertGreater(len(freqs), 10)
+        self.assertTrue(np.all(np.diff(freqs) > 0))
+        refined = np.setdiff1d(freqs, np.arange(1000.0, 10001.0, 1000.0))
+        self.assertTrue(np.all((refined > 3000.0) & (refined < 7000.0)))
+        self.assertGreater(result.meta["refine_passes"], 1)
+
+    def test_segments_run_in_one_sweep_with_their_own_settings(self) -> None:
+        settings = self._build_settings()
+        settings.sweep.segments = [
+            SweepSegment(start_hz=1000.0, stop_hz=3000.0, step_hz=1000.0, step_count=None, is_log=False),
+            SweepSegment(
+                start_hz=3000.0,
+                stop_hz=6000.0,
+                step_hz=1000.0,
+                step_count=None,
+                is_log=False,
+                record_points=2000,
+                full_scale_v=0.5,
+                averages=2,
+            ),
+        ]
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+        recorder = Recorder()
+        result = use_case.run(StartSweepCommand(settings=settings), recorder)
+
+        started = [e for e in recorder.events if isinstance(e, SweepStarted)]
+        self.assertEqual(started[0].total_points, 6)
+        np.testing.assert_allclose(result.freq_array(), [1000.0, 2000.0, 3000.0, 4000.0, 5000.0, 6000.0])
+        self.assertEqual([p.acquisitions for p in result.points], [1, 1, 1, 2, 2, 2])
+        self.assertEqual(osc.reads, [4000] * 3 + [2000] * 6)
+        self.assertEqual(osc.get_vertical(1), (0.5, 0.0))
+        self.assertEqual(result.meta["segments"], 2)
+
+    def test_segment_without_range_returns_to_the_default_range(self) -> None:
+        settings = self._build_settings()
+        settings.sweep.segments = [
+            SweepSegment(start_hz=1000.0, stop_hz=2000.0, step_hz=1000.0, step_count=None, is_log=False),
+            SweepSegment(
+                start_hz=3000.0, stop_hz=4000.0, step_hz=1000.0, step_count=None, is_log=False, full_scale_v=0.5
+            ),
+            SweepSegment(start_hz=5000.0, stop_hz=6000.0, step_hz=1000.0, step_count=None, is_log=False),
+        ]
+
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        self.assertEqual(osc.vertical_sets, [1.0, 1.0, 0.5, 1.0])
+        self.assertEqual(osc.get_vertical(1), (1.0, 0.0))
+
+    def test_descending_or_overlapping_segments_are_rejected(self) -> None:
+        settings = self._build_settings()
+        for segments in (
+            [(4000.0, 6000.0), (1000.0, 3000.0)],
+            [(1000.0, 4000.0), (3000.0, 6000.0)],
+        ):
+            settings.sweep.segments = [
+                SweepSegment(start_hz=lo, stop_hz=hi, step_hz=1000.0, step_count=None, is_log=False)
+                for lo, hi in segments
+            ]
+            awg = MockAwg()
+            recorder = Recorder()
+            StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event()).run(
+                StartSweepCommand(settings=settings), recorder
+            )
+
+            failed = [e for e in recorder.events if isinstance(e, SweepFailed)]
+            self.assertEqual(failed[0].error_code, "VALIDATION")
+            self.assertIn("Segment 2", failed[0].message)
+
+    def test_multisine_mode_measures_block_in_one_acquisition(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.MULTISINE
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        use_case = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event())
+
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(result.meta["multisine_blocks"], 1)
+        self.assertEqual([p.freq_hz for p in result.points], [1000.0, 2000.0, 3000.0])
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+        self.assertIsNone(awg.arb)
+
+    def test_multisine_phase_needs_reference_or_sync_trigger(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.MULTISINE
+        settings.run_mode.trigger_mode = TriggerMode.TRIGGERED
+        settings.setup.channels.osc_trig_ch = settings.setup.channels.osc_test_ch
+        awg = MockAwg()
+        use_case = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 3)
+        for point in result.points:
+            self.assertIsNone(point.phase_deg)
+
+    def test_multisine_sync_triggered_single_channel_phase_is_zero_for_pass_through(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.MULTISINE
+        settings.run_mode.trigger_mode = TriggerMode.TRIGGERED
+        settings.setup.channels.osc_trig_ch = 3
+        awg = MockAwg()
+        use_case = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 3)
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+            self.assertIsNotNone(point.phase_deg)
+            self.assertAlmostEqual(point.phase_deg, 0.0, delta=1.0)
+
+    def test_chirp_mode_builds_curve_from_single_capture(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.CHIRP
+        awg = MockAwg()
+        use_case = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+        recorder = Recorder()
+
+        result = use_case.run(StartSweepCommand(settings=settings), recorder)
+
+        self.assertEqual(result.meta["chirp"]["start_hz"], 1000.0)
+        self.assertEqual([p.freq_hz for p in result.points], [1000.0, 2000.0, 3000.0])
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+            self.assertIsNone(point.phase_deg)
+        self.assertIsNone(awg.chirp)
+        self.assertEqual(sum(1 for e in recorder.events if isinstance(e, SweepProgress)), 3)
+
+    def test_chirp_phase_needs_a_sync_trigger_channel(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.CHIRP
+        settings.run_mode.trigger_mode = TriggerMode.TRIGGERED
+        settings.setup.channels.osc_trig_ch = settings.setup.channels.osc_test_ch
+        awg = MockAwg()
+        use_case = StartSweepUseCase(awg=awg, osc=MockOsc(awg), stop_event=threading.Event())
+
+        result = use_case.run(StartSweepCommand(settings=settings), Recorder())
+
+        self.assertEqual(len(result.points), 3)
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+            self.assertIsNone(point.phase_deg)
+
+    def test_streaming_mode_measures_tones_block_by_block(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.streaming = True
+        settings.run_mode.trigger_mode = TriggerMode.TRIGGERED
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        recorder = Recorder()
+
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), recorder
+        )
+        plain_awg = MockAwg()
+        expected = StartSweepUseCase(awg=plain_awg, osc=MockOsc(plain_awg), stop_event=threading.Event()).run(
+            StartSweepCommand(settings=self._build_settings()), Recorder()
+        )
+
+        self.assertEqual(osc.tone_reads, 3)
+        self.assertEqual([p.freq_hz for p in result.points], [1000.0, 2000.0, 3000.0])
+        np.testing.assert_allclose(
+            [p.gain_linear for p in result.points], [p.gain_linear for p in expected.points], rtol=1e-3
+        )
+        for point in result.points:
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+        self.assertEqual(sum(1 for e in recorder.events if isinstance(e, SweepProgress)), 3)
+        self.assertTrue(any(isinstance(e, SweepCompleted) for e in recorder.events))
+
+    def test_noise_mode_estimates_response_from_broadband_stimulus(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.NOISE
+        settings.run_mode.correction_mode = CorrectionMode.DUAL
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        recorder = Recorder()
+
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), recorder
+        )
+
+        self.assertFalse(awg.noise_on)
+        self.assertEqual(len(osc.reads), 4)
+        self.assertEqual(len(osc.timebases), 1)
+        self.assertEqual(osc.timebases[0], quantize_window_s(osc.timebases[0]))
+        self.assertEqual(result.meta["timebase_reconfigurations"]["sample_rate_queries"], 1)
+        self.assertEqual(result.meta["noise"]["acquisitions"], 2)
+        self.assertGreater(result.meta["noise"]["segments"], 2)
+        self.assertEqual([p.freq_hz for p in result.points], [1000.0, 2000.0, 3000.0])
+        for point, coherence in zip(result.points, result.meta["coherence"]):
+            self.assertAlmostEqual(point.gain_linear, 1.0, delta=0.02)
+            self.assertGreater(coherence, 0.99)
+        self.assertEqual(sum(1 for e in recorder.events if isinstance(e, SweepProgress)), 3)
+        self.assertTrue(any(isinstance(e, SweepCompleted) for e in recorder.events))
+
+    def test_noise_mode_uses_timebase_model(self) -> None:
+        settings = self._build_settings()
+        settings.run_mode.sweep_mode = SweepMode.NOISE
+        settings.run_mode.correction_mode = CorrectionMode.DUAL
+        awg = MockAwg()
+        osc = MockOsc(awg)
+        osc.model = TimebaseModel(
+            max_sample_rate_hz=200_000.0, memory_depths=(1_000, 10_000), min_scale_s=1e-6, max_scale_s=10.0
+        )
+
+        result = StartSweepUseCase(awg=awg, osc=osc, stop_event=threading.Event()).run(
+            StartSweepCommand(settings=settings), Recorder()
+        )
+
+        self.assertEqual(osc.sample_rate_queries, 0)
+        self.assertEqual(len(osc.timebases), 1)
+        self.assertEqual(osc.timebases[0], osc.model.predict(osc.timebases[0], 4000).window_s)
+        self.assertEqual(osc.record_lengths, [10_000])
+        self.assertEqual(len(result.points), 3)
+
     def test_run_can_be_stopped(self) -> None:
         awg = MockAwg()
         osc = MockOsc(awg)